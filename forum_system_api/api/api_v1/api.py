@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from .routes.admin_router import admin_router
 from .routes.auth_router import auth_router
 from .routes.category_router import category_router
 from .routes.conversation_router import conversation_router
@@ -20,3 +21,4 @@ api_router.include_router(conversation_router)
 api_router.include_router(message_router)
 api_router.include_router(category_router)
 api_router.include_router(websocket_router)
+api_router.include_router(admin_router)
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends
+
+from forum_system_api.persistence.database import engines
+from forum_system_api.schemas.pool import PoolStatusResponse
+from forum_system_api.schemas.websocket import (
+    AnnouncementCreate,
+    AnnouncementEvent,
+    WebSocketStatusResponse,
+)
+from forum_system_api.services import pool_service
+from forum_system_api.services.auth_service import require_admin_role
+from forum_system_api.services.websocket_manager import websocket_manager
+
+admin_router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@admin_router.get(
+    "/database/pool",
+    response_model=list[PoolStatusResponse],
+    description="Get the usage of every database connection pool",
+    dependencies=[Depends(require_admin_role)],
+)
+def get_pool_status() -> list[PoolStatusResponse]:
+    return pool_service.get_pool_statuses(engines=engines)
+
+
+@admin_router.get(
+    "/websockets",
+    response_model=WebSocketStatusResponse,
+    description="Get the WebSocket connections and outbound queue depths of this worker",
+    dependencies=[Depends(require_admin_role)],
+)
+def get_websocket_status() -> WebSocketStatusResponse:
+    return WebSocketStatusResponse.model_validate(
+        websocket_manager.get_stats(), from_attributes=True
+    )
+
+
+@admin_router.post(
+    "/announcements",
+    response_model=AnnouncementEvent,
+    status_code=202,
+    description="Send an announcement to every user connected over WebSocket",
+    dependencies=[Depends(require_admin_role)],
+)
+async def create_announcement(announcement: AnnouncementCreate) -> AnnouncementEvent:
+    event = AnnouncementEvent(
+        content=announcement.content, created_at=datetime.now(timezone.utc)
+    )
+    await websocket_manager.broadcast(message=event)
+    return event
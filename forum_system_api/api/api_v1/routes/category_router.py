@@ -3,9 +3,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy.orm import Session
 
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.category import CategoryResponse, CreateCategory
+from forum_system_api.schemas.common import FilterParams
 from forum_system_api.schemas.topic import TopicResponse
 from forum_system_api.services import category_service, topic_service
 from forum_system_api.services.auth_service import get_current_user, require_admin_role
@@ -30,8 +31,10 @@ def create_category(
 @category_router.get(
     "/", response_model=list[CategoryResponse], description="Get all categories"
 )
-def get_categories(db: Session = Depends(get_db)) -> list[CategoryResponse]:
-    return category_service.get_all(db)
+def get_categories(
+    filter_params: FilterParams = Depends(), db: Session = Depends(get_read_db)
+) -> list[CategoryResponse]:
+    return category_service.get_all(filter_params=filter_params, db=db)
 
 
 @category_router.get(
@@ -42,15 +45,14 @@ def get_categories(db: Session = Depends(get_db)) -> list[CategoryResponse]:
 def view_category(
     category_id: UUID = Path(..., description="The unique identifier of the category"),
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[TopicResponse]:
     topics = topic_service.get_topics_for_category(category_id, user, db)
+    replies = topic_service.get_replies_for_topics(
+        topic_ids=[topic.id for topic in topics], db=db
+    )
     return [
-        TopicResponse.create(
-            topic=topic,
-            replies=topic_service.get_replies(topic_id=topic.id, db=db),
-        )
-        for topic in topics
+        TopicResponse.create(topic=topic, replies=replies[topic.id]) for topic in topics
     ]
 
 
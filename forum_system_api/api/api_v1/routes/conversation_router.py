@@ -1,16 +1,26 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Response
+from sqlalchemy.orm import Session
 
+from forum_system_api.api.api_v1.routes.topic_router import NEXT_CURSOR_HEADER
+from forum_system_api.persistence.database import get_read_db
 from forum_system_api.persistence.models.user import User
+from forum_system_api.schemas.common import InboxFilterParams, MessageFilterParams
+from forum_system_api.schemas.conversation import InboxConversationResponse
 from forum_system_api.schemas.message import MessageResponse
 from forum_system_api.schemas.user import UserResponse
 from forum_system_api.services.auth_service import get_current_user
 from forum_system_api.services.conversation_service import (
+    get_inbox,
     get_messages_with_receiver,
+    get_next_message_cursor,
+    get_sync_cursor,
     get_users_from_conversations,
 )
 
+SYNC_CURSOR_HEADER = "X-Sync-Cursor"
+
 conversation_router = APIRouter(prefix="/conversations", tags=["conversations"])
 
 
@@ -21,23 +31,66 @@ conversation_router = APIRouter(prefix="/conversations", tags=["conversations"])
 )
 def get_users_with_conversations_route(
     user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ) -> list[UserResponse]:
-    users = get_users_from_conversations(user)
+    users = get_users_from_conversations(user=user, db=db)
     return [UserResponse.model_validate(user, from_attributes=True) for user in users]
 
 
+@conversation_router.get(
+    "/inbox",
+    response_model=list[InboxConversationResponse],
+    description="Get the conversations of the current user with their last message "
+    "and unread count, most recently active first",
+)
+def get_inbox_route(
+    filter_query: InboxFilterParams = Depends(),
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+) -> list[InboxConversationResponse]:
+    return [
+        InboxConversationResponse.model_validate(entry, from_attributes=True)
+        for entry in get_inbox(user=user, filter_params=filter_query, db=db)
+    ]
+
+
 @conversation_router.get(
     "/{receiver_id}",
     response_model=list[MessageResponse],
-    description="Get all messages between the current user and the specified user",
+    description="Get a page of the messages between the current user and the specified user. "
+    "The cursor for the next page is returned in the X-Next-Cursor header. "
+    "The first page and pages requested with `since` return the cursor to pass as "
+    "`since` next time in the X-Sync-Cursor header. With `since`, only newer "
+    "messages are returned, oldest first",
 )
 def get_messages_with_receiver_route(
+    response: Response,
     receiver_id: UUID = Path(
         ..., description="The ID of the user to get messages with"
     ),
+    filter_query: MessageFilterParams = Depends(),
     user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ) -> list[MessageResponse]:
+    messages = get_messages_with_receiver(
+        user=user, receiver_id=receiver_id, filter_params=filter_query, db=db
+    )
+    _set_header(
+        response=response,
+        name=NEXT_CURSOR_HEADER,
+        value=get_next_message_cursor(messages=messages, filter_params=filter_query),
+    )
+    _set_header(
+        response=response,
+        name=SYNC_CURSOR_HEADER,
+        value=get_sync_cursor(messages=messages, filter_params=filter_query),
+    )
     return [
         MessageResponse.model_validate(message, from_attributes=True)
-        for message in get_messages_with_receiver(user, receiver_id)
+        for message in messages
     ]
+
+
+def _set_header(response: Response, name: str, value: str | None) -> None:
+    if value is not None:
+        response.headers[name] = value
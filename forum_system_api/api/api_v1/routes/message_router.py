@@ -1,16 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db_session
+from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.message import (
     MessageCreate,
     MessageCreateByUsername,
     MessageResponse,
+    ReadReceiptEvent,
+    ReadReceiptResponse,
 )
 from forum_system_api.services import user_service
-from forum_system_api.services.auth_service import get_current_user
-from forum_system_api.services.message_service import send_message
+from forum_system_api.services.auth_service import get_current_user_dependency
+from forum_system_api.services.message_service import (
+    ReadReceipt,
+    mark_as_read,
+    mark_as_read_async,
+    send_message,
+    send_message_async,
+)
 from forum_system_api.services.websocket_manager import websocket_manager
 
 message_router = APIRouter(prefix="/messages", tags=["messages"])
@@ -21,10 +34,10 @@ message_router = APIRouter(prefix="/messages", tags=["messages"])
 )
 async def create_message(
     message_data: MessageCreate,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_dependency()),
+    db: Session | AsyncSession = Depends(get_db_session()),
 ) -> MessageResponse:
-    message = send_message(db=db, message_data=message_data, user=user)
+    message = await _send_message(db=db, message_data=message_data, user=user)
     await websocket_manager.send_message_as_json(
         message=MessageResponse.model_validate(message),
         receiver_id=message_data.receiver_id,
@@ -41,12 +54,19 @@ async def create_message(
 )
 async def create_message_by_username(
     message_data: MessageCreateByUsername,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_dependency()),
+    db: Session | AsyncSession = Depends(get_db_session()),
 ) -> MessageResponse:
-    receiver = user_service.get_by_username(
-        username=message_data.receiver_username, db=db
-    )
+    if isinstance(db, AsyncSession):
+        receiver = await user_service.get_by_username_async(
+            username=message_data.receiver_username, db=db
+        )
+    else:
+        receiver = await run_in_threadpool(
+            user_service.get_by_username,
+            username=message_data.receiver_username,
+            db=db,
+        )
     if not receiver:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Recipient not found"
@@ -56,9 +76,48 @@ async def create_message_by_username(
         receiver_id=receiver.id, content=message_data.content
     )
 
-    message = send_message(db=db, message_data=message_create, user=user)
+    message = await _send_message(db=db, message_data=message_create, user=user)
     await websocket_manager.send_message_as_json(
         message=MessageResponse.model_validate(message), receiver_id=receiver.id
     )
 
     return MessageResponse.model_validate(message, from_attributes=True)
+
+
+@message_router.put(
+    "/{message_id}/read",
+    response_model=ReadReceiptResponse,
+    description="Mark a message and everything before it in its conversation as read",
+)
+async def mark_message_as_read(
+    message_id: UUID = Path(..., description="The ID of the newest read message"),
+    user: User = Depends(get_current_user_dependency()),
+    db: Session | AsyncSession = Depends(get_db_session()),
+) -> ReadReceiptResponse:
+    if isinstance(db, AsyncSession):
+        read_receipt = await mark_as_read_async(db=db, message_id=message_id, user=user)
+    else:
+        read_receipt = await run_in_threadpool(
+            mark_as_read, db=db, message_id=message_id, user=user
+        )
+    await _send_read_receipt(read_receipt)
+
+    return ReadReceiptResponse.model_validate(read_receipt, from_attributes=True)
+
+
+async def _send_read_receipt(read_receipt: ReadReceipt) -> None:
+    await websocket_manager.send_message_as_json(
+        message=ReadReceiptEvent.model_validate(read_receipt, from_attributes=True),
+        receiver_id=read_receipt.receiver_id,
+    )
+
+
+async def _send_message(
+    db: Session | AsyncSession, message_data: MessageCreate, user: User
+) -> Message:
+    if isinstance(db, AsyncSession):
+        return await send_message_async(db=db, message_data=message_data, user=user)
+
+    return await run_in_threadpool(
+        send_message, db=db, message_data=message_data, user=user
+    )
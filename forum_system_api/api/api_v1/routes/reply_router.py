@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.database import get_db
@@ -11,8 +12,9 @@ from forum_system_api.schemas.reply import (
     ReplyResponse,
     ReplyUpdate,
 )
-from forum_system_api.services import reply_service
-from forum_system_api.services.auth_service import get_current_user
+from forum_system_api.schemas.topic import ReplyCreatedEvent, ReplyVotedEvent
+from forum_system_api.services import reply_service, topic_event_service
+from forum_system_api.services.auth_service import get_current_user, require_admin_role
 
 reply_router = APIRouter(prefix="/replies", tags=["replies"])
 
@@ -29,8 +31,7 @@ def get_by_id(
     db: Session = Depends(get_db),
 ) -> ReplyResponse:
     reply = reply_service.get_by_id(user=user, reply_id=reply_id, db=db)
-    votes = reply_service.get_votes(reply=reply)
-    return ReplyResponse.create(reply=reply, votes=votes)
+    return ReplyResponse.create(reply=reply)
 
 
 @reply_router.post(
@@ -39,17 +40,17 @@ def get_by_id(
     status_code=201,
     description="Create a new reply for a topic",
 )
-def create(
+async def create(
     topic_id: UUID,
     reply_create: ReplyCreate,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> ReplyResponse:
-    reply = reply_service.create(
-        topic_id=topic_id, reply=reply_create, user=user, db=db
+    response, event = await run_in_threadpool(
+        _create, topic_id=topic_id, reply_create=reply_create, user=user, db=db
     )
-    votes = (0, 0)
-    return ReplyResponse.create(reply=reply, votes=votes)
+    await topic_event_service.publish(event=event)
+    return response
 
 
 @reply_router.put(
@@ -67,8 +68,7 @@ def update(
     reply = reply_service.update(
         user=user, reply_id=reply_id, updated_reply=updated_reply, db=db
     )
-    votes = reply_service.get_votes(reply=reply)
-    return ReplyResponse.create(reply=reply, votes=votes)
+    return ReplyResponse.create(reply=reply)
 
 
 @reply_router.patch(
@@ -77,12 +77,47 @@ def update(
     status_code=200,
     description="Upvote or Downvote a reply",
 )
-def create_reaction(
+async def create_reaction(
     reply_id: UUID,
     reaction: ReplyReactionCreate,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> ReplyResponse:
+    response, event = await run_in_threadpool(
+        _create_reaction, reply_id=reply_id, reaction=reaction, user=user, db=db
+    )
+    await topic_event_service.publish(event=event)
+    return response
+
+
+@reply_router.post(
+    "/votes/recalculate",
+    status_code=200,
+    description="Admin can recalculate the vote counts of all replies from their reactions",
+    dependencies=[Depends(require_admin_role)],
+)
+def recalculate_vote_counts(db: Session = Depends(get_db)) -> dict:
+    updated = reply_service.recalculate_vote_counts(db=db)
+    return {"msg": f"Recalculated vote counts for {updated} replies"}
+
+
+def _create(
+    topic_id: UUID, reply_create: ReplyCreate, user: User, db: Session
+) -> tuple[ReplyResponse, ReplyCreatedEvent]:
+    reply = reply_service.create(
+        topic_id=topic_id, reply=reply_create, user=user, db=db
+    )
+    return (
+        ReplyResponse.create(reply=reply),
+        topic_event_service.reply_created_event(reply=reply),
+    )
+
+
+def _create_reaction(
+    reply_id: UUID, reaction: ReplyReactionCreate, user: User, db: Session
+) -> tuple[ReplyResponse, ReplyVotedEvent]:
     reply = reply_service.vote(reply_id=reply_id, reaction=reaction, user=user, db=db)
-    votes = reply_service.get_votes(reply=reply)
-    return ReplyResponse.create(reply=reply, votes=votes)
+    return (
+        ReplyResponse.create(reply=reply),
+        topic_event_service.reply_voted_event(reply=reply),
+    )
@@ -1,15 +1,25 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.user import User
-from forum_system_api.schemas.common import TopicFilterParams
-from forum_system_api.schemas.topic import TopicCreate, TopicResponse, TopicUpdate
-from forum_system_api.services import topic_service
+from forum_system_api.schemas.common import ReplyFilterParams, TopicFilterParams
+from forum_system_api.schemas.reply import ReplyResponse
+from forum_system_api.schemas.topic import (
+    BestReplySelectedEvent,
+    TopicCreate,
+    TopicLockedEvent,
+    TopicResponse,
+    TopicUpdate,
+)
+from forum_system_api.services import topic_event_service, topic_service
 from forum_system_api.services.auth_service import get_current_user, require_admin_role
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 topic_router = APIRouter(prefix="/topics", tags=["topics"])
 
 
@@ -17,18 +27,26 @@ topic_router = APIRouter(prefix="/topics", tags=["topics"])
     "/public",
     response_model=list[TopicResponse],
     status_code=200,
-    description="Get a list of all topics along with their replies for public access",
+    description="Get a list of all topics along with their replies for public access. "
+    "The cursor for the next page is returned in the X-Next-Cursor header",
 )
 def get_public(
-    filter_query: TopicFilterParams = Depends(), db=Depends(get_db)
+    response: Response,
+    filter_query: TopicFilterParams = Depends(),
+    db=Depends(get_read_db),
 ) -> list[TopicResponse]:
     topics = topic_service.get_public(filter_params=filter_query, db=db)
+    _set_next_cursor(
+        response=response,
+        next_cursor=topic_service.get_next_cursor(
+            topics=topics, filter_params=filter_query
+        ),
+    )
+    replies = topic_service.get_replies_for_topics(
+        topic_ids=[topic.id for topic in topics], db=db
+    )
     return [
-        TopicResponse.create(
-            topic=topic,
-            replies=topic_service.get_replies(topic_id=topic.id, db=db),
-        )
-        for topic in topics
+        TopicResponse.create(topic=topic, replies=replies[topic.id]) for topic in topics
     ]
 
 
@@ -36,20 +54,27 @@ def get_public(
     "/",
     response_model=list[TopicResponse],
     status_code=200,
-    description="Get a list of all topics available to the user, along with their replies",
+    description="Get a list of all topics available to the user, along with their replies. "
+    "The cursor for the next page is returned in the X-Next-Cursor header",
 )
 def get_all(
+    response: Response,
     filter_query: TopicFilterParams = Depends(),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     user: User = Depends(get_current_user),
 ) -> list[TopicResponse]:
     topics = topic_service.get_all(filter_params=filter_query, user=user, db=db)
+    _set_next_cursor(
+        response=response,
+        next_cursor=topic_service.get_next_cursor(
+            topics=topics, filter_params=filter_query
+        ),
+    )
+    replies = topic_service.get_replies_for_topics(
+        topic_ids=[topic.id for topic in topics], db=db
+    )
     return [
-        TopicResponse.create(
-            topic=topic,
-            replies=topic_service.get_replies(topic_id=topic.id, db=db),
-        )
-        for topic in topics
+        TopicResponse.create(topic=topic, replies=replies[topic.id]) for topic in topics
     ]
 
 
@@ -57,18 +82,47 @@ def get_all(
     "/{topic_id}",
     response_model=TopicResponse,
     status_code=200,
-    description="Get a topic by its ID along with its replies",
+    description="Get a topic by its ID along with the first page of its replies",
 )
 def get_by_id(
     topic_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ) -> TopicResponse:
     topic = topic_service.get_by_id(topic_id=topic_id, user=user, db=db)
     return TopicResponse.create(
         topic=topic,
-        replies=topic_service.get_replies(topic_id=topic.id, db=db),
+        replies=topic_service.get_replies(
+            topic_id=topic.id, filter_params=ReplyFilterParams(), db=db
+        ),
+    )
+
+
+@topic_router.get(
+    "/{topic_id}/replies",
+    response_model=list[ReplyResponse],
+    status_code=200,
+    description="Get a page of the replies to a topic. "
+    "The cursor for the next page is returned in the X-Next-Cursor header",
+)
+def get_replies(
+    topic_id: UUID,
+    response: Response,
+    filter_query: ReplyFilterParams = Depends(),
+    db: Session = Depends(get_read_db),
+    user: User = Depends(get_current_user),
+) -> list[ReplyResponse]:
+    topic = topic_service.get_by_id(topic_id=topic_id, user=user, db=db)
+    replies = topic_service.get_replies(
+        topic_id=topic.id, filter_params=filter_query, db=db
     )
+    _set_next_cursor(
+        response=response,
+        next_cursor=topic_service.get_next_reply_cursor(
+            replies=replies, filter_params=filter_query
+        ),
+    )
+    return [ReplyResponse.create(reply=reply) for reply in replies]
 
 
 @topic_router.post(
@@ -106,7 +160,9 @@ def update(
     )
     return TopicResponse.create(
         topic=topic,
-        replies=topic_service.get_replies(topic_id=topic.id, db=db),
+        replies=topic_service.get_replies(
+            topic_id=topic.id, filter_params=ReplyFilterParams(), db=db
+        ),
     )
 
 
@@ -115,16 +171,17 @@ def update(
     status_code=200,
     description="Admin can Lock or Unlock a topic",
 )
-def lock(
+async def lock(
     topic_id: UUID,
     lock_topic: bool = Query(default=True),
     admin: User = Depends(require_admin_role),
     db: Session = Depends(get_db),
 ) -> dict:
-    topic = topic_service.lock(
-        user=admin, topic_id=topic_id, lock_topic=lock_topic, db=db
+    event = await run_in_threadpool(
+        _lock, user=admin, topic_id=topic_id, lock_topic=lock_topic, db=db
     )
-    return {"msg": "Topic locked"} if topic.is_locked else {"msg": "Topic unlocked"}
+    await topic_event_service.publish(event=event)
+    return {"msg": "Topic locked"} if event.is_locked else {"msg": "Topic unlocked"}
 
 
 @topic_router.patch(
@@ -133,15 +190,43 @@ def lock(
     status_code=200,
     description="Select the best reply for a topic. Only the author of the topic can select the best reply",
 )
-def best_reply(
+async def best_reply(
     topic_id: UUID,
     reply_id: UUID,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> TopicResponse:
+    response, event = await run_in_threadpool(
+        _select_best_reply, user=user, topic_id=topic_id, reply_id=reply_id, db=db
+    )
+    await topic_event_service.publish(event=event)
+    return response
+
+
+def _set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def _lock(
+    user: User, topic_id: UUID, lock_topic: bool, db: Session
+) -> TopicLockedEvent:
+    topic = topic_service.lock(
+        user=user, topic_id=topic_id, lock_topic=lock_topic, db=db
+    )
+    return topic_event_service.topic_locked_event(topic=topic)
+
+
+def _select_best_reply(
+    user: User, topic_id: UUID, reply_id: UUID, db: Session
+) -> tuple[TopicResponse, BestReplySelectedEvent]:
     topic = topic_service.select_best_reply(
         user=user, topic_id=topic_id, reply_id=reply_id, db=db
     )
-    return TopicResponse.create(
-        topic=topic, replies=topic_service.get_replies(topic_id=topic.id, db=db)
+    replies = topic_service.get_replies(
+        topic_id=topic.id, filter_params=ReplyFilterParams(), db=db
+    )
+    return (
+        TopicResponse.create(topic=topic, replies=replies),
+        topic_event_service.best_reply_selected_event(topic=topic),
     )
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from sqlalchemy.orm import Session
 
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.access_level import AccessLevel
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.category_permission import UserCategoryPermissionResponse
@@ -46,7 +46,7 @@ def get_current_user_info(
     description="Retrieve a list of all user accounts. Admin privileges required.",
     dependencies=[Depends(require_admin_role)],
 )
-def get_all_users(db: Session = Depends(get_db)) -> list[UserResponse]:
+def get_all_users(db: Session = Depends(get_read_db)) -> list[UserResponse]:
     return [
         UserResponse.model_validate(user, from_attributes=True)
         for user in user_service.get_all(db)
@@ -61,7 +61,7 @@ def get_all_users(db: Session = Depends(get_db)) -> list[UserResponse]:
 )
 def view_privileged_users(
     category_id: UUID = Path(..., description="The unique identifier of the category"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[UserPermissionsResponse]:
     privileged_users = user_service.get_privileged_users(category_id=category_id, db=db)
     return [
@@ -78,7 +78,7 @@ def view_privileged_users(
 )
 def view_user_permissions(
     user_id: UUID = Path(..., description="The unique identifier of the user"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> UserPermissionsResponse:
     user = user_service.get_by_id(user_id=user_id, db=db)
     if user is None:
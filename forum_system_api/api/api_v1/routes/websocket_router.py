@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.database import get_db
-from forum_system_api.services import auth_service
+from forum_system_api.services import auth_service, topic_event_service
 from forum_system_api.services.websocket_manager import websocket_manager
 
 websocket_router = APIRouter(prefix="/ws")
@@ -13,7 +13,7 @@ async def websocket_connect(
     websocket: WebSocket, db: Session = Depends(get_db)
 ) -> None:
     await websocket.accept()
-    user_id = None
+    connection = None
     try:
         data = await websocket.receive_json()
         user_id = auth_service.authenticate_websocket_user(data=data, db=db)
@@ -22,12 +22,21 @@ async def websocket_connect(
             await websocket.close()
             return
 
-        await websocket_manager.connect(websocket=websocket, user_id=user_id)
+        connection = await websocket_manager.connect(
+            websocket=websocket, user_id=user_id
+        )
 
         while True:
-            await websocket.receive_text()
+            message = await websocket.receive_text()
+            frame = await websocket_manager.handle_message(
+                connection=connection, message=message
+            )
+            if frame is not None:
+                await topic_event_service.handle_frame(
+                    connection=connection, frame=frame
+                )
     except (WebSocketDisconnect, RuntimeError):
-        if user_id is not None:
-            await websocket_manager.disconnect(user_id)
+        if connection is not None:
+            await websocket_manager.disconnect(connection)
     finally:
         await websocket_manager.close_connection(websocket)
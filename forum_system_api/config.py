@@ -28,8 +28,64 @@ DATABASE_URL = get_env_variable("DATABASE_URL")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", "false").lower() == "true"
+
+READ_DATABASE_URL = os.getenv("READ_DATABASE_URL", DATABASE_URL)
+if READ_DATABASE_URL.startswith("postgres://"):
+    READ_DATABASE_URL = READ_DATABASE_URL.replace("postgres://", "postgresql://", 1)
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+MESSAGE_SYNC_OVERLAP_SECONDS = float(os.getenv("MESSAGE_SYNC_OVERLAP_SECONDS", "10"))
+
+ASYNC_DATABASE_ENABLED = os.getenv("ASYNC_DATABASE_ENABLED", "false").lower() == "true"
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+)
+
+WEBSOCKET_BROKER = os.getenv("WEBSOCKET_BROKER", "memory")
+WEBSOCKET_BROKER_CHANNEL = os.getenv("WEBSOCKET_BROKER_CHANNEL", "websocket_messages")
+WEBSOCKET_MAX_CONNECTIONS_PER_USER = int(
+    os.getenv("WEBSOCKET_MAX_CONNECTIONS_PER_USER", "5")
+)
+WEBSOCKET_SEND_QUEUE_SIZE = int(os.getenv("WEBSOCKET_SEND_QUEUE_SIZE", "100"))
+WEBSOCKET_SEND_QUEUE_OVERFLOW = os.getenv(
+    "WEBSOCKET_SEND_QUEUE_OVERFLOW", "drop_oldest"
+)
+WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS = float(
+    os.getenv("WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS", "30")
+)
+WEBSOCKET_IDLE_TIMEOUT_SECONDS = float(os.getenv("WEBSOCKET_IDLE_TIMEOUT_SECONDS", "0"))
+WEBSOCKET_MAX_TOPIC_SUBSCRIPTIONS = int(
+    os.getenv("WEBSOCKET_MAX_TOPIC_SUBSCRIPTIONS", "100")
+)
+WEBSOCKET_BATCH_WINDOW_SECONDS = float(
+    os.getenv("WEBSOCKET_BATCH_WINDOW_SECONDS", "0.05")
+)
+WEBSOCKET_BROADCAST_CONCURRENCY = int(
+    os.getenv("WEBSOCKET_BROADCAST_CONCURRENCY", "10")
+)
+
 SECRET_KEY = get_env_variable("SECRET_KEY")
 ALGORITHM = get_env_variable("ALGORITHM")
 
 ACCESS_TOKEN_EXPIRE_MINUTES = int(get_env_variable("ACCESS_TOKEN_EXPIRE_MINUTES"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(get_env_variable("REFRESH_TOKEN_EXPIRE_DAYS"))
+
+TOKEN_VERSION_CACHE_TTL_SECONDS = int(
+    os.getenv("TOKEN_VERSION_CACHE_TTL_SECONDS", "30")
+)
+TOKEN_VERSION_CACHE_MAX_SIZE = int(os.getenv("TOKEN_VERSION_CACHE_MAX_SIZE", "10000"))
+
+CATEGORY_ACL_CACHE_TTL_SECONDS = int(os.getenv("CATEGORY_ACL_CACHE_TTL_SECONDS", "30"))
+CATEGORY_ACL_CACHE_MAX_SIZE = int(os.getenv("CATEGORY_ACL_CACHE_MAX_SIZE", "10000"))
+
+CATEGORY_CACHE_TTL_SECONDS = int(os.getenv("CATEGORY_CACHE_TTL_SECONDS", "60"))
+CATEGORY_CACHE_MAX_SIZE = int(os.getenv("CATEGORY_CACHE_MAX_SIZE", "10000"))
+CATEGORY_CACHE_VERSION_CHECK_SECONDS = float(
+    os.getenv("CATEGORY_CACHE_VERSION_CHECK_SECONDS", "1")
+)
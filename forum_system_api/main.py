@@ -1,12 +1,30 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from forum_system_api.api.api_v1.api import api_router
+from forum_system_api.api.api_v1.routes.conversation_router import SYNC_CURSOR_HEADER
+from forum_system_api.api.api_v1.routes.topic_router import NEXT_CURSOR_HEADER
 from forum_system_api.persistence.database import initialize_database
+from forum_system_api.services import topic_event_service
+from forum_system_api.services.utils.read_your_writes import (
+    LAST_WRITE_HEADER,
+    pin_reads_middleware,
+)
+from forum_system_api.services.websocket_manager import websocket_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    websocket_manager.set_topic_access_check(topic_event_service.filter_readers)
+    await websocket_manager.start()
+    yield
+    await websocket_manager.stop()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 logging.basicConfig(
@@ -19,7 +37,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SYNC_CURSOR_HEADER, LAST_WRITE_HEADER],
 )
+app.middleware("http")(pin_reads_middleware)
 
 app.include_router(api_router)
 
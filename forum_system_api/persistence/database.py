@@ -1,28 +1,98 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+
+from forum_system_api.config import (
+    ASYNC_DATABASE_ENABLED,
+    ASYNC_DATABASE_URL,
+    DATABASE_ECHO,
+    DATABASE_MAX_OVERFLOW,
+    DATABASE_POOL_PRE_PING,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_URL,
+    READ_DATABASE_URL,
+)
+from forum_system_api.persistence.pool import InstrumentedQueuePool
+from forum_system_api.services.utils.read_your_writes import requires_primary
 
-from forum_system_api.config import DATABASE_URL
+MIGRATIONS_PATH = Path(__file__).parent / "migrations"
+BASELINE_REVISION = "0001"
+MIGRATIONS_LOCK_ID = 715_203_114
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(DATABASE_URL, echo=True)
+POOL_OPTIONS = {
+    "pool_size": DATABASE_POOL_SIZE,
+    "max_overflow": DATABASE_MAX_OVERFLOW,
+    "pool_timeout": DATABASE_POOL_TIMEOUT,
+    "pool_recycle": DATABASE_POOL_RECYCLE,
+    "pool_pre_ping": DATABASE_POOL_PRE_PING,
+}
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=DATABASE_ECHO,
+    poolclass=InstrumentedQueuePool,
+    **POOL_OPTIONS,
+)
 
 session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = (
+    create_engine(
+        READ_DATABASE_URL,
+        echo=DATABASE_ECHO,
+        poolclass=InstrumentedQueuePool,
+        **POOL_OPTIONS,
+    )
+    if READ_DATABASE_URL != DATABASE_URL
+    else engine
+)
+
+read_session_local = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+async_engine = (
+    create_async_engine(ASYNC_DATABASE_URL, echo=DATABASE_ECHO, **POOL_OPTIONS)
+    if ASYNC_DATABASE_ENABLED
+    else None
+)
+
+async_session_local = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
+engines = {"primary": engine}
+if read_engine is not engine:
+    engines["read"] = read_engine
+if async_engine is not None:
+    engines["async"] = async_engine.sync_engine
+
 from forum_system_api.persistence.init_data import insert_init_data
 from forum_system_api.persistence.models import (
     admin,
+    cache_version,
     category,
     conversation,
+    conversation_read_cursor,
     message,
     reply,
     reply_reaction,
     topic,
     user,
     user_category_permission,
+    websocket_payload,
 )
 
 
@@ -42,6 +112,71 @@ def get_db():
         db.close()
 
 
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    """
+    Provides a database session for read-only routes.
+
+    The session reads from the replica, unless the client making the request
+    wrote within the last READ_YOUR_WRITES_SECONDS, in which case it reads
+    from the primary so the user sees their own changes. Without a separate
+    replica the request's primary session is reused, so authenticating the
+    request and serving it share one connection.
+
+    The replica session shares the info of the primary session, so the
+    principal attached while authenticating the request is visible to the
+    services that read through it.
+
+    Args:
+        request (Request): The incoming request.
+        db (Session): The primary database session of the request.
+
+    Yields:
+        db: A database session object.
+
+    Ensures that the database session is properly closed after use.
+    """
+    if read_engine is engine or requires_primary(request):
+        yield db
+        return
+
+    read_db = read_session_local()
+    read_db.info = db.info
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
+async def get_async_db():
+    """
+    Provides an async database session for use in a context manager.
+
+    Yields:
+        db: An async database session object.
+
+    Raises:
+        RuntimeError: If the async database engine is not enabled.
+
+    Ensures that the database session is properly closed after use.
+    """
+    if async_session_local is None:
+        raise RuntimeError("The async database engine is not enabled.")
+
+    async with async_session_local() as db:
+        yield db
+
+
+def get_db_session():
+    """
+    Selects the database session dependency based on the configuration.
+
+    Returns:
+        The get_async_db dependency if the async database engine is enabled,
+        otherwise the get_db dependency.
+    """
+    return get_async_db if ASYNC_DATABASE_ENABLED else get_db
+
+
 def create_uuid_extension():
     """
     Creates the "uuid-ossp" extension in the connected PostgreSQL database if it does not already exist.
@@ -57,13 +192,34 @@ def create_uuid_extension():
 
 def create_tables():
     """
-    Create all tables in the database.
+    Create all tables in the database by applying the pending migrations.
 
-    This function uses SQLAlchemy's metadata to create all tables that are defined
-    in the Base class. It binds the metadata to the specified engine and creates
-    the tables if they do not already exist.
+    Databases created by Base.metadata.create_all before migrations were
+    introduced are stamped with the baseline revision first, so only the
+    later migrations run against them. An advisory lock keeps workers that
+    start at the same time from migrating concurrently.
     """
-    Base.metadata.create_all(bind=engine)
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_PATH))
+
+    with engine.connect() as connection:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": MIGRATIONS_LOCK_ID}
+        )
+        connection.commit()
+        try:
+            config.attributes["connection"] = connection
+            table_names = inspect(connection).get_table_names()
+            connection.commit()
+            if "users" in table_names and "alembic_version" not in table_names:
+                command.stamp(config, BASELINE_REVISION)
+            command.upgrade(config, "head")
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"),
+                {"lock_id": MIGRATIONS_LOCK_ID},
+            )
+            connection.commit()
 
 
 def initialize_database():
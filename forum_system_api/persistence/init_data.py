@@ -17,6 +17,7 @@ from forum_system_api.persistence.models.user import User
 from forum_system_api.persistence.models.user_category_permission import (
     UserCategoryPermission,
 )
+from forum_system_api.services.utils.conversation_utils import order_participants
 
 
 def random_date_within_last_month() -> datetime:
@@ -3248,7 +3249,12 @@ def insert_admin(db: Session) -> None:
 
 def insert_conversations(db: Session) -> None:
     for conversation_data in conversations:
-        conversation = Conversation(**conversation_data)
+        user1_id, user2_id = order_participants(
+            conversation_data["user1_id"], conversation_data["user2_id"]
+        )
+        conversation = Conversation(
+            **conversation_data | {"user1_id": user1_id, "user2_id": user2_id}
+        )
         db.add(conversation)
 
     db.commit()
@@ -3325,6 +3331,7 @@ def insert_reply_reactions(db: Session) -> None:
         selected_user_indexes = random.sample(
             user_indexes, random.randrange(0, len(user_indexes) + 1)
         )
+        votes = {True: 0, False: 0}
         for user_idx in selected_user_indexes:
             reply_reaction = ReplyReaction(
                 user_id=users[user_idx]["id"],
@@ -3332,8 +3339,13 @@ def insert_reply_reactions(db: Session) -> None:
                 reaction=random.choices((True, False), weights=[80, 20], k=1)[0],
                 created_at=ensure_valid_created_at(reply["created_at"]),
             )
+            votes[reply_reaction.reaction] += 1
             db.add(reply_reaction)
 
+        db.query(Reply).filter(Reply.id == reply["id"]).update(
+            {Reply.upvotes: votes[True], Reply.downvotes: votes[False]}
+        )
+
     db.commit()
 
 
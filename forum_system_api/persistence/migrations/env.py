@@ -0,0 +1,76 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+from forum_system_api.config import DATABASE_URL
+from forum_system_api.persistence.database import Base, engine
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """
+    Skips the unique constraints the models declare on their primary keys,
+    which are not reflected back and would otherwise be re-added on every
+    autogenerate run.
+    """
+    if type_ == "unique_constraint" and not reflected:
+        columns = [column.name for column in object.columns]
+        primary_key = [column.name for column in object.table.primary_key.columns]
+        return columns != primary_key
+
+    return True
+
+
+def run_migrations_offline() -> None:
+    """
+    Run migrations in 'offline' mode, emitting the SQL to the script output
+    instead of executing it against a database.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode, using the connection passed in by
+    run_migrations() or a new connection of the application engine.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,55 @@
+"""reply vote counts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 12:37:10.215734
+
+Stores the vote counts of every reply on its row and fills them in from the
+existing reactions.
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "replies",
+        sa.Column("upvotes", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "replies",
+        sa.Column(
+            "downvotes", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.execute(
+        """
+        UPDATE replies
+        SET upvotes = counts.upvotes, downvotes = counts.downvotes
+        FROM (
+            SELECT reply_id,
+                   count(*) FILTER (WHERE reaction) AS upvotes,
+                   count(*) FILTER (WHERE NOT reaction) AS downvotes
+            FROM reply_reactions
+            GROUP BY reply_id
+        ) AS counts
+        WHERE replies.id = counts.reply_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("replies", "downvotes")
+    op.drop_column("replies", "upvotes")
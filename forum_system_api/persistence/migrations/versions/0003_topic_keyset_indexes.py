@@ -0,0 +1,49 @@
+"""topic keyset indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 12:37:18.640912
+
+Indexes matched to the orderings of the keyset-paginated topic listings.
+They are built concurrently so large tables stay writable while they are
+created.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_topics_created_at_id", "topics", ["created_at", "id"]),
+    ("ix_topics_title_id", "topics", ["title", "id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, if_exists=True, postgresql_concurrently=True
+            )
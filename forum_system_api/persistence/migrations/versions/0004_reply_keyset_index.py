@@ -0,0 +1,44 @@
+"""reply keyset index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:37:24.107385
+
+Index matched to the ordering of the keyset-paginated replies of a topic.
+It is built concurrently so the table stays writable while it is created.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_replies_topic_id_created_at_id",
+            "replies",
+            ["topic_id", "created_at", "id"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_replies_topic_id_created_at_id",
+            table_name="replies",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,69 @@
+"""hot query indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 12:37:33.893179
+
+Indexes matched to the filters and orderings of the service queries. They
+are built concurrently so large tables stay writable while they are created.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    (
+        "ix_topics_category_id_created_at_id",
+        "topics",
+        ["category_id", "created_at", "id"],
+    ),
+    ("ix_topics_author_id_created_at_id", "topics", ["author_id", "created_at", "id"]),
+    (
+        "ix_messages_conversation_id_created_at_id",
+        "messages",
+        ["conversation_id", "created_at", "id"],
+    ),
+    ("ix_conversations_user1_id_user2_id", "conversations", ["user1_id", "user2_id"]),
+    ("ix_conversations_user2_id_user1_id", "conversations", ["user2_id", "user1_id"]),
+    (
+        "ix_reply_reactions_reply_id_reaction",
+        "reply_reactions",
+        ["reply_id", "reaction"],
+    ),
+    (
+        "ix_user_category_permissions_category_id",
+        "user_category_permissions",
+        ["category_id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, if_exists=True, postgresql_concurrently=True
+            )
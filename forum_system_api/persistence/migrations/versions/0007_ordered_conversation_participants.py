@@ -0,0 +1,86 @@
+"""ordered conversation participants
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 12:41:02.512307
+
+Stores every conversation under its ordered participant pair and makes the
+pair unique. Duplicate conversations between the same two users, or of a
+user with themselves, are merged into the oldest one, whose messages they
+take over.
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE conversation_merges ON COMMIT DROP AS
+        SELECT id, first_value(id) OVER (
+            PARTITION BY least(user1_id, user2_id), greatest(user1_id, user2_id)
+            ORDER BY created_at, id
+        ) AS canonical_id
+        FROM conversations
+        """
+    )
+    op.execute(
+        """
+        UPDATE messages SET conversation_id = conversation_merges.canonical_id
+        FROM conversation_merges
+        WHERE messages.conversation_id = conversation_merges.id
+          AND conversation_merges.id <> conversation_merges.canonical_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM conversations USING conversation_merges
+        WHERE conversations.id = conversation_merges.id
+          AND conversation_merges.id <> conversation_merges.canonical_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversations
+        SET user1_id = user2_id, user2_id = user1_id
+        WHERE user1_id > user2_id
+        """
+    )
+    op.drop_index("ix_conversations_user1_id_user2_id", table_name="conversations")
+    op.create_unique_constraint(
+        "uq_conversations_user1_id_user2_id",
+        "conversations",
+        ["user1_id", "user2_id"],
+    )
+    op.create_check_constraint(
+        "ck_conversations_ordered_participants",
+        "conversations",
+        sa.text("user1_id <= user2_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "ck_conversations_ordered_participants", "conversations", type_="check"
+    )
+    op.drop_constraint(
+        "uq_conversations_user1_id_user2_id", "conversations", type_="unique"
+    )
+    op.create_index(
+        "ix_conversations_user1_id_user2_id",
+        "conversations",
+        ["user1_id", "user2_id"],
+        unique=False,
+    )
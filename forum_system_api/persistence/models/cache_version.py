@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from forum_system_api.persistence.database import Base
+
+
+class CacheVersion(Base):
+    """
+    CacheVersion model representing the cache_versions table in the database.
+
+    Every change to cached data bumps the version of its cache, so workers can
+    tell that their in-process copy is stale.
+
+    Attributes:
+        name (str): The name of the cache, e.g. "categories".
+        version (int): The number of changes made to the cached data.
+    """
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True, nullable=False)
+    version: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("0"), nullable=False
+    )
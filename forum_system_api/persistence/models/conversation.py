@@ -2,7 +2,14 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +24,10 @@ class Conversation(Base):
     """
     Represents a conversation between two users.
 
+    The participants are stored as an ordered pair (user1_id <= user2_id), so
+    each pair of users has at most one conversation. A user who messages
+    themselves has a conversation with both IDs equal.
+
     Attributes:
         id (UUID): Unique identifier for the conversation.
         created_at (DateTime): Timestamp when the conversation was created.
@@ -28,6 +39,15 @@ class Conversation(Base):
     """
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        UniqueConstraint(
+            "user1_id", "user2_id", name="uq_conversations_user1_id_user2_id"
+        ),
+        CheckConstraint(
+            "user1_id <= user2_id", name="ck_conversations_ordered_participants"
+        ),
+        Index("ix_conversations_user2_id_user1_id", "user2_id", "user1_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
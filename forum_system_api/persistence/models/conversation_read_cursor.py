@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from forum_system_api.persistence.database import Base
+
+
+class ConversationReadCursor(Base):
+    """
+    Represents how far a user has read a conversation.
+
+    The cursor points at the newest message the user has read. Its creation
+    time is stored alongside, so the unread messages can be counted with a
+    range scan of the messages index instead of loading the history.
+
+    Attributes:
+        conversation_id (UUID): Foreign key referencing the conversation.
+        user_id (UUID): Foreign key referencing the participant who read it.
+        last_read_message_id (UUID): Foreign key referencing the newest read message.
+        last_read_at (datetime): Timestamp when the newest read message was created.
+        updated_at (datetime): Timestamp when the cursor was last moved.
+    """
+
+    __tablename__ = "conversation_read_cursors"
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id"),
+        primary_key=True,
+        nullable=False,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True, nullable=False
+    )
+    last_read_message_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False
+    )
+    last_read_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -25,6 +25,8 @@ class Reply(Base):
         author_id (UUID): Foreign key referencing the user who authored the reply.
         topic_id (UUID): Foreign key referencing the topic to which the reply belongs.
         created_at (datetime): Timestamp when the reply was created.
+        upvotes (int): Number of upvotes, maintained alongside the reactions.
+        downvotes (int): Number of downvotes, maintained alongside the reactions.
 
     Relationships:
         author (User): The user who authored the reply.
@@ -33,6 +35,9 @@ class Reply(Base):
     """
 
     __tablename__ = "replies"
+    __table_args__ = (
+        Index("ix_replies_topic_id_created_at_id", "topic_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -51,6 +56,12 @@ class Reply(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    upvotes: Mapped[int] = mapped_column(
+        Integer, server_default=text("0"), nullable=False
+    )
+    downvotes: Mapped[int] = mapped_column(
+        Integer, server_default=text("0"), nullable=False
+    )
 
     author: Mapped["User"] = relationship("User", back_populates="replies")
     topic: Mapped["Topic"] = relationship(
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -37,6 +37,12 @@ class Topic(Base):
     """
 
     __tablename__ = "topics"
+    __table_args__ = (
+        Index("ix_topics_created_at_id", "created_at", "id"),
+        Index("ix_topics_title_id", "title", "id"),
+        Index("ix_topics_category_id_created_at_id", "category_id", "created_at", "id"),
+        Index("ix_topics_author_id_created_at_id", "author_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from forum_system_api.persistence.database import Base
+
+
+class WebSocketPayload(Base):
+    """
+    WebSocketPayload model representing the websocket_payloads table in the database.
+
+    Holds the WebSocket messages too large for a Postgres notification. The
+    publishing worker stores the message and notifies only its ID, and every
+    listening worker loads it from here. Rows are deleted once they are older
+    than the listeners need them.
+
+    Attributes:
+        id (UUID): The unique identifier of the payload.
+        payload (str): The serialized notification payload.
+        created_at (datetime): Timestamp when the payload was stored.
+    """
+
+    __tablename__ = "websocket_payloads"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        server_default=func.uuid_generate_v4(),
+        primary_key=True,
+        nullable=False,
+    )
+    payload: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,93 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+@dataclass(frozen=True)
+class PoolWaitStats:
+    """
+    A snapshot of how long connection checkouts waited on the pool.
+
+    Attributes:
+        checkouts (int): The number of connections handed out by the pool.
+        timeouts (int): The number of checkouts that gave up after the pool timeout.
+        total_wait_seconds (float): The time spent waiting for all checkouts.
+        max_wait_seconds (float): The longest time a single checkout waited.
+    """
+
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class PoolWaitMetrics:
+    """
+    Thread-safe counters of the time spent waiting for pooled connections.
+
+    Methods:
+        record(wait_seconds, timed_out): Records a single checkout.
+        snapshot(): Returns the current counters.
+        reset(): Resets all counters to zero.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def snapshot(self) -> PoolWaitStats:
+        with self._lock:
+            return PoolWaitStats(
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._checkouts = 0
+            self._timeouts = 0
+            self._total_wait_seconds = 0.0
+            self._max_wait_seconds = 0.0
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A QueuePool that records how long each checkout waits for a connection.
+
+    The wait includes opening a new connection when the pool has room for one,
+    so a pool starved of idle connections shows up as growing wait times.
+    Every pool keeps its own counters, so the primary and the replica pools
+    are reported separately.
+
+    Attributes:
+        wait_metrics (PoolWaitMetrics): The checkout wait times of this pool.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_metrics = PoolWaitMetrics()
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_metrics.record(time.perf_counter() - started_at, timed_out=True)
+            raise
+
+        self.wait_metrics.record(time.perf_counter() - started_at)
+        return connection
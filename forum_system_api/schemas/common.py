@@ -1,7 +1,11 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+REPLY_PAGE_SIZE = 20
+MESSAGE_PAGE_SIZE = 50
+INBOX_PAGE_SIZE = 20
+
 
 class FilterParams(BaseModel):
     order: Literal["asc", "desc"] = "asc"
@@ -15,3 +19,22 @@ class TopicFilterParams(BaseModel):
     order_by: Literal["title", "created_at"] = "created_at"
     limit: int = Field(10, gt=0, le=100)
     offset: int = Field(0, ge=0)
+    after: Optional[str] = Field(None, max_length=1000)
+
+
+class ReplyFilterParams(BaseModel):
+    order: Literal["asc", "desc"] = "desc"
+    limit: int = Field(REPLY_PAGE_SIZE, gt=0, le=100)
+    after: Optional[str] = Field(None, max_length=1000)
+
+
+class MessageFilterParams(BaseModel):
+    order: Literal["asc", "desc"] = "desc"
+    limit: int = Field(MESSAGE_PAGE_SIZE, gt=0, le=100)
+    after: Optional[str] = Field(None, max_length=1000)
+    since: Optional[str] = Field(None, max_length=8000)
+
+
+class InboxFilterParams(BaseModel):
+    limit: int = Field(INBOX_PAGE_SIZE, gt=0, le=100)
+    offset: int = Field(0, ge=0)
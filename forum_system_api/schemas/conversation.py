@@ -4,6 +4,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from ..schemas.message import MessageResponse
+from ..schemas.user import UserResponse
 
 
 class BaseConversation(BaseModel):
@@ -22,3 +23,16 @@ class ConversationResponse(BaseConversation):
 class DetailedConversationResponse(BaseConversation):
     messages: list[MessageResponse]
     author_id: UUID
+
+
+class InboxConversationResponse(BaseModel):
+    id: UUID
+    user: UserResponse
+    last_message: MessageResponse | None
+    last_message_at: datetime
+    unread_count: int
+    last_read_message_id: UUID | None
+    receiver_last_read_message_id: UUID | None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -35,3 +35,17 @@ class MessageResponse(BaseMessage):
     author_id: UUID
     conversation_id: Optional[UUID]
     created_at: datetime
+
+
+class ReadReceiptResponse(BaseModel):
+    conversation_id: UUID
+    user_id: UUID
+    last_read_message_id: UUID
+    last_read_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ReadReceiptEvent(ReadReceiptResponse):
+    type: Literal["read_receipt"] = "read_receipt"
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class PoolStatusResponse(BaseModel):
+    name: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    average_wait_seconds: float
+    max_wait_seconds: float
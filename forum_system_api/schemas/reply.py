@@ -35,7 +35,7 @@ class ReplyResponse(BaseReply):
         from_attributes = True
 
     @classmethod
-    def create(cls, reply: Reply, votes: tuple):
+    def create(cls, reply: Reply):
         return cls(
             id=reply.id,
             content=reply.content,
@@ -43,8 +43,8 @@ class ReplyResponse(BaseReply):
             topic_id=reply.topic_id,
             author_id=reply.author_id,
             created_at=reply.created_at,
-            upvotes=votes[0],
-            downvotes=votes[1],
+            upvotes=reply.upvotes,
+            downvotes=reply.downvotes,
         )
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -41,8 +41,6 @@ class TopicResponse(BaseTopic):
 
     @classmethod
     def create(cls, topic: Topic, replies: list[Reply]):
-        from forum_system_api.services.reply_service import get_votes
-
         return cls(
             title=topic.title,
             content=topic.content,
@@ -53,10 +51,7 @@ class TopicResponse(BaseTopic):
             category_id=topic.category_id,
             best_reply_id=topic.best_reply_id,
             is_locked=topic.is_locked,
-            replies=[
-                ReplyResponse.create(reply=reply, votes=get_votes(reply=reply))
-                for reply in replies
-            ],
+            replies=[ReplyResponse.create(reply=reply) for reply in replies],
         )
 
 
@@ -67,3 +62,29 @@ class TopicUpdate(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ReplyCreatedEvent(BaseModel):
+    type: Literal["reply_created"] = "reply_created"
+    topic_id: UUID
+    reply: ReplyResponse
+
+
+class ReplyVotedEvent(BaseModel):
+    type: Literal["reply_voted"] = "reply_voted"
+    topic_id: UUID
+    reply_id: UUID
+    upvotes: int
+    downvotes: int
+
+
+class TopicLockedEvent(BaseModel):
+    type: Literal["topic_locked"] = "topic_locked"
+    topic_id: UUID
+    is_locked: bool
+
+
+class BestReplySelectedEvent(BaseModel):
+    type: Literal["best_reply_selected"] = "best_reply_selected"
+    topic_id: UUID
+    best_reply_id: UUID
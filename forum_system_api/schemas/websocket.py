@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class WebSocketStatusResponse(BaseModel):
+    users: int
+    connections: int
+    queue_size: int
+    queued_messages: int
+    max_queue_depth: int
+    dropped_messages: int
+    overflow_disconnects: int
+    idle_disconnects: int
+    subscribed_topics: int
+    coalesced_messages: int
+
+    class Config:
+        from_attributes = True
+
+
+class TopicSubscriptionRequest(BaseModel):
+    type: Literal["subscribe", "unsubscribe"]
+    topic_id: UUID
+
+
+class TopicSubscriptionResponse(BaseModel):
+    type: Literal["subscribed", "unsubscribed", "subscription_error"]
+    topic_id: UUID
+    detail: str | None = None
+
+
+class AnnouncementCreate(BaseModel):
+    content: str = Field(min_length=1, max_length=999, examples=["Example content"])
+
+
+class AnnouncementEvent(BaseModel):
+    type: Literal["announcement"] = "announcement"
+    content: str
+    created_at: datetime
@@ -1,25 +1,32 @@
 import logging
 from datetime import datetime, timedelta
-from typing import cast
 from uuid import UUID, uuid4
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
+    ASYNC_DATABASE_ENABLED,
     REFRESH_TOKEN_EXPIRE_DAYS,
     SECRET_KEY,
 )
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_async_db, get_db
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.token import Token
 from forum_system_api.services import user_service
 from forum_system_api.services.user_service import is_admin
 from forum_system_api.services.utils.password_utils import verify_password
+from forum_system_api.services.utils.principal_utils import Principal, set_principal
+from forum_system_api.services.utils.read_your_writes import PRINCIPAL_STATE
+from forum_system_api.services.utils.token_version_cache import (
+    get_token_version,
+    set_token_version,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 logger = logging.getLogger(__name__)
@@ -154,31 +161,8 @@ def verify_token(token: str, db: Session) -> dict:
     Raises:
         HTTPException: If the token cannot be verified or if the user associated with the token cannot be found or has an invalid token version.
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        logger.info(f"Decoded token payload: {payload}")
-    except JWTError:
-        logger.error("Could not verify token")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
-        )
-
-    user_id = UUID(payload.get("sub"))
-    token_version = UUID(payload.get("token_version"))
-    user = user_service.get_by_id(user_id=user_id, db=db)
-
-    if user is None:
-        logger.error(f"User with ID {user_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
-        )
-    logger.info(f"Retrieved user {user_id}")
-
-    if user.token_version != token_version:
-        logger.error(f"Invalid token version for user {user_id}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
-        )
+    payload = _decode_token(token=token)
+    _check_token_version(payload=payload, db=db)
 
     return payload
 
@@ -207,6 +191,7 @@ def update_token_version(user_id: UUID, db: Session) -> UUID:
     user.token_version = uuid4()
     db.commit()
     db.refresh(user)
+    set_token_version(user_id=user.id, token_version=user.token_version)
     logger.info(f"Updated token version for user {user.id}")
 
     return user.token_version
@@ -301,36 +286,112 @@ def create_token_data(user: User, db: Session) -> dict:
     return token_data
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> User:
+def get_current_principal(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> Principal:
     """
-    Retrieve the current user based on the provided token.
+    Resolve the identity of the user making the current request.
+
+    The token version is checked against the cached version of the user, so
+    the database is only queried on a cache miss or when the versions differ,
+    e.g. after the user logged in on another worker. The user and their admin
+    flag are loaded when first needed and attached to the request's database
+    session, so services can reuse them instead of querying them again. The
+    principal is also kept on the request, so the response can pin the
+    client's reads to the primary once the request commits a write.
 
     Args:
+        request (Request): The incoming request.
         token (str): The authentication token provided by the user.
         db (Session): The database session dependency.
 
+    Returns:
+        Principal: The identity of the user making the request.
+
+    Raises:
+        HTTPException: If the token is invalid or the user does not exist.
+    """
+    payload = _decode_token(token=token)
+    user_id = UUID(payload.get("sub"))
+
+    user = _check_token_version(payload=payload, db=db)
+    principal = Principal(
+        user_id=user_id,
+        load_user=lambda: user or _get_token_user(user_id=user_id, db=db),
+        load_is_admin=lambda: user_service.query_is_admin(user_id=user_id, db=db),
+    )
+    set_principal(principal=principal, db=db)
+    setattr(request.state, PRINCIPAL_STATE, principal)
+    logger.info(f"Resolved principal for user {user_id}")
+
+    return principal
+
+
+def get_current_user(principal: Principal = Depends(get_current_principal)) -> User:
+    """
+    Retrieve the current user based on the provided token.
+
+    Args:
+        principal (Principal): The identity of the user making the request,
+            obtained from the `get_current_principal` dependency.
+
+    Returns:
+        User: The user object corresponding to the token.
+    """
+    logger.info(f"Retrieved current user {principal.user.id}")
+
+    return principal.user
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Retrieve the current user based on the provided token without blocking the event loop.
+
+    The user is loaded through the request's async database session, so
+    async routes authenticate without a connection from the synchronous pool.
+
+    Args:
+        token (str): The authentication token provided by the user.
+        db (AsyncSession): The async database session dependency.
+
     Returns:
         User: The user object corresponding to the token.
 
     Raises:
         HTTPException: If the token is invalid or the user does not exist.
     """
-    token_data = verify_token(token=token, db=db)
-    user_id = cast(UUID, UUID(token_data.get("sub")))
+    payload = _decode_token(token=token)
+    user_id = UUID(payload.get("sub"))
 
-    user = user_service.get_by_id(user_id=user_id, db=db)
+    user = await user_service.get_by_id_async(user_id=user_id, db=db)
     if user is None:
         logger.error(f"User with ID {user_id} not found")
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
         )
-    logger.info(f"Retrieved current user {user_id}")
+    set_token_version(user_id=user.id, token_version=user.token_version)
+
+    _verify_token_version(payload=payload, current_token_version=user.token_version)
+    logger.info(f"Retrieved current user {user.id}")
 
     return user
 
 
+def get_current_user_dependency():
+    """
+    Selects the current user dependency based on the configuration.
+
+    Returns:
+        The get_current_user_async dependency if the async database engine is
+        enabled, otherwise the get_current_user dependency.
+    """
+    return get_current_user_async if ASYNC_DATABASE_ENABLED else get_current_user
+
+
 def require_admin_role(
     user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ) -> User:
@@ -357,3 +418,112 @@ def require_admin_role(
     logger.info(f"User {user.id} has admin privileges")
 
     return user
+
+
+def _decode_token(token: str) -> dict:
+    """
+    Decodes the provided JWT token and verifies its signature and expiration.
+
+    Args:
+        token (str): The JWT token to be decoded.
+
+    Returns:
+        dict: The decoded payload from the JWT token.
+
+    Raises:
+        HTTPException: If the token cannot be decoded.
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        logger.info(f"Decoded token payload: {payload}")
+    except JWTError:
+        logger.error("Could not verify token")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
+        )
+
+    return payload
+
+
+def _get_token_user(user_id: UUID, db: Session) -> User:
+    """
+    Retrieves the user a token was issued to and caches their token version.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        db (Session): The database session to use for querying user information.
+
+    Returns:
+        User: The user the token was issued to.
+
+    Raises:
+        HTTPException: If the user cannot be found.
+    """
+    user = user_service.get_by_id(user_id=user_id, db=db)
+    if user is None:
+        logger.error(f"User with ID {user_id} not found")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
+        )
+    logger.info(f"Retrieved user {user_id}")
+
+    set_token_version(user_id=user.id, token_version=user.token_version)
+
+    return user
+
+
+def _check_token_version(payload: dict, db: Session) -> User | None:
+    """
+    Verifies that a token was issued for the current token version of its user.
+
+    The cached token version is trusted only when it matches the token. Other
+    workers change the version on login without updating this worker's cache,
+    so on a mismatch the version is read from the database again before the
+    token is rejected.
+
+    Args:
+        payload (dict): The decoded payload from the JWT token.
+        db (Session): The database session to use for querying user information.
+
+    Returns:
+        User | None: The user the token was issued to if they were loaded, or
+            None if the cached token version was used.
+
+    Raises:
+        HTTPException: If the user cannot be found or the token was issued for
+            a different token version.
+    """
+    user_id = UUID(payload.get("sub"))
+
+    cached_token_version = get_token_version(user_id=user_id)
+    if cached_token_version is not None:
+        if UUID(payload.get("token_version")) == cached_token_version:
+            logger.info(f"Retrieved cached token version for user {user_id}")
+            return None
+        logger.info(
+            f"Cached token version of user {user_id} differs from the token, "
+            "reading it again"
+        )
+
+    user = _get_token_user(user_id=user_id, db=db)
+    _verify_token_version(payload=payload, current_token_version=user.token_version)
+
+    return user
+
+
+def _verify_token_version(payload: dict, current_token_version: UUID) -> None:
+    """
+    Verifies that a token was issued for the current token version of its user.
+
+    Args:
+        payload (dict): The decoded payload from the JWT token.
+        current_token_version (UUID): The current token version of the user.
+
+    Raises:
+        HTTPException: If the token was issued for a different token version.
+    """
+    if UUID(payload.get("token_version")) != current_token_version:
+        logger.error(f"Invalid token version for user {payload.get('sub')}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not verify token"
+        )
@@ -2,10 +2,20 @@ import logging
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import asc, desc, func
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.category import Category
+from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.schemas.category import CategoryResponse, CreateCategory
+from forum_system_api.schemas.common import FilterParams
+from forum_system_api.services.utils.category_cache import (
+    CategoryMetadata,
+    bump_version,
+    get_category,
+    set_category,
+    sync_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,29 +35,47 @@ def create_category(data: CreateCategory, db: Session) -> CategoryResponse:
     db.add(new_category)
     db.commit()
     db.refresh(new_category)
+    set_category(category=new_category)
     logger.info(f"Created a new category with ID: {new_category.id}")
 
     return CategoryResponse.model_validate(new_category, from_attributes=True)
 
 
-def get_all(db: Session) -> list[CategoryResponse]:
+def get_all(filter_params: FilterParams, db: Session) -> list[CategoryResponse]:
     """
-    Retrieve all categories from the database.
+    Retrieve a page of categories along with the number of topics in each.
+
+    The topics are counted in the same grouped query, so they are never loaded.
 
     Args:
+        filter_params (FilterParams): Parameters to sort and paginate the categories.
         db (Session): The database session.
     Returns:
-        list[CategoryResponse]: A list of CategoryResponse objects representing all categories.
+        list[CategoryResponse]: A list of CategoryResponse objects representing the categories.
     Raises:
-        HTTPException: If no categories are found in the database.
+        HTTPException: If there are no categories in the database. A page past
+            the last category is returned empty instead.
     """
-    categories = db.query(Category).all()
+    order_by = asc if filter_params.order == "asc" else desc
+    topic_count = func.count(Topic.id).label("topic_count")
+    rows = (
+        db.query(Category, topic_count)
+        .outerjoin(Topic, Topic.category_id == Category.id)
+        .group_by(Category.id)
+        .order_by(
+            order_by(getattr(Category, filter_params.order_by)),
+            order_by(Category.id),
+        )
+        .offset(filter_params.offset)
+        .limit(filter_params.limit)
+        .all()
+    )
 
-    if not categories:
+    if not rows and filter_params.offset == 0:
         logger.error("No categories found in the database")
         raise HTTPException(status_code=404, detail="There are no categories yet")
 
-    logger.info("Retrieved all categories from the database")
+    logger.info("Retrieved categories with their topic counts from the database")
 
     result = [
         CategoryResponse(
@@ -56,9 +84,9 @@ def get_all(db: Session) -> list[CategoryResponse]:
             is_private=category.is_private,
             is_locked=category.is_locked,
             created_at=category.created_at,
-            topic_count=len(category.topics),
+            topic_count=topic_count,
         )
-        for category in categories
+        for category, topic_count in rows
     ]
     logger.info("Converted categories to CategoryResponse objects")
 
@@ -84,6 +112,35 @@ def get_by_id(category_id: UUID, db: Session) -> Category | None:
     return category
 
 
+def get_metadata(category_id: UUID, db: Session) -> CategoryMetadata | None:
+    """
+    Retrieve the metadata of a category by its ID.
+
+    The metadata is served from an in-process cache, so permission checks
+    do not query the category on every request.
+
+    Args:
+        category_id (UUID): The unique identifier of the category.
+        db (Session): The database session used for querying.
+
+    Returns:
+        CategoryMetadata: The metadata of the category if found, otherwise None.
+    """
+    sync_version(db=db)
+    metadata = get_category(category_id=category_id)
+    if metadata is not None:
+        logger.info(f"Retrieved cached metadata of category with ID: {category_id}")
+        return metadata
+
+    category = get_by_id(category_id=category_id, db=db)
+    if category is None:
+        return None
+
+    set_category(category=category)
+
+    return CategoryMetadata.from_category(category)
+
+
 def make_private_or_public(
     category_id: UUID, is_private: bool, db: Session
 ) -> Category:
@@ -107,8 +164,10 @@ def make_private_or_public(
     logger.info(f"Get category by ID: {category_id}")
 
     category.is_private = is_private
+    bump_version(db=db)
     db.commit()
     db.refresh(category)
+    set_category(category=category)
     logger.info(f"Updated category with ID: {category_id}")
 
     return category
@@ -135,8 +194,10 @@ def lock_or_unlock(category_id: UUID, is_locked: bool, db: Session) -> Category:
     logger.info(f"Get category by ID: {category_id}")
 
     category.is_locked = is_locked
+    bump_version(db=db)
     db.commit()
     db.refresh(category)
+    set_category(category=category)
     logger.info(f"Updated category with ID: {category_id}")
 
     return category
@@ -1,64 +1,391 @@
 import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from uuid import UUID
 
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    asc,
+    case,
+    desc,
+    func,
+    or_,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.orm import Session, aliased
+
+from forum_system_api.config import MESSAGE_SYNC_OVERLAP_SECONDS
+from forum_system_api.persistence.models.conversation import Conversation
+from forum_system_api.persistence.models.conversation_read_cursor import (
+    ConversationReadCursor,
+)
 from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
+from forum_system_api.schemas.common import InboxFilterParams, MessageFilterParams
+from forum_system_api.services.utils.conversation_utils import order_participants
+from forum_system_api.services.utils.cursor_utils import (
+    decode_cursor,
+    decode_sync_cursor,
+    encode_cursor,
+    encode_sync_cursor,
+)
+
+MESSAGE_SYNC_OVERLAP = timedelta(seconds=MESSAGE_SYNC_OVERLAP_SECONDS)
 
 logger = logging.getLogger(__name__)
 
 
-def get_users_from_conversations(user: User) -> set[User]:
+@dataclass(frozen=True)
+class InboxEntry:
+    """
+    A conversation as shown in a user's inbox.
+
+    Attributes:
+        id (UUID): The unique identifier of the conversation.
+        user (User): The other participant of the conversation.
+        last_message (Message | None): The newest message of the conversation.
+        last_message_at (datetime): When the last message was sent, or when the
+            conversation was created if it has no messages.
+        unread_count (int): The number of unread messages from the other participant.
+        last_read_message_id (UUID | None): The newest message the user has read.
+        receiver_last_read_message_id (UUID | None): The newest message the other
+            participant has read.
     """
-    Retrieve a set of users from the conversations of a given user.
+
+    id: UUID
+    user: User
+    last_message: Message | None
+    last_message_at: datetime
+    unread_count: int
+    last_read_message_id: UUID | None
+    receiver_last_read_message_id: UUID | None
+
+
+def get_users_from_conversations(user: User, db: Session) -> list[User]:
+    """
+    Retrieve the users who have a conversation with the given user.
 
     Args:
         user (User): The user whose conversations are to be analyzed.
+        db (Session): The database session used for querying.
     Returns:
-        set[User]: A set of users who are participants in the conversations with the given user.
+        list[User]: The other participants of the user's conversations.
     """
-    conversations = user.conversations
-    logger.info(f"Retrieved {len(conversations)} conversations for user {user.id}")
-
-    users = set()
-    for conversation in conversations:
-        if conversation.user1_id != user.id:
-            users.add(conversation.user1)
-        if conversation.user2_id != user.id:
-            users.add(conversation.user2)
-    logger.info(f"Retrieved {len(users)} users from conversations")
+    users = (
+        db.query(User)
+        .join(Conversation, User.id == _other_participant_id(user.id))
+        .filter(_has_participant(user.id))
+        .all()
+    )
+    logger.info(f"Retrieved {len(users)} users from conversations of user {user.id}")
 
     return users
 
 
-def get_messages_with_receiver(user: User, receiver_id: UUID) -> list[Message]:
+def get_inbox(
+    user: User, filter_params: InboxFilterParams, db: Session
+) -> list[InboxEntry]:
+    """
+    Retrieve the conversations of a user with their last message and unread count.
+
+    Everything is computed in a single query, see `build_inbox_query`.
+    The messages of the other participant after the user's read cursor count
+    as unread.
+
+    Args:
+        user (User): The user whose inbox is being retrieved.
+        filter_params (InboxFilterParams): Parameters to paginate the conversations.
+        db (Session): The database session used for querying.
+    Returns:
+        list[InboxEntry]: A page of the user's conversations, most recently active first.
     """
-    Retrieve messages from a conversation between the given user and a receiver.
+    rows = db.execute(
+        build_inbox_query(user_id=user.id, filter_params=filter_params)
+    ).all()
+    logger.info(f"Retrieved {len(rows)} inbox conversations for user {user.id}")
+
+    return [
+        InboxEntry(
+            id=conversation_id,
+            user=other_user,
+            last_message=message,
+            last_message_at=message_at,
+            unread_count=unread,
+            last_read_message_id=last_read_message_id,
+            receiver_last_read_message_id=receiver_last_read_message_id,
+        )
+        for (
+            conversation_id,
+            other_user,
+            message,
+            message_at,
+            unread,
+            last_read_message_id,
+            receiver_last_read_message_id,
+        ) in rows
+    ]
+
+
+def build_inbox_query(user_id: UUID, filter_params: InboxFilterParams) -> Select:
+    """
+    Build the query selecting a page of a user's conversations for their inbox.
+
+    The last message of each conversation is joined laterally and the
+    messages after the user's read cursor are counted with a correlated
+    subquery, both served by the (conversation_id, created_at, id) index on
+    messages. Conversations are sorted by the time of their last message,
+    newest first.
 
     Args:
-        user (User): The user whose conversations are being queried.
+        user_id (UUID): The unique identifier of the user.
+        filter_params (InboxFilterParams): Parameters to paginate the conversations.
+    Returns:
+        Select: The query selecting the conversation ID, the other participant,
+            the last message, its timestamp, the unread count and the read
+            cursors of both participants.
+    """
+    last_message = aliased(
+        Message,
+        select(Message)
+        .where(Message.conversation_id == Conversation.id)
+        .order_by(desc(Message.created_at), desc(Message.id))
+        .limit(1)
+        .correlate(Conversation)
+        .lateral(),
+    )
+    user_cursor = aliased(ConversationReadCursor)
+    receiver_cursor = aliased(ConversationReadCursor)
+    unread_count = (
+        select(func.count(Message.id))
+        .where(
+            Message.conversation_id == Conversation.id,
+            Message.author_id != user_id,
+            or_(
+                user_cursor.last_read_at.is_(None),
+                tuple_(Message.created_at, Message.id)
+                > tuple_(user_cursor.last_read_at, user_cursor.last_read_message_id),
+            ),
+        )
+        .correlate(Conversation, user_cursor)
+        .scalar_subquery()
+    )
+    last_message_at = func.coalesce(last_message.created_at, Conversation.created_at)
+
+    return (
+        select(
+            Conversation.id,
+            User,
+            last_message,
+            last_message_at.label("last_message_at"),
+            unread_count.label("unread_count"),
+            user_cursor.last_read_message_id,
+            receiver_cursor.last_read_message_id,
+        )
+        .join(User, User.id == _other_participant_id(user_id))
+        .outerjoin(last_message, true())
+        .outerjoin(
+            user_cursor,
+            and_(
+                user_cursor.conversation_id == Conversation.id,
+                user_cursor.user_id == user_id,
+            ),
+        )
+        .outerjoin(
+            receiver_cursor,
+            and_(
+                receiver_cursor.conversation_id == Conversation.id,
+                receiver_cursor.user_id == User.id,
+            ),
+        )
+        .where(_has_participant(user_id))
+        .order_by(desc(last_message_at), desc(Conversation.id))
+        .offset(filter_params.offset)
+        .limit(filter_params.limit)
+    )
+
+
+def _has_participant(user_id: UUID) -> ColumnElement[bool]:
+    return or_(Conversation.user1_id == user_id, Conversation.user2_id == user_id)
+
+
+def _other_participant_id(user_id: UUID) -> ColumnElement[UUID]:
+    return case(
+        (Conversation.user1_id == user_id, Conversation.user2_id),
+        else_=Conversation.user1_id,
+    )
+
+
+def get_conversation(
+    user_id: UUID, receiver_id: UUID, db: Session
+) -> Conversation | None:
+    """
+    Retrieve the conversation between two users.
+
+    Args:
+        user_id (UUID): The unique identifier of one participant.
+        receiver_id (UUID): The unique identifier of the other participant.
+        db (Session): The database session used for querying.
+    Returns:
+        Conversation | None: The conversation between the users, or None if they have none.
+    """
+    user1_id, user2_id = order_participants(user_id, receiver_id)
+    conversation = (
+        db.query(Conversation)
+        .filter(Conversation.user1_id == user1_id, Conversation.user2_id == user2_id)
+        .first()
+    )
+    logger.info(f"Retrieved conversation between user {user_id} and user {receiver_id}")
+
+    return conversation
+
+
+def get_messages_with_receiver(
+    user: User, receiver_id: UUID, filter_params: MessageFilterParams, db: Session
+) -> list[Message]:
+    """
+    Retrieve a page of messages from the conversation between the given user and a receiver.
+
+    Messages are ordered by their creation time with the message ID as a tiebreaker.
+    With an `after` cursor the page starts right after the message it points to.
+    With a `since` cursor only newer messages are returned, oldest first, so a
+    client can fetch what it missed. Message timestamps are taken when the
+    sending transaction starts, so a message can become visible after a newer
+    one; the `since` query therefore reads MESSAGE_SYNC_OVERLAP_SECONDS back
+    and skips the messages the cursor records as already returned.
+
+    Args:
+        user (User): The user whose conversation is being queried.
         receiver_id (UUID): The unique identifier of the receiver.
+        filter_params (MessageFilterParams): Parameters to sort and paginate the messages.
+        db (Session): The database session used for querying.
     Returns:
-        list[Message]: A list of messages in the conversation with the receiver.
+        list[Message]: A page of messages in the conversation with the receiver.
                        Returns an empty list if no conversation exists.
+    Raises:
+        HTTPException: If both cursors are given or the cursor is invalid.
     """
-    conversation = next(
-        (
-            conversation
-            for conversation in user.conversations
-            if conversation.user1_id == receiver_id
-            or conversation.user2_id == receiver_id
-        ),
-        None,
-    )
-    logger.info(f"Retrieved conversation between user {user.id} and user {receiver_id}")
+    if filter_params.after is not None and filter_params.since is not None:
+        logger.error("Both after and since cursors were given")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only one of after and since can be given",
+        )
 
+    conversation = get_conversation(user_id=user.id, receiver_id=receiver_id, db=db)
     if conversation is None:
         logger.info(
             f"No conversation found between user {user.id} and user {receiver_id}"
         )
         return []
 
-    messages = conversation.messages
+    is_ascending = filter_params.since is not None or filter_params.order == "asc"
+    order_by = asc if is_ascending else desc
+    query = (
+        db.query(Message)
+        .filter(Message.conversation_id == conversation.id)
+        .order_by(order_by(Message.created_at), order_by(Message.id))
+    )
+
+    if filter_params.since is not None:
+        created_at, message_id, seen = decode_sync_cursor(
+            cursor=filter_params.since, sort_key="created_at"
+        )
+        query = query.filter(
+            Message.created_at > created_at - MESSAGE_SYNC_OVERLAP,
+            Message.id.notin_(list(seen)),
+        )
+        logger.info(f"Filtered messages since message {message_id}")
+    elif filter_params.after is not None:
+        created_at, message_id = decode_cursor(
+            cursor=filter_params.after, sort_key="created_at"
+        )
+        position = tuple_(Message.created_at, Message.id)
+        cursor_position = tuple_(created_at, message_id)
+        query = query.filter(
+            position > cursor_position if is_ascending else position < cursor_position
+        )
+        logger.info(f"Filtered messages after message {message_id}")
+
+    messages = query.limit(filter_params.limit).all()
     logger.info(f"Retrieved {len(messages)} messages in the conversation")
 
     return messages
+
+
+def get_next_message_cursor(
+    messages: list[Message], filter_params: MessageFilterParams
+) -> str | None:
+    """
+    Create the cursor for the page of history following the given page of messages.
+
+    Args:
+        messages (list[Message]): The current page of messages.
+        filter_params (MessageFilterParams): The parameters the page was retrieved with.
+    Returns:
+        str | None: The cursor to pass as `after` to get the next page, or None
+            if the current page is the last one or was retrieved with `since`.
+    """
+    if filter_params.since is not None or len(messages) < filter_params.limit:
+        return None
+
+    return _encode_message_cursor(messages[-1])
+
+
+def get_sync_cursor(
+    messages: list[Message], filter_params: MessageFilterParams
+) -> str | None:
+    """
+    Create the cursor to pass as `since` to fetch the messages that arrive after the given page.
+
+    The cursor records the messages returned within MESSAGE_SYNC_OVERLAP_SECONDS
+    of the newest one, so they are not returned again when that window is read
+    again. Older messages are dropped from it, as the window no longer reaches
+    them, so the cursor stays small however long the client keeps syncing.
+
+    Args:
+        messages (list[Message]): The messages retrieved with `since`, or the
+            first page of history.
+        filter_params (MessageFilterParams): The parameters the messages were retrieved with.
+    Returns:
+        str | None: The cursor covering the messages retrieved so far, the given
+            `since` cursor if there were no new messages, or None for later pages
+            of history.
+    """
+    if filter_params.after is not None or not messages:
+        return filter_params.since
+
+    newest = max(messages, key=lambda message: (message.created_at, message.id))
+    if filter_params.since is None:
+        created_at, message_id, seen = newest.created_at, newest.id, {}
+    else:
+        created_at, message_id, seen = decode_sync_cursor(
+            cursor=filter_params.since, sort_key="created_at"
+        )
+
+    if newest.created_at > created_at:
+        created_at, message_id = newest.created_at, newest.id
+
+    window_start = created_at - MESSAGE_SYNC_OVERLAP
+    seen.update({message.id: message.created_at for message in messages})
+
+    return encode_sync_cursor(
+        sort_key="created_at",
+        sort_value=created_at,
+        row_id=message_id,
+        seen={
+            seen_id: seen_at
+            for seen_id, seen_at in seen.items()
+            if seen_at > window_start
+        },
+    )
+
+
+def _encode_message_cursor(message: Message) -> str:
+    return encode_cursor(
+        sort_key="created_at", sort_value=message.created_at, row_id=message.id
+    )
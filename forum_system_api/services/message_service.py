@@ -1,50 +1,103 @@
 import logging
+from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import HTTPException
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.conversation import Conversation
+from forum_system_api.persistence.models.conversation_read_cursor import (
+    ConversationReadCursor,
+)
 from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.message import MessageCreate
+from forum_system_api.services.utils.conversation_utils import order_participants
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ReadReceipt:
+    """
+    How far a participant has read a conversation.
+
+    Attributes:
+        conversation_id (UUID): The unique identifier of the conversation.
+        user_id (UUID): The unique identifier of the participant who read it.
+        receiver_id (UUID): The unique identifier of the other participant.
+        last_read_message_id (UUID): The unique identifier of the newest read message.
+        last_read_at (datetime): When the newest read message was created.
+    """
+
+    conversation_id: UUID
+    user_id: UUID
+    receiver_id: UUID
+    last_read_message_id: UUID
+    last_read_at: datetime
+
+
 def get_or_create_conversation(
     db: Session, user_id: UUID, receiver_id: UUID
 ) -> Conversation:
     """
     Retrieve an existing conversation between two users or create a new one if it does not exist.
 
+    The conversation is looked up by its ordered participant pair. It is created
+    with an insert that does nothing on conflict, so concurrent first messages
+    between the same users end up in the same conversation.
+
     Args:
         db (Session): The database session to use for querying and creating the conversation.
-        user_id (int): The ID of the first user.
-        receiver_id (int): The ID of the second user.
+        user_id (UUID): The ID of the first user.
+        receiver_id (UUID): The ID of the second user.
     Returns:
         Conversation: The existing or newly created conversation between the two users.
     """
-    conversation = (
-        db.query(Conversation)
-        .filter(
-            (
-                (Conversation.user1_id == user_id)
-                & (Conversation.user2_id == receiver_id)
-            )
-            | (
-                (Conversation.user1_id == receiver_id)
-                & (Conversation.user2_id == user_id)
-            )
-        )
-        .first()
+    user1_id, user2_id = order_participants(user_id, receiver_id)
+    query = db.query(Conversation).filter(
+        Conversation.user1_id == user1_id, Conversation.user2_id == user2_id
     )
 
+    conversation = query.first()
     if not conversation:
-        conversation = Conversation(user1_id=user_id, user2_id=receiver_id)
-        db.add(conversation)
+        db.execute(_insert_conversation(user1_id=user1_id, user2_id=user2_id))
         db.commit()
-        db.refresh(conversation)
+        conversation = query.first()
+        logger.info(f"Created new conversation with ID: {conversation.id}")
+    logger.info(f"Conversation ID: {conversation.id}")
+
+    return conversation
+
+
+async def get_or_create_conversation_async(
+    db: AsyncSession, user_id: UUID, receiver_id: UUID
+) -> Conversation:
+    """
+    Retrieve an existing conversation between two users or create a new one if it does not exist,
+    without blocking the event loop.
+
+    Args:
+        db (AsyncSession): The async database session to use for querying and creating the conversation.
+        user_id (UUID): The ID of the first user.
+        receiver_id (UUID): The ID of the second user.
+    Returns:
+        Conversation: The existing or newly created conversation between the two users.
+    """
+    user1_id, user2_id = order_participants(user_id, receiver_id)
+    query = select(Conversation).filter(
+        Conversation.user1_id == user1_id, Conversation.user2_id == user2_id
+    )
+
+    conversation = (await db.execute(query)).scalars().first()
+    if not conversation:
+        await db.execute(_insert_conversation(user1_id=user1_id, user2_id=user2_id))
+        await db.commit()
+        conversation = (await db.execute(query)).scalars().first()
         logger.info(f"Created new conversation with ID: {conversation.id}")
     logger.info(f"Conversation ID: {conversation.id}")
 
@@ -55,6 +108,8 @@ def send_message(db: Session, message_data: MessageCreate, user: User) -> Messag
     """
     Sends a message from the given user to the specified receiver.
 
+    Sending a message also marks the conversation as read for the sender.
+
     Args:
         db (Session): The database session.
         message_data (MessageCreate): The data required to create the message, including receiver ID and content.
@@ -80,8 +135,221 @@ def send_message(db: Session, message_data: MessageCreate, user: User) -> Messag
         content=message_data.content, conversation_id=conversation.id, author_id=user.id
     )
     db.add(message)
+    db.flush()
+    db.refresh(message)
+    db.execute(_upsert_read_cursor(message=message, user_id=user.id))
     db.commit()
     db.refresh(message)
     logger.info(f"Sent message from user {user.id} to user {message_data.receiver_id}")
 
     return message
+
+
+async def send_message_async(
+    db: AsyncSession, message_data: MessageCreate, user: User
+) -> Message:
+    """
+    Sends a message from the given user to the specified receiver without blocking the event loop.
+
+    Args:
+        db (AsyncSession): The async database session.
+        message_data (MessageCreate): The data required to create the message, including receiver ID and content.
+        user (User): The user sending the message.
+    Returns:
+        Message: The created message object.
+    Raises:
+        HTTPException: If the receiver is not found.
+    """
+    receiver = await db.get(User, message_data.receiver_id)
+
+    if not receiver:
+        logger.error(f"Receiver with ID {message_data.receiver_id} not found")
+        raise HTTPException(status_code=404, detail="Receiver not found")
+    logger.info(f"Receiver found with ID: {receiver.id}")
+
+    conversation = await get_or_create_conversation_async(
+        db, user.id, message_data.receiver_id
+    )
+    logger.info(
+        f"Getting or creating conversation between user {user.id} and user {message_data.receiver_id}"
+    )
+
+    message = Message(
+        content=message_data.content, conversation_id=conversation.id, author_id=user.id
+    )
+    db.add(message)
+    await db.flush()
+    await db.refresh(message)
+    await db.execute(_upsert_read_cursor(message=message, user_id=user.id))
+    await db.commit()
+    logger.info(f"Sent message from user {user.id} to user {message_data.receiver_id}")
+
+    return message
+
+
+def mark_as_read(db: Session, message_id: UUID, user: User) -> ReadReceipt:
+    """
+    Moves the user's read cursor of a conversation up to the given message.
+
+    The cursor only moves forward, so marking an older message as read
+    leaves it unchanged. The conditional upsert makes concurrent updates from
+    several devices of the user safe.
+
+    Args:
+        db (Session): The database session.
+        message_id (UUID): The unique identifier of the newest message the user has read.
+        user (User): The user who read the message.
+    Returns:
+        ReadReceipt: The user's read cursor of the conversation after the update.
+    Raises:
+        HTTPException: If the message is not found or the user is not a participant
+            of its conversation.
+    """
+    row = (
+        db.query(Message, Conversation)
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .filter(Message.id == message_id)
+        .first()
+    )
+    message, conversation = _get_readable_message(row, message_id=message_id, user=user)
+
+    db.execute(_upsert_read_cursor(message=message, user_id=user.id))
+    db.commit()
+    cursor = db.get(
+        ConversationReadCursor, (conversation.id, user.id), populate_existing=True
+    )
+    logger.info(
+        f"User {user.id} read conversation {conversation.id} up to message {cursor.last_read_message_id}"
+    )
+
+    return _create_read_receipt(cursor=cursor, conversation=conversation)
+
+
+async def mark_as_read_async(
+    db: AsyncSession, message_id: UUID, user: User
+) -> ReadReceipt:
+    """
+    Moves the user's read cursor of a conversation up to the given message
+    without blocking the event loop.
+
+    Args:
+        db (AsyncSession): The async database session.
+        message_id (UUID): The unique identifier of the newest message the user has read.
+        user (User): The user who read the message.
+    Returns:
+        ReadReceipt: The user's read cursor of the conversation after the update.
+    Raises:
+        HTTPException: If the message is not found or the user is not a participant
+            of its conversation.
+    """
+    row = (
+        await db.execute(
+            select(Message, Conversation)
+            .join(Conversation, Message.conversation_id == Conversation.id)
+            .filter(Message.id == message_id)
+        )
+    ).first()
+    message, conversation = _get_readable_message(row, message_id=message_id, user=user)
+
+    await db.execute(_upsert_read_cursor(message=message, user_id=user.id))
+    await db.commit()
+    cursor = await db.get(
+        ConversationReadCursor, (conversation.id, user.id), populate_existing=True
+    )
+    logger.info(
+        f"User {user.id} read conversation {conversation.id} up to message {cursor.last_read_message_id}"
+    )
+
+    return _create_read_receipt(cursor=cursor, conversation=conversation)
+
+
+def _get_readable_message(
+    row: tuple[Message, Conversation] | None, message_id: UUID, user: User
+) -> tuple[Message, Conversation]:
+    if row is None:
+        logger.error(f"Message with ID {message_id} not found")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Message not found"
+        )
+
+    message, conversation = row
+    if user.id not in (conversation.user1_id, conversation.user2_id):
+        logger.error(
+            f"User {user.id} is not a participant of conversation {conversation.id}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a participant of this conversation",
+        )
+
+    return message, conversation
+
+
+def _upsert_read_cursor(message: Message, user_id: UUID) -> Insert:
+    """
+    Builds an upsert of a read cursor that only moves it to a newer message.
+
+    Args:
+        message (Message): The newest message the user has read.
+        user_id (UUID): The unique identifier of the user.
+    Returns:
+        Insert: The upsert statement.
+    """
+    statement = insert(ConversationReadCursor).values(
+        conversation_id=message.conversation_id,
+        user_id=user_id,
+        last_read_message_id=message.id,
+        last_read_at=message.created_at,
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[
+            ConversationReadCursor.conversation_id,
+            ConversationReadCursor.user_id,
+        ],
+        set_={
+            "last_read_message_id": statement.excluded.last_read_message_id,
+            "last_read_at": statement.excluded.last_read_at,
+            "updated_at": func.now(),
+        },
+        where=tuple_(
+            ConversationReadCursor.last_read_at,
+            ConversationReadCursor.last_read_message_id,
+        )
+        < tuple_(
+            statement.excluded.last_read_at, statement.excluded.last_read_message_id
+        ),
+    )
+
+
+def _create_read_receipt(
+    cursor: ConversationReadCursor, conversation: Conversation
+) -> ReadReceipt:
+    receiver_id = (
+        conversation.user2_id
+        if cursor.user_id == conversation.user1_id
+        else conversation.user1_id
+    )
+    return ReadReceipt(
+        conversation_id=cursor.conversation_id,
+        user_id=cursor.user_id,
+        receiver_id=receiver_id,
+        last_read_message_id=cursor.last_read_message_id,
+        last_read_at=cursor.last_read_at,
+    )
+
+
+def _insert_conversation(user1_id: UUID, user2_id: UUID) -> Insert:
+    """
+    Builds an insert of a conversation that does nothing if the pair already has one.
+
+    Args:
+        user1_id (UUID): The smaller ID of the participants.
+        user2_id (UUID): The larger ID of the participants.
+    Returns:
+        Insert: The insert statement.
+    """
+    return (
+        insert(Conversation)
+        .values(user1_id=user1_id, user2_id=user2_id)
+        .on_conflict_do_nothing(constraint="uq_conversations_user1_id_user2_id")
+    )
@@ -0,0 +1,77 @@
+import logging
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+
+from forum_system_api.persistence.pool import InstrumentedQueuePool, PoolWaitStats
+from forum_system_api.schemas.pool import PoolStatusResponse
+
+logger = logging.getLogger(__name__)
+
+
+def get_pool_statuses(engines: dict[str, Engine]) -> list[PoolStatusResponse]:
+    """
+    Retrieves the current usage of the connection pool of every engine.
+
+    Args:
+        engines (dict[str, Engine]): The engines to inspect, keyed by the name
+            their pool is reported under.
+    Returns:
+        list[PoolStatusResponse]: The usage of each pool, labeled by engine name.
+    """
+    return [
+        get_pool_status(name=name, engine=engine) for name, engine in engines.items()
+    ]
+
+
+def get_pool_status(name: str, engine: Engine) -> PoolStatusResponse:
+    """
+    Retrieves the current usage of the connection pool of an engine.
+
+    Args:
+        name (str): The name the pool is reported under.
+        engine (Engine): The engine whose connection pool is inspected.
+    Returns:
+        PoolStatusResponse: The connection counts of the pool together with
+            the time checkouts spent waiting for a connection.
+    """
+    pool = engine.pool
+
+    if isinstance(pool, InstrumentedQueuePool):
+        wait_stats = pool.wait_metrics.snapshot()
+    else:
+        wait_stats = PoolWaitStats(
+            checkouts=0, timeouts=0, total_wait_seconds=0.0, max_wait_seconds=0.0
+        )
+
+    if isinstance(pool, QueuePool):
+        pool_size = pool.size()
+        max_overflow = pool._max_overflow
+        checked_out = pool.checkedout()
+        idle = pool.checkedin()
+        overflow = max(pool.overflow(), 0)
+    else:
+        pool_size = max_overflow = checked_out = idle = overflow = 0
+
+    average_wait_seconds = (
+        wait_stats.total_wait_seconds / wait_stats.checkouts
+        if wait_stats.checkouts
+        else 0.0
+    )
+    logger.info(
+        f"Connection pool {name} has {checked_out} checked out and {idle} idle connections"
+    )
+
+    return PoolStatusResponse(
+        name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        idle=idle,
+        overflow=overflow,
+        checkouts=wait_stats.checkouts,
+        timeouts=wait_stats.timeouts,
+        total_wait_seconds=wait_stats.total_wait_seconds,
+        average_wait_seconds=average_wait_seconds,
+        max_wait_seconds=wait_stats.max_wait_seconds,
+    )
@@ -0,0 +1,110 @@
+import logging
+import sys
+from uuid import uuid4
+
+from sqlalchemy import Connection, Select, desc, func, or_, select, text, true
+from sqlalchemy.dialects import postgresql
+
+from forum_system_api.persistence.database import engine
+from forum_system_api.persistence.models.conversation import Conversation
+from forum_system_api.persistence.models.message import Message
+from forum_system_api.persistence.models.reply import Reply
+from forum_system_api.persistence.models.reply_reaction import ReplyReaction
+from forum_system_api.persistence.models.topic import Topic
+from forum_system_api.persistence.models.user_category_permission import (
+    UserCategoryPermission,
+)
+from forum_system_api.schemas.common import InboxFilterParams
+from forum_system_api.services.conversation_service import build_inbox_query
+from forum_system_api.services.utils.conversation_utils import order_participants
+
+logger = logging.getLogger(__name__)
+
+
+def get_hot_queries() -> dict[str, Select]:
+    """
+    Builds the queries the services run on every request against large tables.
+
+    Returns:
+        dict[str, Select]: The queries by name, with placeholder identifiers.
+    """
+    user_id, other_user_id = order_participants(uuid4(), uuid4())
+
+    return {
+        "topics_by_category": select(Topic)
+        .where(Topic.category_id == uuid4())
+        .order_by(desc(Topic.created_at), desc(Topic.id))
+        .limit(10),
+        "topics_by_author": select(Topic)
+        .where(Topic.author_id == user_id)
+        .order_by(desc(Topic.created_at), desc(Topic.id))
+        .limit(10),
+        "replies_by_topic": select(Reply)
+        .where(Reply.topic_id == uuid4())
+        .order_by(desc(Reply.created_at), desc(Reply.id))
+        .limit(20),
+        "messages_by_conversation": select(Message)
+        .where(Message.conversation_id == uuid4())
+        .order_by(desc(Message.created_at), desc(Message.id))
+        .limit(50),
+        "conversation_between_users": select(Conversation)
+        .where(
+            Conversation.user1_id == user_id,
+            Conversation.user2_id == other_user_id,
+        )
+        .limit(1),
+        "conversations_of_user": select(Conversation).where(
+            or_(Conversation.user1_id == user_id, Conversation.user2_id == user_id)
+        ),
+        "inbox_of_user": build_inbox_query(
+            user_id=user_id, filter_params=InboxFilterParams()
+        ),
+        "upvotes_of_reply": select(func.count()).where(
+            ReplyReaction.reply_id == uuid4(), ReplyReaction.reaction == true()
+        ),
+        "permissions_of_category": select(UserCategoryPermission).where(
+            UserCategoryPermission.category_id == uuid4()
+        ),
+    }
+
+
+def find_seq_scans(connection: Connection) -> dict[str, str]:
+    """
+    Finds the hot queries that cannot be served by an index.
+
+    Sequential scans are disabled for the check, so the planner picks an
+    index whenever one matches; a query still planned as a sequential scan
+    has no usable index. This makes the check independent of table sizes
+    and statistics.
+
+    Args:
+        connection (Connection): The connection used to explain the queries.
+
+    Returns:
+        dict[str, str]: The plans of the queries that use a sequential scan, by query name.
+    """
+    seq_scans = {}
+    with connection.begin():
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        for name, query in get_hot_queries().items():
+            sql = query.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            plan = "\n".join(
+                row[0] for row in connection.execute(text(f"EXPLAIN {sql}"))
+            )
+            if "Seq Scan" in plan:
+                logger.error(f"Query {name} is planned as a sequential scan:\n{plan}")
+                seq_scans[name] = plan
+
+    return seq_scans
+
+
+if __name__ == "__main__":
+    with engine.connect() as connection:
+        seq_scans = find_seq_scans(connection)
+
+    for name, plan in seq_scans.items():
+        print(f"{name}:\n{plan}\n")
+
+    sys.exit(1 if seq_scans else 0)
@@ -2,7 +2,9 @@ import logging
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import false, true
 
 from forum_system_api.persistence.models.reply import Reply
 from forum_system_api.persistence.models.reply_reaction import ReplyReaction
@@ -161,10 +163,22 @@ def vote(
 
     if reaction.reaction is not None and existing_vote.reaction != reaction.reaction:
         existing_vote.reaction = reaction.reaction
+        _update_vote_counts(
+            reply_id=reply_id,
+            upvotes=1 if reaction.reaction else -1,
+            downvotes=-1 if reaction.reaction else 1,
+            db=db,
+        )
         db.commit()
         logger.info(f"Vote updated on reply {reply_id} by user {user.id}")
     else:
         db.delete(existing_vote)
+        _update_vote_counts(
+            reply_id=reply_id,
+            upvotes=-1 if existing_vote.reaction else 0,
+            downvotes=0 if existing_vote.reaction else -1,
+            db=db,
+        )
         db.commit()
         logger.info(f"Vote removed on reply {reply_id} by user {user.id}")
 
@@ -192,6 +206,12 @@ def create_vote(
         user_id=user_id, reply_id=reply.id, **reaction.model_dump()
     )
     db.add(user_vote)
+    _update_vote_counts(
+        reply_id=reply.id,
+        upvotes=1 if reaction.reaction else 0,
+        downvotes=0 if reaction.reaction else 1,
+        db=db,
+    )
     db.commit()
     db.refresh(reply)
     logger.info(f"Vote created on reply {reply.id} by user {user_id}")
@@ -201,6 +221,8 @@ def create_vote(
 def _get_vote_by_id(reply_id: UUID, user_id: UUID, db: Session) -> ReplyReaction | None:
     """
     Retrieve a vote (reaction) for a specific reply by a specific user.
+    The row is locked until the end of the transaction, so concurrent votes by
+    the same user cannot apply the same change to the vote counts twice.
 
     Args:
         reply_id (UUID): The unique identifier of the reply.
@@ -212,7 +234,10 @@ def _get_vote_by_id(reply_id: UUID, user_id: UUID, db: Session) -> ReplyReaction
     """
 
     existing_vote = (
-        db.query(ReplyReaction).filter_by(user_id=user_id, reply_id=reply_id).first()
+        db.query(ReplyReaction)
+        .filter_by(user_id=user_id, reply_id=reply_id)
+        .with_for_update()
+        .first()
     )
     logger.warning(
         f"Retrieved vote for reply {reply_id} by user {user_id} from the database if it exists or None otherwise"
@@ -220,22 +245,69 @@ def _get_vote_by_id(reply_id: UUID, user_id: UUID, db: Session) -> ReplyReaction
     return existing_vote
 
 
-def get_votes(reply: Reply):
+def recalculate_vote_counts(db: Session) -> int:
     """
-    Calculate the number of upvotes and downvotes for a given reply.
+    Recalculate the vote counts of all replies from their reactions.
+
+    Only replies whose stored counts differ from their reactions are updated.
 
     Args:
-        reply (Reply): The reply object containing reactions.
+        db (Session): The database session used for the operation.
 
     Returns:
-        tuple: A tuple containing the number of upvotes and downvotes.
+        int: The number of replies whose vote counts were corrected.
+    """
+    upvotes = (
+        select(func.count())
+        .where(ReplyReaction.reply_id == Reply.id, ReplyReaction.reaction == true())
+        .scalar_subquery()
+    )
+    downvotes = (
+        select(func.count())
+        .where(ReplyReaction.reply_id == Reply.id, ReplyReaction.reaction == false())
+        .scalar_subquery()
+    )
+
+    updated = (
+        db.query(Reply)
+        .filter(or_(Reply.upvotes != upvotes, Reply.downvotes != downvotes))
+        .update(
+            {Reply.upvotes: upvotes, Reply.downvotes: downvotes},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    logger.info(f"Recalculated vote counts for {updated} replies")
+
+    return updated
+
+
+def _update_vote_counts(
+    reply_id: UUID, upvotes: int, downvotes: int, db: Session
+) -> None:
     """
+    Adjust the stored vote counts of a reply by the given amounts.
+
+    The counts are incremented by the database, so concurrent votes on the same
+    reply do not overwrite each other. The change is committed together with the
+    reaction that caused it.
 
-    upvotes = sum(1 for reaction in reply.reactions if reaction.reaction)
-    logger.info(f"Retrieved {upvotes} upvotes for reply {reply.id}")
-    downvotes = sum(1 for reaction in reply.reactions if not reaction.reaction)
-    logger.info(f"Retrieved {downvotes} downvotes for reply {reply.id}")
-    return (upvotes, downvotes)
+    Args:
+        reply_id (UUID): The unique identifier of the reply.
+        upvotes (int): The amount to add to the upvotes.
+        downvotes (int): The amount to add to the downvotes.
+        db (Session): The database session used for the operation.
+    """
+    db.query(Reply).filter(Reply.id == reply_id).update(
+        {
+            Reply.upvotes: Reply.upvotes + upvotes,
+            Reply.downvotes: Reply.downvotes + downvotes,
+        },
+        synchronize_session=False,
+    )
+    logger.info(
+        f"Adjusted vote counts for reply {reply_id} by {upvotes} upvotes and {downvotes} downvotes"
+    )
 
 
 def _validate_reply_access(topic_id: UUID, user: User, db: Session) -> Topic:
@@ -0,0 +1,342 @@
+import logging
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from forum_system_api.config import CATEGORY_CACHE_MAX_SIZE, CATEGORY_CACHE_TTL_SECONDS
+from forum_system_api.persistence.database import session_local
+from forum_system_api.persistence.models.reply import Reply
+from forum_system_api.persistence.models.topic import Topic
+from forum_system_api.persistence.models.user import User
+from forum_system_api.schemas.reply import ReplyResponse
+from forum_system_api.schemas.topic import (
+    BestReplySelectedEvent,
+    ReplyCreatedEvent,
+    ReplyVotedEvent,
+    TopicLockedEvent,
+)
+from forum_system_api.schemas.websocket import (
+    TopicSubscriptionRequest,
+    TopicSubscriptionResponse,
+)
+from forum_system_api.services import topic_service, user_service
+from forum_system_api.services.category_service import (
+    get_metadata as get_category_metadata,
+)
+from forum_system_api.services.utils.category_access_utils import get_category_acl
+from forum_system_api.services.utils.category_acl_cache import get_acl
+from forum_system_api.services.utils.category_acl_cache import (
+    sync_version as sync_acl_version,
+)
+from forum_system_api.services.utils.ttl_cache import TTLCache
+from forum_system_api.services.websocket_manager import (
+    WebSocketConnection,
+    websocket_manager,
+)
+
+SUBSCRIPTION_FRAME_TYPES = ("subscribe", "unsubscribe")
+
+TopicEvent = (
+    ReplyCreatedEvent | ReplyVotedEvent | TopicLockedEvent | BestReplySelectedEvent
+)
+
+logger = logging.getLogger(__name__)
+
+_topic_categories: TTLCache[UUID, UUID] = TTLCache(
+    ttl_seconds=CATEGORY_CACHE_TTL_SECONDS, max_size=CATEGORY_CACHE_MAX_SIZE
+)
+
+
+async def handle_frame(connection: WebSocketConnection, frame: dict) -> None:
+    """
+    Handles a subscription frame received from a client.
+
+    Frames of other types are ignored. The client is answered with a
+    "subscribed", "unsubscribed" or "subscription_error" frame.
+
+    Args:
+        connection (WebSocketConnection): The connection the frame arrived on.
+        frame (dict): The parsed frame.
+    """
+    if frame.get("type") not in SUBSCRIPTION_FRAME_TYPES:
+        return
+
+    try:
+        request = TopicSubscriptionRequest.model_validate(frame)
+    except ValidationError:
+        logger.error(
+            f"Invalid subscription frame {frame} on connection {connection.id}"
+        )
+        return
+
+    if request.type == "unsubscribe":
+        websocket_manager.unsubscribe(connection=connection, topic_id=request.topic_id)
+        await _respond(
+            connection=connection,
+            topic_id=request.topic_id,
+            response_type="unsubscribed",
+        )
+        return
+
+    await subscribe(connection=connection, topic_id=request.topic_id)
+
+
+async def subscribe(connection: WebSocketConnection, topic_id: UUID) -> None:
+    """
+    Subscribes a connection to the events of a topic the user can read.
+
+    Access is checked in a new database session rather than the one held by
+    the connection, which would still hold the user's permissions as they
+    were when the connection was opened.
+
+    Args:
+        connection (WebSocketConnection): The connection to subscribe.
+        topic_id (UUID): The unique identifier of the topic.
+    """
+    try:
+        await run_in_threadpool(
+            _verify_topic_access, user_id=connection.user_id, topic_id=topic_id
+        )
+    except HTTPException as e:
+        await _respond(
+            connection=connection,
+            topic_id=topic_id,
+            response_type="subscription_error",
+            detail=e.detail,
+        )
+        return
+
+    if not websocket_manager.subscribe(connection=connection, topic_id=topic_id):
+        await _respond(
+            connection=connection,
+            topic_id=topic_id,
+            response_type="subscription_error",
+            detail="Too many topic subscriptions",
+        )
+        return
+
+    await _respond(connection=connection, topic_id=topic_id, response_type="subscribed")
+
+
+async def publish(event: TopicEvent) -> None:
+    """
+    Notifies the subscribers of a topic of an event.
+
+    The vote counts of a reply supersede the earlier ones, so only the latest
+    counts of the reply queued on a connection are sent.
+
+    Args:
+        event (TopicEvent): The event, built while the database session of the
+            request was still in use.
+    """
+    coalesce_key = (
+        f"reply_voted:{event.reply_id}" if isinstance(event, ReplyVotedEvent) else None
+    )
+    await websocket_manager.send_topic_event(
+        event=event, topic_id=event.topic_id, coalesce_key=coalesce_key
+    )
+
+
+def reply_created_event(reply: Reply) -> ReplyCreatedEvent:
+    """
+    Builds the event telling the subscribers of a topic that a reply was created.
+
+    Args:
+        reply (Reply): The created reply.
+
+    Returns:
+        ReplyCreatedEvent: The event.
+    """
+    return ReplyCreatedEvent(
+        topic_id=reply.topic_id, reply=ReplyResponse.create(reply=reply)
+    )
+
+
+def reply_voted_event(reply: Reply) -> ReplyVotedEvent:
+    """
+    Builds the event telling the subscribers of a topic the new vote counts of a reply.
+
+    Args:
+        reply (Reply): The reply that was voted on.
+
+    Returns:
+        ReplyVotedEvent: The event.
+    """
+    return ReplyVotedEvent(
+        topic_id=reply.topic_id,
+        reply_id=reply.id,
+        upvotes=reply.upvotes,
+        downvotes=reply.downvotes,
+    )
+
+
+def topic_locked_event(topic: Topic) -> TopicLockedEvent:
+    """
+    Builds the event telling the subscribers of a topic that it was locked or unlocked.
+
+    Args:
+        topic (Topic): The locked or unlocked topic.
+
+    Returns:
+        TopicLockedEvent: The event.
+    """
+    return TopicLockedEvent(topic_id=topic.id, is_locked=topic.is_locked)
+
+
+def best_reply_selected_event(topic: Topic) -> BestReplySelectedEvent:
+    """
+    Builds the event telling the subscribers of a topic that its best reply was selected.
+
+    Args:
+        topic (Topic): The topic with the selected best reply.
+
+    Returns:
+        BestReplySelectedEvent: The event.
+    """
+    return BestReplySelectedEvent(topic_id=topic.id, best_reply_id=topic.best_reply_id)
+
+
+async def filter_readers(
+    topic_id: UUID, connections: list[WebSocketConnection]
+) -> list[WebSocketConnection]:
+    """
+    Keeps the subscribers that can still read a topic and unsubscribes the others.
+
+    Access is checked again for every event, as it can be revoked after the
+    connection subscribed. The check uses the cached category of the topic
+    and the cached permissions of the users, so it only queries the database
+    on a cache miss. Unsubscribed clients are answered with an "unsubscribed"
+    frame. If the check fails, the event is not sent to anyone.
+
+    Args:
+        topic_id (UUID): The unique identifier of the topic.
+        connections (list[WebSocketConnection]): The subscribers of the topic.
+
+    Returns:
+        list[WebSocketConnection]: The subscribers that can read the topic.
+    """
+    try:
+        readers = await run_in_threadpool(
+            _get_topic_readers,
+            topic_id=topic_id,
+            user_ids={connection.user_id for connection in connections},
+        )
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to check the readers of topic {topic_id}. Error: {e}")
+        return []
+
+    allowed = []
+    for connection in connections:
+        if connection.user_id in readers:
+            allowed.append(connection)
+            continue
+
+        websocket_manager.unsubscribe(connection=connection, topic_id=topic_id)
+        await _respond(
+            connection=connection,
+            topic_id=topic_id,
+            response_type="unsubscribed",
+            detail="Unauthorized",
+        )
+
+    return allowed
+
+
+def _get_topic_readers(topic_id: UUID, user_ids: set[UUID]) -> set[UUID]:
+    """
+    Returns the users that can read a topic.
+
+    Args:
+        topic_id (UUID): The unique identifier of the topic.
+        user_ids (set[UUID]): The unique identifiers of the users to check.
+
+    Returns:
+        set[UUID]: The unique identifiers of the users that can read the topic.
+    """
+    with session_local() as db:
+        category_id = _get_topic_category_id(topic_id=topic_id, db=db)
+        if category_id is None:
+            logger.error(f"Topic with ID {topic_id} not found")
+            return set()
+
+        category = get_category_metadata(category_id=category_id, db=db)
+        if category is None or not category.is_private:
+            return set(user_ids)
+
+        sync_acl_version(db=db)
+        acls = {user_id: get_acl(user_id=user_id) for user_id in user_ids}
+        uncached = [user_id for user_id, acl in acls.items() if acl is None]
+        if uncached:
+            for user in db.query(User).filter(User.id.in_(uncached)).all():
+                acls[user.id] = get_category_acl(user=user, db=db)
+
+        return {
+            user_id
+            for user_id, acl in acls.items()
+            if acl is not None and acl.can_read(category_id)
+        }
+
+
+def _get_topic_category_id(topic_id: UUID, db: Session) -> UUID | None:
+    """
+    Returns the category of a topic, cached for CATEGORY_CACHE_TTL_SECONDS.
+
+    Args:
+        topic_id (UUID): The unique identifier of the topic.
+        db (Session): The database session.
+
+    Returns:
+        UUID | None: The unique identifier of the category, or None if the
+            topic is not found.
+    """
+    category_id = _topic_categories.get(topic_id)
+    if category_id is not None:
+        return category_id
+
+    category_id = db.query(Topic.category_id).filter(Topic.id == topic_id).scalar()
+    if category_id is not None:
+        _topic_categories.set(topic_id, category_id)
+
+    return category_id
+
+
+def _verify_topic_access(user_id: UUID, topic_id: UUID) -> None:
+    """
+    Verifies that a user exists and can read a topic.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        topic_id (UUID): The unique identifier of the topic.
+
+    Raises:
+        HTTPException: If the user or topic is not found, or the user does not
+            have permission to access the topic.
+    """
+    with session_local() as db:
+        user = user_service.get_by_id(user_id=user_id, db=db)
+        if user is None:
+            logger.error(f"User {user_id} not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        topic = topic_service.get_by_id(topic_id=topic_id, user=user, db=db)
+        _topic_categories.set(topic.id, topic.category_id)
+
+
+async def _respond(
+    connection: WebSocketConnection,
+    topic_id: UUID,
+    response_type: str,
+    detail: str | None = None,
+) -> None:
+    await websocket_manager.send_to_connection(
+        connection=connection,
+        message=TopicSubscriptionResponse(
+            type=response_type, topic_id=topic_id, detail=detail
+        ),
+    )
@@ -2,22 +2,28 @@ import logging
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, asc, desc, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, asc, desc, func, or_, tuple_
+from sqlalchemy.orm import Query, Session, joinedload
 from sqlalchemy.sql import false, true
 
 from forum_system_api.persistence.models.category import Category
 from forum_system_api.persistence.models.reply import Reply
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
-from forum_system_api.schemas.common import TopicFilterParams
+from forum_system_api.schemas.common import (
+    REPLY_PAGE_SIZE,
+    ReplyFilterParams,
+    TopicFilterParams,
+)
 from forum_system_api.schemas.topic import TopicCreate, TopicUpdate
 from forum_system_api.services.reply_service import get_by_id as get_reply_by_id
 from forum_system_api.services.user_service import is_admin
 from forum_system_api.services.utils.category_access_utils import (
+    get_category_acl,
     user_permission,
     verify_topic_permission,
 )
+from forum_system_api.services.utils.cursor_utils import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -33,32 +39,28 @@ def get_all(filter_params: TopicFilterParams, user: User, db: Session) -> list[T
     Returns:
         list[Topic]: A list of topics that match the filter criteria and user permissions.
     """
-    category_ids = {p.category_id for p in user.permissions}
-    query = db.query(Topic).join(Category, Topic.category_id == Category.id)
+    acl = get_category_acl(user=user, db=db)
+    query = (
+        db.query(Topic)
+        .options(joinedload(Topic.author))
+        .join(Category, Topic.category_id == Category.id)
+    )
     logger.info("Retrieved all topics from the database")
 
-    is_admin_user = is_admin(user_id=user.id, db=db)
     # gets all categories that are not private
     # or those that are private, but in user permissions
     query = query.filter(
         or_(
-            and_(Category.is_private, Topic.category_id.in_(category_ids)),
+            and_(Category.is_private, Topic.category_id.in_(list(acl.access_levels))),
             Topic.author_id == user.id,
             Category.is_private == False,
-            true() if is_admin_user else false(),
+            true() if acl.is_admin else false(),
         )
     )
     logger.info("Filtered topics based on user permissions")
 
-    if filter_params.order:
-        order_by = asc if filter_params.order == "asc" else desc
-        query = query.order_by(order_by(getattr(Topic, filter_params.order_by)))
-        logger.info(
-            f"Ordered topics by {filter_params.order_by} in {filter_params.order} order"
-        )
-
-    topics = query.offset(filter_params.offset).limit(filter_params.limit).all()
-    logger.info("Limited topics based on offset and limit")
+    topics = _order_and_paginate(query=query, filter_params=filter_params)
+    logger.info("Limited topics based on the pagination parameters")
 
     return topics
 
@@ -76,24 +78,42 @@ def get_public(filter_params: TopicFilterParams, db: Session) -> list[Topic]:
 
     query = (
         db.query(Topic)
+        .options(joinedload(Topic.author))
         .join(Category, Topic.category_id == Category.id)
         .filter(Category.is_private == False)
     )
     logger.info("Retrieved all public topics from the database")
 
-    if filter_params.order:
-        order_by = asc if filter_params.order == "asc" else desc
-        query = query.order_by(order_by(getattr(Topic, filter_params.order_by)))
-        logger.info(
-            f"Ordered public topics by {filter_params.order_by} in {filter_params.order} order"
-        )
-
-    topics = query.offset(filter_params.offset).limit(filter_params.limit).all()
-    logger.info("Limited public topics based on offset and limit")
+    topics = _order_and_paginate(query=query, filter_params=filter_params)
+    logger.info("Limited public topics based on the pagination parameters")
 
     return topics
 
 
+def get_next_cursor(
+    topics: list[Topic], filter_params: TopicFilterParams
+) -> str | None:
+    """
+    Create the cursor for the page following the given page of topics.
+
+    Args:
+        topics (list[Topic]): The current page of topics.
+        filter_params (TopicFilterParams): The parameters the page was retrieved with.
+    Returns:
+        str | None: The cursor to pass as `after` to get the next page,
+            or None if the current page is the last one.
+    """
+    if len(topics) < filter_params.limit:
+        return None
+
+    last_topic = topics[-1]
+    return encode_cursor(
+        sort_key=filter_params.order_by,
+        sort_value=getattr(last_topic, filter_params.order_by),
+        row_id=last_topic.id,
+    )
+
+
 def get_by_id(topic_id: UUID, user: User, db: Session) -> Topic:
     """
     Retrieve a topic by its ID.
@@ -232,29 +252,127 @@ def update(
     return topic
 
 
-def get_replies(topic_id: UUID, db: Session) -> list[Reply]:
+def get_replies(
+    topic_id: UUID, filter_params: ReplyFilterParams, db: Session
+) -> list[Reply]:
     """
-    Retrieve all replies for a given topic.
+    Retrieve a page of replies for a given topic.
+
+    Replies are ordered by their creation time with the reply ID as a tiebreaker.
+    If a cursor is given, the page starts right after the reply it points to.
 
     Args:
         topic_id (UUID): The unique identifier of the topic.
+        filter_params (ReplyFilterParams): Parameters to sort and paginate the replies.
         db (Session): The database session used for querying.
 
     Returns:
         list[Reply]: A list of Reply objects associated with the given topic.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
-    replies = (
+    order_by = asc if filter_params.order == "asc" else desc
+    query = (
         db.query(Reply)
-        .options(joinedload(Reply.reactions))
+        .options(joinedload(Reply.author))
         .filter(Reply.topic_id == topic_id)
-        .order_by(desc(Reply.created_at))
-        .all()
+        .order_by(order_by(Reply.created_at), order_by(Reply.id))
     )
-    logger.info(f"Retrieved all replies for topic {topic_id} from the database")
+    logger.info(f"Ordered replies for topic {topic_id} in {filter_params.order} order")
+
+    if filter_params.after is not None:
+        created_at, reply_id = decode_cursor(
+            cursor=filter_params.after, sort_key="created_at"
+        )
+        position = tuple_(Reply.created_at, Reply.id)
+        cursor = tuple_(created_at, reply_id)
+        query = query.filter(
+            position > cursor if filter_params.order == "asc" else position < cursor
+        )
+        logger.info(f"Filtered replies for topic {topic_id} after reply {reply_id}")
+
+    replies = query.limit(filter_params.limit).all()
+    logger.info(f"Retrieved a page of replies for topic {topic_id} from the database")
 
     return replies
 
 
+def get_next_reply_cursor(
+    replies: list[Reply], filter_params: ReplyFilterParams
+) -> str | None:
+    """
+    Create the cursor for the page following the given page of replies.
+
+    Args:
+        replies (list[Reply]): The current page of replies.
+        filter_params (ReplyFilterParams): The parameters the page was retrieved with.
+    Returns:
+        str | None: The cursor to pass as `after` to get the next page,
+            or None if the current page is the last one.
+    """
+    if len(replies) < filter_params.limit:
+        return None
+
+    last_reply = replies[-1]
+    return encode_cursor(
+        sort_key="created_at", sort_value=last_reply.created_at, row_id=last_reply.id
+    )
+
+
+def get_replies_for_topics(
+    topic_ids: list[UUID], db: Session, limit: int = REPLY_PAGE_SIZE
+) -> dict[UUID, list[Reply]]:
+    """
+    Retrieve the newest replies for a batch of topics, grouped by topic.
+
+    The replies of all topics are fetched in a single query, with their authors
+    loaded eagerly, so the number of queries does not grow with the number of
+    topics. At most `limit` replies are returned per topic, the rest can be
+    paged through with get_replies.
+
+    Args:
+        topic_ids (list[UUID]): The unique identifiers of the topics.
+        db (Session): The database session used for querying.
+        limit (int): The maximum number of replies to return for each topic.
+
+    Returns:
+        dict[UUID, list[Reply]]: A mapping of each topic ID to its replies,
+            ordered from newest to oldest.
+    """
+    replies_by_topic: dict[UUID, list[Reply]] = {topic_id: [] for topic_id in topic_ids}
+    if not topic_ids:
+        return replies_by_topic
+
+    ranked_replies = (
+        db.query(
+            Reply.id,
+            func.row_number()
+            .over(
+                partition_by=Reply.topic_id,
+                order_by=(desc(Reply.created_at), desc(Reply.id)),
+            )
+            .label("position"),
+        )
+        .filter(Reply.topic_id.in_(topic_ids))
+        .subquery()
+    )
+    replies = (
+        db.query(Reply)
+        .options(joinedload(Reply.author))
+        .join(ranked_replies, Reply.id == ranked_replies.c.id)
+        .filter(ranked_replies.c.position <= limit)
+        .order_by(desc(Reply.created_at), desc(Reply.id))
+        .all()
+    )
+    logger.info(f"Retrieved replies for {len(topic_ids)} topics from the database")
+
+    for reply in replies:
+        replies_by_topic[reply.topic_id].append(reply)
+
+    return replies_by_topic
+
+
 def lock(user: User, topic_id: UUID, lock_topic: bool, db: Session) -> Topic:
     """
     Locks or unlocks a topic based on the provided parameters.
@@ -307,7 +425,7 @@ def select_best_reply(user: User, topic_id: UUID, reply_id: UUID, db: Session) -
 
 def get_topics_for_category(category_id: UUID, user: User, db: Session) -> list[Topic]:
     from forum_system_api.services.category_service import (
-        get_by_id as get_category_by_id,
+        get_metadata as get_category_metadata,
     )
 
     """
@@ -323,7 +441,7 @@ def get_topics_for_category(category_id: UUID, user: User, db: Session) -> list[
         HTTPException: If the user is not authorized to access the category.
     """
 
-    category = get_category_by_id(category_id=category_id, db=db)
+    category = get_category_metadata(category_id=category_id, db=db)
     if category is None:
         logger.error(f"Category with ID {category_id} not found")
         raise HTTPException(
@@ -331,10 +449,8 @@ def get_topics_for_category(category_id: UUID, user: User, db: Session) -> list[
         )
     logger.info(f"Retrieved category with ID: {category_id}")
 
-    if (
-        category.is_private
-        and category.id not in (p.category_id for p in user.permissions)
-        and not is_admin(user_id=user.id, db=db)
+    if category.is_private and not get_category_acl(user=user, db=db).can_read(
+        category.id
     ):
         logger.error(
             f"User {user.id} does not have permission to access category {category_id}"
@@ -343,7 +459,12 @@ def get_topics_for_category(category_id: UUID, user: User, db: Session) -> list[
             status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized"
         )
 
-    topics = db.query(Topic).filter(Topic.category_id == category_id).all()
+    topics = (
+        db.query(Topic)
+        .options(joinedload(Topic.author))
+        .filter(Topic.category_id == category_id)
+        .all()
+    )
     logger.info(f"Retrieved all topics for category {category_id} from the database")
 
     return topics
@@ -383,3 +504,42 @@ def _validate_topic_access(topic_id: UUID, user: User, db: Session) -> Topic:
     logger.info(f"User {user.id} has permission to access topic {topic_id}")
 
     return topic
+
+
+def _order_and_paginate(query: Query, filter_params: TopicFilterParams) -> list[Topic]:
+    """
+    Order a topic query and retrieve a single page of it.
+
+    Topics are ordered by the requested column with the topic ID as a tiebreaker.
+    If a cursor is given, the page starts right after the topic it points to,
+    otherwise the offset is used.
+
+    Args:
+        query (Query): The topic query to paginate.
+        filter_params (TopicFilterParams): Parameters to sort and paginate the topics.
+    Returns:
+        list[Topic]: The topics on the requested page.
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    sort_column = getattr(Topic, filter_params.order_by)
+    order_by = asc if filter_params.order == "asc" else desc
+    query = query.order_by(order_by(sort_column), order_by(Topic.id))
+    logger.info(
+        f"Ordered topics by {filter_params.order_by} in {filter_params.order} order"
+    )
+
+    if filter_params.after is None:
+        return query.offset(filter_params.offset).limit(filter_params.limit).all()
+
+    sort_value, topic_id = decode_cursor(
+        cursor=filter_params.after, sort_key=filter_params.order_by
+    )
+    position = tuple_(sort_column, Topic.id)
+    cursor = tuple_(sort_value, topic_id)
+    query = query.filter(
+        position > cursor if filter_params.order == "asc" else position < cursor
+    )
+    logger.info(f"Filtered topics after topic {topic_id}")
+
+    return query.limit(filter_params.limit).all()
@@ -3,6 +3,8 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.access_level import AccessLevel
@@ -14,7 +16,12 @@ from forum_system_api.persistence.models.user_category_permission import (
 )
 from forum_system_api.schemas.user import UserCreate
 from forum_system_api.services import category_service
+from forum_system_api.services.utils.category_acl_cache import (
+    bump_version as bump_acl_version,
+)
+from forum_system_api.services.utils.category_acl_cache import invalidate_acl
 from forum_system_api.services.utils.password_utils import hash_password
+from forum_system_api.services.utils.principal_utils import get_principal
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +59,23 @@ def get_by_id(user_id: UUID, db: Session) -> User | None:
     return user
 
 
+async def get_by_id_async(user_id: UUID, db: AsyncSession) -> Optional[User]:
+    """
+    Retrieve a user by their unique identifier without blocking the event loop.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        db (AsyncSession): The async database session to use for the query.
+
+    Returns:
+        Optional[User]: The user object if found, otherwise None.
+    """
+    user = await db.get(User, user_id)
+    logger.warning(f"Retrieved user with ID: {user_id} from the database or None")
+
+    return user
+
+
 def get_by_username(username: str, db: Session) -> Optional[User]:
     """
     Retrieve a user by their username.
@@ -71,6 +95,26 @@ def get_by_username(username: str, db: Session) -> Optional[User]:
     return user
 
 
+async def get_by_username_async(username: str, db: AsyncSession) -> Optional[User]:
+    """
+    Retrieve a user by their username without blocking the event loop.
+
+    Args:
+        username (str): The username of the user to retrieve.
+        db (AsyncSession): The async database session to use for the query.
+
+    Returns:
+        Optional[User]: The user object if found, otherwise None.
+    """
+    result = await db.execute(select(User).filter(User.username == username).limit(1))
+    user = result.scalars().first()
+    logger.warning(
+        f"Retrieved user with username: {username} from the database or None"
+    )
+
+    return user
+
+
 def get_by_email(email: str, db: Session) -> Optional[User]:
     """
     Retrieve a user by their email address.
@@ -125,6 +169,28 @@ def is_admin(user_id: UUID, db: Session) -> bool:
     """
     Checks if a user is an admin.
 
+    If the user is the one making the current request, the admin flag
+    resolved for the request is reused instead of querying the database.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        db (Session): The database session to use for the query.
+
+    Returns:
+        bool: True if the user is an admin, False otherwise.
+    """
+    principal = get_principal(user_id=user_id, db=db)
+    if principal is not None:
+        logger.info(f"Checked if user with ID {user_id} is an admin for the request")
+        return principal.is_admin
+
+    return query_is_admin(user_id=user_id, db=db)
+
+
+def query_is_admin(user_id: UUID, db: Session) -> bool:
+    """
+    Checks if a user is an admin by querying the database.
+
     Args:
         user_id (UUID): The unique identifier of the user.
         db (Session): The database session to use for the query.
@@ -234,7 +300,9 @@ def revoke_access(user_id: UUID, category_id: UUID, db: Session) -> bool:
     )
 
     db.delete(permission)
+    bump_acl_version(db=db)
     db.commit()
+    invalidate_acl(user_id=user_id)
     logger.info(
         f"Revoked access for user with ID {user_id} in category with ID {category_id}"
     )
@@ -276,8 +344,10 @@ def update_access_level(
             f"Updated permission for user with ID {user_id} in category with ID {category_id}"
         )
 
+    bump_acl_version(db=db)
     db.commit()
     db.refresh(permission)
+    invalidate_acl(user_id=user_id)
     logger.info(
         f"Committed and refreshed permission for user with ID {user_id} in category with ID {category_id}"
     )
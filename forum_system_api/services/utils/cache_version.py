@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.cache_version import CacheVersion
+
+logger = logging.getLogger(__name__)
+
+
+class CacheVersionCheck:
+    """
+    Keeps an in-process cache in step with the version stored in the cache_versions table.
+
+    Attributes:
+        name (str): The name of the cache in the cache_versions table.
+        interval_seconds (float): How often the stored version is read. Checking
+            is disabled when the interval is not positive.
+        on_stale (Callable[[], None]): Drops the cached entries once another
+            worker bumped the version.
+
+    Methods:
+        bump(db): Records a change so other workers drop their cached entries.
+        sync(db): Drops the cached entries if the stored version changed.
+        reset(): Forgets the last seen version.
+    """
+
+    def __init__(
+        self, name: str, interval_seconds: float, on_stale: Callable[[], None]
+    ) -> None:
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.on_stale = on_stale
+        self._known_version: int | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def bump(self, db: Session) -> None:
+        """
+        Records a change to the cached data so other workers drop their cached entries.
+
+        The version is bumped in the caller's transaction, so it is only visible
+        once the change itself is committed.
+
+        Args:
+            db (Session): The database session used for the change.
+        """
+        statement = (
+            insert(CacheVersion)
+            .values(name=self.name, version=1)
+            .on_conflict_do_update(
+                index_elements=[CacheVersion.name],
+                set_={"version": CacheVersion.version + 1},
+            )
+        )
+        db.execute(statement)
+        logger.info(f"Bumped the version of the {self.name} cache")
+
+    def sync(self, db: Session) -> None:
+        """
+        Drops the cached entries if another worker bumped the version since the last check.
+
+        The version is read at most once per interval_seconds.
+
+        Args:
+            db (Session): The database session used to read the version.
+        """
+        if self.interval_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.interval_seconds
+
+        version = (
+            db.query(CacheVersion.version)
+            .filter(CacheVersion.name == self.name)
+            .scalar()
+            or 0
+        )
+        with self._lock:
+            is_stale = (
+                self._known_version is not None and version != self._known_version
+            )
+            self._known_version = version
+
+        if is_stale:
+            self.on_stale()
+            logger.info(f"Dropped the cached {self.name}, version changed to {version}")
+
+    def reset(self) -> None:
+        """
+        Forgets the last seen version, so the next sync reads it again.
+        """
+        with self._lock:
+            self._known_version = None
+            self._next_check = 0.0
@@ -7,8 +7,16 @@ from sqlalchemy.orm import Session
 from forum_system_api.persistence.models.access_level import AccessLevel
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
-from forum_system_api.services.category_service import get_by_id as get_category_by_id
+from forum_system_api.services.category_service import (
+    get_metadata as get_category_metadata,
+)
 from forum_system_api.services.user_service import is_admin
+from forum_system_api.services.utils.category_acl_cache import (
+    CategoryAcl,
+    get_acl,
+    set_acl,
+    sync_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +39,7 @@ def user_permission(
     Raises:
         HTTPException: If the category associated with the topic is not found.
     """
-    category = get_category_by_id(category_id=topic_category_id, db=db)
+    category = get_category_metadata(category_id=topic_category_id, db=db)
     if not category:
         logger.error(f"Category with ID {topic_category_id} not found")
         raise HTTPException(
@@ -41,7 +49,7 @@ def user_permission(
 
     if category.is_locked:
         logger.info(f"Category with ID {topic_category_id} is locked")
-        return is_admin(user_id=user.id, db=db)
+        return get_category_acl(user=user, db=db).is_admin
 
     if category.is_private:
         logger.info(f"Category with ID {topic_category_id} is private")
@@ -52,31 +60,55 @@ def user_permission(
     return True
 
 
-def get_access_level(
-    user: User,
-    category_id: UUID,
-) -> AccessLevel | None:
+def get_category_acl(user: User, db: Session) -> CategoryAcl:
+    """
+    Retrieves the compiled category permissions of a user.
+
+    The permissions are compiled into a map of category ID to access level
+    once and cached, so permission checks do not scan the user's permissions.
+
+    Args:
+        user (User): The user whose permissions are being retrieved.
+        db (Session): The database session.
+
+    Returns:
+        CategoryAcl: The admin flag and the access level of the user for each category.
+    """
+    sync_version(db=db)
+    acl = get_acl(user_id=user.id)
+    if acl is not None:
+        logger.info(f"Retrieved cached category permissions for user {user.id}")
+        return acl
+
+    acl = CategoryAcl(
+        is_admin=is_admin(user_id=user.id, db=db),
+        access_levels={
+            p.category_id: p.access_level
+            for p in user.permissions
+            if p.user_id == user.id
+        },
+    )
+    set_acl(user_id=user.id, acl=acl)
+    logger.info(f"Compiled category permissions for user {user.id}")
+
+    return acl
+
+
+def get_access_level(user: User, category_id: UUID, db: Session) -> AccessLevel | None:
     """
     Determines the access level of a user for a specific topic.
 
     Args:
         user (User): The user whose access level is being checked.
         category_id (UUID): The unique identifier of the category.
+        db (Session): The database session.
 
     Returns:
         AccessLevel: The access level of the user for the given topic, or None if no matching permission is found.
     """
-    access_level = next(
-        (
-            p.access_level
-            for p in user.permissions
-            if p.category_id == category_id and p.user_id == user.id
-        ),
-        None,
-    )
-    logger.warning(
-        f"Retrieved access level {access_level} for user {user.id} in category {category_id} from the database "
-        "if it exists or None otherwise"
+    access_level = get_category_acl(user=user, db=db).access_levels.get(category_id)
+    logger.info(
+        f"Retrieved access level {access_level} for user {user.id} in category {category_id}"
     )
 
     return access_level
@@ -94,16 +126,7 @@ def category_write_permission(user: User, category_id: UUID, db: Session) -> boo
     Returns:
         bool: True if the user has write access to the category or is an admin, False otherwise.
     """
-
-    user_access = get_access_level(user=user, category_id=category_id)
-    write_permission = (
-        next(
-            (p.category_id for p in user.permissions if p.category_id == category_id),
-            None,
-        )
-        is not None
-        and user_access == AccessLevel.WRITE
-    ) or is_admin(user_id=user.id, db=db)
+    write_permission = get_category_acl(user=user, db=db).can_write(category_id)
     logger.info(f"User {user.id} has write permission: {write_permission}")
 
     return write_permission
@@ -122,12 +145,11 @@ def verify_topic_permission(topic: Topic, user: User, db: Session) -> None:
         HTTPException: If the user does not have permission to access the topic.
     """
 
-    category = get_category_by_id(category_id=topic.category_id, db=db)
+    category = get_category_metadata(category_id=topic.category_id, db=db)
     if (
         category is not None
         and category.is_private
-        and (category.id not in (p.category_id for p in user.permissions))
-        and not is_admin(user_id=user.id, db=db)
+        and not get_category_acl(user=user, db=db).can_read(category.id)
     ):
         logger.error(
             f"User {user.id} does not have permission to access topic {topic.id}"
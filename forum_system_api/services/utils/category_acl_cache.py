@@ -0,0 +1,125 @@
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from forum_system_api.config import (
+    CATEGORY_ACL_CACHE_MAX_SIZE,
+    CATEGORY_ACL_CACHE_TTL_SECONDS,
+    CATEGORY_CACHE_VERSION_CHECK_SECONDS,
+)
+from forum_system_api.persistence.models.access_level import AccessLevel
+from forum_system_api.services.utils.cache_version import CacheVersionCheck
+from forum_system_api.services.utils.ttl_cache import TTLCache
+
+CACHE_NAME = "category_acls"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CategoryAcl:
+    """
+    The compiled category permissions of a user.
+
+    Attributes:
+        is_admin (bool): Whether the user has admin privileges.
+        access_levels (dict[UUID, AccessLevel]): The access level of the user
+            for each category they have been granted access to.
+
+    Methods:
+        can_read(category_id): Checks if the user may read a private category.
+        can_write(category_id): Checks if the user may write to a private category.
+    """
+
+    is_admin: bool
+    access_levels: dict[UUID, AccessLevel]
+
+    def can_read(self, category_id: UUID) -> bool:
+        return self.is_admin or category_id in self.access_levels
+
+    def can_write(self, category_id: UUID) -> bool:
+        return self.is_admin or self.access_levels.get(category_id) == AccessLevel.WRITE
+
+
+_acls: TTLCache[UUID, CategoryAcl] = TTLCache(
+    ttl_seconds=CATEGORY_ACL_CACHE_TTL_SECONDS,
+    max_size=CATEGORY_ACL_CACHE_MAX_SIZE,
+)
+_version_check = CacheVersionCheck(
+    name=CACHE_NAME,
+    interval_seconds=CATEGORY_CACHE_VERSION_CHECK_SECONDS,
+    on_stale=_acls.clear,
+)
+
+
+def get_acl(user_id: UUID) -> CategoryAcl | None:
+    """
+    Retrieves the cached category permissions of a user.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+
+    Returns:
+        CategoryAcl | None: The permissions of the user, or None if they are not cached
+            or the cached entry has expired.
+    """
+    return _acls.get(user_id)
+
+
+def set_acl(user_id: UUID, acl: CategoryAcl) -> None:
+    """
+    Caches the category permissions of a user for the configured time to live.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        acl (CategoryAcl): The compiled permissions of the user.
+    """
+    _acls.set(user_id, acl)
+    logger.info(f"Cached category permissions for user {user_id}")
+
+
+def invalidate_acl(user_id: UUID) -> None:
+    """
+    Removes the cached category permissions of a user.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+    """
+    _acls.invalidate(user_id)
+    logger.info(f"Invalidated cached category permissions for user {user_id}")
+
+
+def clear_acls() -> None:
+    """
+    Removes all cached category permissions.
+    """
+    _acls.clear()
+    _version_check.reset()
+    logger.info("Cleared all cached category permissions")
+
+
+def bump_version(db: Session) -> None:
+    """
+    Records a change to the category permissions so other workers drop their cached ones.
+
+    The version is bumped in the caller's transaction, so it is only visible
+    once the change itself is committed.
+
+    Args:
+        db (Session): The database session used for the change.
+    """
+    _version_check.bump(db)
+
+
+def sync_version(db: Session) -> None:
+    """
+    Drops the cached permissions if another worker changed them since the last check.
+
+    The version is read at most once per CATEGORY_CACHE_VERSION_CHECK_SECONDS.
+
+    Args:
+        db (Session): The database session used to read the version.
+    """
+    _version_check.sync(db)
@@ -0,0 +1,117 @@
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from forum_system_api.config import (
+    CATEGORY_CACHE_MAX_SIZE,
+    CATEGORY_CACHE_TTL_SECONDS,
+    CATEGORY_CACHE_VERSION_CHECK_SECONDS,
+)
+from forum_system_api.persistence.models.category import Category
+from forum_system_api.services.utils.cache_version import CacheVersionCheck
+from forum_system_api.services.utils.ttl_cache import TTLCache
+
+CACHE_NAME = "categories"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CategoryMetadata:
+    """
+    The cached attributes of a category used by permission checks.
+
+    Attributes:
+        id (UUID): Unique identifier for the category.
+        name (str): Name of the category.
+        is_private (bool): Indicates if the category is private.
+        is_locked (bool): Indicates if the category is locked.
+    """
+
+    id: UUID
+    name: str
+    is_private: bool
+    is_locked: bool
+
+    @classmethod
+    def from_category(cls, category: Category) -> "CategoryMetadata":
+        return cls(
+            id=category.id,
+            name=category.name,
+            is_private=category.is_private,
+            is_locked=category.is_locked,
+        )
+
+
+_categories: TTLCache[UUID, CategoryMetadata] = TTLCache(
+    ttl_seconds=CATEGORY_CACHE_TTL_SECONDS,
+    max_size=CATEGORY_CACHE_MAX_SIZE,
+)
+_version_check = CacheVersionCheck(
+    name=CACHE_NAME,
+    interval_seconds=CATEGORY_CACHE_VERSION_CHECK_SECONDS,
+    on_stale=_categories.clear,
+)
+
+
+def get_category(category_id: UUID) -> CategoryMetadata | None:
+    """
+    Retrieves the cached metadata of a category.
+
+    Args:
+        category_id (UUID): The unique identifier of the category.
+
+    Returns:
+        CategoryMetadata | None: The metadata of the category, or None if it is not
+            cached or the cached entry has expired.
+    """
+    return _categories.get(category_id)
+
+
+def set_category(category: Category) -> None:
+    """
+    Caches the metadata of a category for the configured time to live.
+
+    Args:
+        category (Category): The category to cache.
+    """
+    _categories.set(category.id, CategoryMetadata.from_category(category))
+    logger.info(f"Cached metadata of category {category.id}")
+
+
+def clear_categories() -> None:
+    """
+    Removes all cached category metadata.
+    """
+    _categories.clear()
+    _version_check.reset()
+    logger.info("Cleared all cached category metadata")
+
+
+def bump_version(db: Session) -> None:
+    """
+    Records a change to the categories so other workers drop their cached metadata.
+
+    The version is bumped in the caller's transaction, so it is only visible
+    once the change itself is committed.
+
+    Args:
+        db (Session): The database session used for the change.
+    """
+    _version_check.bump(db)
+
+
+def sync_version(db: Session) -> None:
+    """
+    Drops the cached metadata if another worker changed a category since the last check.
+
+    The version is read at most once per CATEGORY_CACHE_VERSION_CHECK_SECONDS.
+    Checking is disabled when the interval is not positive, in which case
+    changes made by other workers are picked up when the cached entries expire.
+
+    Args:
+        db (Session): The database session used to read the version.
+    """
+    _version_check.sync(db)
@@ -0,0 +1,21 @@
+from uuid import UUID
+
+
+def order_participants(user_id: UUID, other_user_id: UUID) -> tuple[UUID, UUID]:
+    """
+    Orders the participants of a conversation into the pair it is stored under.
+
+    Conversations store the smaller user ID as user1_id, so every pair of users
+    maps to exactly one row, whoever sent the first message.
+
+    Args:
+        user_id (UUID): The ID of one participant.
+        other_user_id (UUID): The ID of the other participant.
+
+    Returns:
+        tuple[UUID, UUID]: The user1_id and user2_id of the conversation.
+    """
+    if user_id < other_user_id:
+        return user_id, other_user_id
+
+    return other_user_id, user_id
@@ -0,0 +1,154 @@
+import base64
+import binascii
+import json
+import logging
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+SORT_VALUE_TYPES: dict[str, type] = {"created_at": datetime}
+
+
+def encode_cursor(sort_key: str, sort_value: str | datetime, row_id: UUID) -> str:
+    """
+    Encodes the position of a row in an ordered result into an opaque cursor.
+
+    Args:
+        sort_key (str): The name of the column the result is ordered by.
+        sort_value (str | datetime): The value of the sort column for the row.
+        row_id (UUID): The unique identifier of the row, used as a tiebreaker.
+
+    Returns:
+        str: The URL-safe cursor pointing right after the given row.
+    """
+    is_datetime = isinstance(sort_value, datetime)
+    payload = {
+        "key": sort_key,
+        "value": sort_value.isoformat() if is_datetime else sort_value,
+        "datetime": is_datetime,
+        "id": str(row_id),
+    }
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    logger.info(f"Encoded cursor for row {row_id} ordered by {sort_key}")
+
+    return cursor
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[str | datetime, UUID]:
+    """
+    Decodes a cursor created by encode_cursor.
+
+    Args:
+        cursor (str): The cursor to decode.
+        sort_key (str): The name of the column the result is ordered by.
+
+    Returns:
+        tuple[str | datetime, UUID]: The sort value and the unique identifier
+            of the row the cursor points after.
+
+    Raises:
+        HTTPException: If the cursor is malformed, was created for a different
+            ordering or holds a value of the wrong type for the sort column.
+    """
+    sort_value, row_id, _ = _decode_payload(cursor=cursor, sort_key=sort_key)
+    logger.info(f"Decoded cursor for row {row_id} ordered by {sort_key}")
+
+    return sort_value, row_id
+
+
+def encode_sync_cursor(
+    sort_key: str, sort_value: datetime, row_id: UUID, seen: dict[UUID, datetime]
+) -> str:
+    """
+    Encodes a cursor for fetching the rows created after a given row, together
+    with the rows already returned near it.
+
+    The timestamp of each seen row is stored as its distance in microseconds
+    from sort_value, which keeps the cursor short.
+
+    Args:
+        sort_key (str): The name of the timestamp column the rows are ordered by.
+        sort_value (datetime): The timestamp of the newest row returned so far.
+        row_id (UUID): The unique identifier of the newest row returned so far.
+        seen (dict[UUID, datetime]): The timestamps of the rows already returned
+            that are close enough to sort_value to be read again.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    payload = {
+        "key": sort_key,
+        "value": sort_value.isoformat(),
+        "datetime": True,
+        "id": str(row_id),
+        "seen": sorted(
+            [str(seen_id), (sort_value - created_at) // timedelta(microseconds=1)]
+            for seen_id, created_at in seen.items()
+        ),
+    }
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    logger.info(f"Encoded sync cursor for row {row_id} ordered by {sort_key}")
+
+    return cursor
+
+
+def decode_sync_cursor(
+    cursor: str, sort_key: str
+) -> tuple[datetime, UUID, dict[UUID, datetime]]:
+    """
+    Decodes a cursor created by encode_sync_cursor or encode_cursor.
+
+    Args:
+        cursor (str): The cursor to decode.
+        sort_key (str): The name of the timestamp column the rows are ordered by.
+
+    Returns:
+        tuple[datetime, UUID, dict[UUID, datetime]]: The timestamp and the unique
+            identifier of the newest row returned so far, and the timestamps of
+            the rows already returned near it.
+
+    Raises:
+        HTTPException: If the cursor is malformed or was created for a different ordering.
+    """
+    sort_value, row_id, payload = _decode_payload(cursor=cursor, sort_key=sort_key)
+    try:
+        if not isinstance(sort_value, datetime):
+            raise TypeError("Sync cursor does not point to a timestamp")
+
+        seen = {
+            UUID(seen_id): sort_value - timedelta(microseconds=age)
+            for seen_id, age in payload.get("seen", [])
+        }
+    except (TypeError, ValueError, OverflowError):
+        logger.error(f"Invalid sync cursor {cursor} for ordering by {sort_key}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    logger.info(f"Decoded sync cursor for row {row_id} ordered by {sort_key}")
+
+    return sort_value, row_id, seen
+
+
+def _decode_payload(cursor: str, sort_key: str) -> tuple[str | datetime, UUID, dict]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["key"] != sort_key:
+            raise ValueError(f"Cursor is ordered by {payload['key']}")
+
+        sort_value = payload["value"]
+        if payload["datetime"]:
+            sort_value = datetime.fromisoformat(sort_value)
+        expected_type = SORT_VALUE_TYPES.get(sort_key, str)
+        if not isinstance(sort_value, expected_type):
+            raise TypeError(f"Cursor value is not a {expected_type.__name__}")
+        row_id = UUID(payload["id"])
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        logger.error(f"Invalid cursor {cursor} for ordering by {sort_key}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    return sort_value, row_id, payload
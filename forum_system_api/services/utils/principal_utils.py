@@ -0,0 +1,90 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.user import User
+
+PRINCIPAL_KEY = "principal"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Principal:
+    """
+    The identity of the user making the current request.
+
+    The user and their admin flag are loaded on first use, so a request whose
+    handler only needs the user ID does not query them.
+
+    Attributes:
+        user_id (UUID): The unique identifier of the authenticated user.
+        load_user (Callable[[], User]): Loads the authenticated user.
+        load_is_admin (Callable[[], bool]): Checks whether the user has admin privileges.
+        last_write_at (float | None): The UNIX time at which the request last
+            committed a write, or None if it did not write.
+    """
+
+    user_id: UUID
+    load_user: Callable[[], User] = field(repr=False)
+    load_is_admin: Callable[[], bool] = field(repr=False)
+    last_write_at: float | None = None
+
+    @cached_property
+    def user(self) -> User:
+        return self.load_user()
+
+    @cached_property
+    def is_admin(self) -> bool:
+        return self.load_is_admin()
+
+
+def set_principal(principal: Principal, db: Session) -> None:
+    """
+    Attaches the principal to the database session of the current request.
+
+    Args:
+        principal (Principal): The identity of the user making the request.
+        db (Session): The database session of the request.
+    """
+    db.info[PRINCIPAL_KEY] = principal
+    logger.info(f"Attached principal for user {principal.user_id} to the session")
+
+
+def get_principal(user_id: UUID, db: Session) -> Principal | None:
+    """
+    Retrieves the principal attached to the database session, if it belongs to the given user.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        db (Session): The database session of the request.
+
+    Returns:
+        Principal | None: The principal of the user if it was resolved for this request,
+            otherwise None.
+    """
+    principal = db.info.get(PRINCIPAL_KEY)
+    if not isinstance(principal, Principal) or principal.user_id != user_id:
+        return None
+
+    return principal
+
+
+@event.listens_for(Session, "after_commit")
+def _pin_principal_reads(db: Session) -> None:
+    """
+    Records on the request's principal that it committed a write, so the
+    response pins the client's reads to the primary database.
+
+    Args:
+        db (Session): The database session that was committed.
+    """
+    principal = db.info.get(PRINCIPAL_KEY)
+    if isinstance(principal, Principal):
+        principal.last_write_at = time.time()
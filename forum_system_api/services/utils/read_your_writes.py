@@ -0,0 +1,141 @@
+import hashlib
+import hmac
+import logging
+import time
+
+from fastapi import Request, Response
+
+from forum_system_api.config import READ_YOUR_WRITES_SECONDS, SECRET_KEY
+
+LAST_WRITE_HEADER = "X-Last-Write-At"
+LAST_WRITE_COOKIE = "last_write_at"
+PRINCIPAL_STATE = "principal"
+CLOCK_SKEW_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+def requires_primary(request: Request) -> bool:
+    """
+    Checks whether the client making the request wrote recently and must read from the primary.
+
+    The time of the client's last write is taken from the X-Last-Write-At
+    header, or from the last_write_at cookie set on the response to the write,
+    so the pin holds whichever worker serves the next request. Values that were
+    not signed by a worker, or that lie further in the future than the clock
+    skew between workers allows, are ignored.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        bool: True if the request should be served by the primary database, otherwise False.
+    """
+    value = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+    last_write_at = _decode_last_write(value)
+    if last_write_at is None:
+        return False
+
+    now = time.time()
+    if last_write_at > now + CLOCK_SKEW_SECONDS:
+        logger.warning("Ignored a last write time in the future")
+        return False
+
+    return now - last_write_at < READ_YOUR_WRITES_SECONDS
+
+
+def pin_reads(response: Response, last_write_at: float) -> None:
+    """
+    Tells the client to send its next reads to the primary database for the configured window.
+
+    Args:
+        response (Response): The response to the request that committed the write.
+        last_write_at (float): The UNIX time at which the write was committed.
+    """
+    value = _encode_last_write(last_write_at)
+    response.headers[LAST_WRITE_HEADER] = value
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        value,
+        max_age=READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+    logger.info("Pinned the reads of the client to the primary database")
+
+
+async def pin_reads_middleware(request: Request, call_next) -> Response:
+    """
+    Pins the client's reads to the primary database once the request committed a write.
+
+    The write is recorded on the principal of the request when its database
+    session commits.
+
+    Args:
+        request (Request): The incoming request.
+        call_next: Passes the request on to the application.
+
+    Returns:
+        Response: The response of the application.
+    """
+    response = await call_next(request)
+
+    principal = getattr(request.state, PRINCIPAL_STATE, None)
+    last_write_at = getattr(principal, "last_write_at", None)
+    if last_write_at is not None:
+        pin_reads(response=response, last_write_at=last_write_at)
+
+    return response
+
+
+def _encode_last_write(last_write_at: float) -> str:
+    """
+    Encodes the time of a write together with its signature.
+
+    Args:
+        last_write_at (float): The UNIX time at which the write was committed.
+
+    Returns:
+        str: The time followed by its signature, separated by a dot.
+    """
+    timestamp = f"{last_write_at:.6f}"
+    return f"{timestamp}.{_sign(timestamp)}"
+
+
+def _decode_last_write(value: str | None) -> float | None:
+    """
+    Decodes the time of a write sent back by the client, if its signature is valid.
+
+    Args:
+        value (str | None): The value of the header or cookie.
+
+    Returns:
+        float | None: The UNIX time of the write, or None if the value is missing,
+            malformed or not signed by a worker.
+    """
+    if not value:
+        return None
+
+    timestamp, _, signature = value.rpartition(".")
+    if not hmac.compare_digest(signature, _sign(timestamp)):
+        return None
+
+    try:
+        return float(timestamp)
+    except ValueError:
+        return None
+
+
+def _sign(timestamp: str) -> str:
+    """
+    Signs the time of a write with the secret key.
+
+    Args:
+        timestamp (str): The formatted UNIX time of the write.
+
+    Returns:
+        str: The hex-encoded HMAC-SHA256 signature.
+    """
+    return hmac.new(SECRET_KEY.encode(), timestamp.encode(), hashlib.sha256).hexdigest()
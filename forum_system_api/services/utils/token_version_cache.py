@@ -0,0 +1,49 @@
+import logging
+from uuid import UUID
+
+from forum_system_api.config import (
+    TOKEN_VERSION_CACHE_MAX_SIZE,
+    TOKEN_VERSION_CACHE_TTL_SECONDS,
+)
+from forum_system_api.services.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_token_versions: TTLCache[UUID, UUID] = TTLCache(
+    ttl_seconds=TOKEN_VERSION_CACHE_TTL_SECONDS,
+    max_size=TOKEN_VERSION_CACHE_MAX_SIZE,
+)
+
+
+def get_token_version(user_id: UUID) -> UUID | None:
+    """
+    Retrieves the cached token version of a user.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+
+    Returns:
+        UUID | None: The token version of the user, or None if it is not cached
+            or the cached entry has expired.
+    """
+    return _token_versions.get(user_id)
+
+
+def set_token_version(user_id: UUID, token_version: UUID) -> None:
+    """
+    Caches the token version of a user for the configured time to live.
+
+    Args:
+        user_id (UUID): The unique identifier of the user.
+        token_version (UUID): The current token version of the user.
+    """
+    _token_versions.set(user_id, token_version)
+    logger.info(f"Cached token version for user {user_id}")
+
+
+def clear_token_versions() -> None:
+    """
+    Removes all cached token versions.
+    """
+    _token_versions.clear()
+    logger.info("Cleared all cached token versions")
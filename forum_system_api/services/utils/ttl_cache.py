@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A thread-safe, size-bounded in-process cache whose entries expire after a fixed time.
+
+    Attributes:
+        ttl_seconds (float): How long an entry stays valid after it is set.
+        max_size (int): The maximum number of entries kept in the cache.
+
+    Methods:
+        get(key): Returns the value for the key, or None if it is missing or expired.
+        set(key, value): Stores the value for the key.
+        invalidate(key): Removes the entry for the key.
+        clear(): Removes all entries.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: dict[K, tuple[V, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_size:
+                self._evict(now=now)
+            self._entries[key] = (value, now + self.ttl_seconds)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        """
+        Makes room by dropping the expired entries, or the oldest entry
+        if none of them has expired. Must be called with the lock held.
+        """
+        expired = [
+            key for key, (_, expires_at) in self._entries.items() if expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+
+        if not expired and self._entries:
+            del self._entries[next(iter(self._entries))]
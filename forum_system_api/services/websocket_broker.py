@@ -0,0 +1,361 @@
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import Engine, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from forum_system_api.config import WEBSOCKET_BROKER, WEBSOCKET_BROKER_CHANNEL
+from forum_system_api.persistence.database import engine
+from forum_system_api.persistence.models.websocket_payload import WebSocketPayload
+
+MAX_NOTIFY_PAYLOAD_BYTES = 7999
+STORED_PAYLOAD_RETENTION = timedelta(seconds=60)
+RECONNECT_INITIAL_DELAY_SECONDS = 1.0
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+USER_RECEIVER = "user"
+TOPIC_RECEIVER = "topic"
+BROADCAST_RECEIVER = "all"
+BROADCAST_RECEIVER_ID = UUID(int=0)
+
+MessageHandler = Callable[[str, UUID, str, str | None], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+class Broker(ABC):
+    """
+    Carries WebSocket messages to the worker that holds the receiver's connection.
+
+    Any worker can publish a message. Every worker subscribes a handler, which
+    is called with the messages published by all workers and delivers those
+    whose receiver is connected to it. A receiver is a user ("user"), the
+    subscribers of a topic ("topic") or every connected user ("all", published
+    with BROADCAST_RECEIVER_ID). Messages with the same
+    coalesce key supersede each other, so only the latest one queued on a
+    connection needs to be sent.
+
+    Methods:
+        subscribe(handler: MessageHandler) -> None:
+            Sets the handler called with every published message.
+
+        start() -> None:
+            Starts receiving published messages.
+
+        stop() -> None:
+            Stops receiving published messages.
+
+        publish(receiver_id: UUID, message: str, receiver_type: str, coalesce_key: str | None) -> None:
+            Publishes a message for a user or topic to all workers.
+    """
+
+    def __init__(self) -> None:
+        self._handler: MessageHandler | None = None
+
+    def subscribe(self, handler: MessageHandler) -> None:
+        self._handler = handler
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(
+        self,
+        receiver_id: UUID,
+        message: str,
+        receiver_type: str = USER_RECEIVER,
+        coalesce_key: str | None = None,
+    ) -> None:
+        pass
+
+    async def _handle(
+        self,
+        receiver_type: str,
+        receiver_id: UUID,
+        message: str,
+        coalesce_key: str | None = None,
+    ) -> None:
+        if self._handler is None:
+            logger.error(
+                f"No handler subscribed, dropping message to {receiver_type} {receiver_id}."
+            )
+            return
+
+        await self._handler(receiver_type, receiver_id, message, coalesce_key)
+
+
+class InMemoryBroker(Broker):
+    """
+    Delivers published messages within the current process.
+
+    Suitable when the application runs a single worker.
+    """
+
+    async def publish(
+        self,
+        receiver_id: UUID,
+        message: str,
+        receiver_type: str = USER_RECEIVER,
+        coalesce_key: str | None = None,
+    ) -> None:
+        await self._handle(
+            receiver_type=receiver_type,
+            receiver_id=receiver_id,
+            message=message,
+            coalesce_key=coalesce_key,
+        )
+
+
+class PostgresBroker(Broker):
+    """
+    Delivers published messages to all workers through Postgres LISTEN/NOTIFY.
+
+    Each worker listens on the channel with a dedicated connection that is
+    read on the event loop. If that connection fails, the worker connects
+    and listens again, waiting longer after each failed attempt. Messages
+    published in the meantime are not received; clients catch up with a
+    `since` cursor.
+
+    Messages are published with pg_notify through the application's
+    connection pool. Postgres limits notification payloads to 8000 bytes, so
+    larger messages are stored in the websocket_payloads table and only
+    their ID is notified. The listeners load the stored payload.
+
+    Attributes:
+        engine (Engine): The engine used to open the connections.
+        channel (str): The name of the notification channel.
+    """
+
+    def __init__(self, engine: Engine, channel: str) -> None:
+        super().__init__()
+        self.engine = engine
+        self.channel = channel
+        self._connection = None
+        self._fileno: int | None = None
+        self._reconnect: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """
+        Opens the listening connection and starts reading notifications from it.
+        """
+        if self._connection is not None or self._reconnect is not None:
+            return
+
+        self._connection = await asyncio.to_thread(self._listen)
+        self._add_reader()
+        logger.info(f"Listening for WebSocket messages on channel {self.channel}.")
+
+    async def stop(self) -> None:
+        """
+        Stops reading notifications and closes the listening connection.
+        """
+        if self._reconnect is not None:
+            self._reconnect.cancel()
+            self._reconnect = None
+
+        if self._connection is None:
+            return
+
+        self._close_connection()
+        logger.info(f"Stopped listening on channel {self.channel}.")
+
+    async def publish(
+        self,
+        receiver_id: UUID,
+        message: str,
+        receiver_type: str = USER_RECEIVER,
+        coalesce_key: str | None = None,
+    ) -> None:
+        """
+        Publishes a message for a user or topic to all workers.
+
+        Args:
+            receiver_id (UUID): The unique identifier of the user or topic.
+            message (str): The message to be delivered.
+            receiver_type (str): Whether the receiver is a "user" or a "topic".
+            coalesce_key (str | None): The key of the messages this one supersedes.
+        """
+        payload = json.dumps(
+            {
+                "receiver_type": receiver_type,
+                "receiver_id": str(receiver_id),
+                "message": message,
+                "coalesce_key": coalesce_key,
+            },
+            ensure_ascii=False,
+        )
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD_BYTES:
+            logger.info(
+                f"Message to {receiver_type} {receiver_id} exceeds the notification "
+                "payload limit, notifying its stored payload instead."
+            )
+            await asyncio.to_thread(self._store_and_notify, payload)
+            return
+
+        await asyncio.to_thread(self._notify, payload)
+
+    def _listen(self):
+        connection = self.engine.raw_connection()
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+
+        return dbapi_connection
+
+    def _notify(self, payload: str) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(select(func.pg_notify(self.channel, payload)))
+
+    def _store_and_notify(self, payload: str) -> None:
+        """
+        Stores a payload too large for a notification and notifies its ID.
+
+        The payloads older than STORED_PAYLOAD_RETENTION are deleted in
+        the same transaction, as every listener has loaded them by then.
+
+        Args:
+            payload (str): The serialized notification payload.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(
+                delete(WebSocketPayload).where(
+                    WebSocketPayload.created_at < func.now() - STORED_PAYLOAD_RETENTION
+                )
+            )
+            payload_id = connection.execute(
+                insert(WebSocketPayload)
+                .values(payload=payload)
+                .returning(WebSocketPayload.id)
+            ).scalar_one()
+            connection.execute(
+                select(
+                    func.pg_notify(
+                        self.channel, json.dumps({"payload_id": str(payload_id)})
+                    )
+                )
+            )
+
+    def _load_payload(self, payload_id: UUID) -> str | None:
+        with self.engine.connect() as connection:
+            return connection.execute(
+                select(WebSocketPayload.payload).where(
+                    WebSocketPayload.id == payload_id
+                )
+            ).scalar_one_or_none()
+
+    def _read_notifications(self) -> None:
+        try:
+            self._connection.poll()
+        except self.engine.dialect.loaded_dbapi.Error as e:
+            logger.error(
+                f"Lost the connection listening on channel {self.channel}. Error: {e}"
+            )
+            self._close_connection()
+            self._reconnect = asyncio.create_task(self._listen_again())
+            return
+
+        while self._connection.notifies:
+            notification = self._connection.notifies.pop(0)
+            task = asyncio.create_task(self._handle_notification(notification.payload))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _handle_notification(self, notification: str) -> None:
+        """
+        Delivers a notified message, loading its payload first if it was stored.
+
+        Args:
+            notification (str): The payload of the notification.
+        """
+        try:
+            payload = json.loads(notification)
+            if "payload_id" in payload:
+                payload_id = UUID(payload["payload_id"])
+                stored = await asyncio.to_thread(self._load_payload, payload_id)
+                if stored is None:
+                    logger.error(f"Stored payload {payload_id} not found.")
+                    return
+                payload = json.loads(stored)
+
+            receiver_type = payload.get("receiver_type", USER_RECEIVER)
+            receiver_id = UUID(payload["receiver_id"])
+            message = payload["message"]
+            coalesce_key = payload.get("coalesce_key")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Ignoring malformed notification. Error: {e}")
+            return
+
+        await self._handle(
+            receiver_type=receiver_type,
+            receiver_id=receiver_id,
+            message=message,
+            coalesce_key=coalesce_key,
+        )
+
+    async def _listen_again(self) -> None:
+        """
+        Opens a new listening connection, waiting longer after each failed attempt.
+        """
+        delay = RECONNECT_INITIAL_DELAY_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                self._connection = await asyncio.to_thread(self._listen)
+            except (SQLAlchemyError, self.engine.dialect.loaded_dbapi.Error) as e:
+                logger.error(
+                    f"Failed to listen on channel {self.channel} again, retrying "
+                    f"in {delay} seconds. Error: {e}"
+                )
+                delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+                continue
+
+            self._add_reader()
+            self._reconnect = None
+            logger.info(f"Listening on channel {self.channel} again.")
+            return
+
+    def _add_reader(self) -> None:
+        self._fileno = self._connection.fileno()
+        asyncio.get_running_loop().add_reader(self._fileno, self._read_notifications)
+
+    def _close_connection(self) -> None:
+        connection, self._connection = self._connection, None
+        asyncio.get_running_loop().remove_reader(self._fileno)
+        self._fileno = None
+        try:
+            connection.close()
+        except self.engine.dialect.loaded_dbapi.Error as e:
+            logger.error(f"Failed to close the listening connection. Error: {e}")
+
+
+def create_broker(name: str = WEBSOCKET_BROKER) -> Broker:
+    """
+    Creates the broker configured for the application.
+
+    Args:
+        name (str): The name of the broker, "memory" or "postgres".
+
+    Returns:
+        Broker: The broker.
+
+    Raises:
+        ValueError: If the broker name is unknown.
+    """
+    if name == "memory":
+        return InMemoryBroker()
+
+    if name == "postgres":
+        return PostgresBroker(engine=engine, channel=WEBSOCKET_BROKER_CHANNEL)
+
+    raise ValueError(f"Unknown WebSocket broker: {name}")
@@ -1,71 +1,554 @@
+import asyncio
+import json
 import logging
-from uuid import UUID
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterable
+from uuid import UUID, uuid4
 
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
+from pydantic import BaseModel
 
-from forum_system_api.schemas.message import MessageResponse
+from forum_system_api.config import (
+    WEBSOCKET_BATCH_WINDOW_SECONDS,
+    WEBSOCKET_BROADCAST_CONCURRENCY,
+    WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS,
+    WEBSOCKET_IDLE_TIMEOUT_SECONDS,
+    WEBSOCKET_MAX_CONNECTIONS_PER_USER,
+    WEBSOCKET_MAX_TOPIC_SUBSCRIPTIONS,
+    WEBSOCKET_SEND_QUEUE_OVERFLOW,
+    WEBSOCKET_SEND_QUEUE_SIZE,
+)
+from forum_system_api.services.websocket_broker import (
+    BROADCAST_RECEIVER,
+    BROADCAST_RECEIVER_ID,
+    TOPIC_RECEIVER,
+    Broker,
+    InMemoryBroker,
+    create_broker,
+)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (DROP_OLDEST, DISCONNECT)
+
+TopicAccessCheck = Callable[
+    [UUID, list["WebSocketConnection"]], Awaitable[list["WebSocketConnection"]]
+]
+
+PING_FRAME = json.dumps({"type": "ping"})
+PONG_FRAME = json.dumps({"type": "pong"})
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class OutboundMessage:
+    """
+    A message waiting to be sent on a connection.
+
+    Attributes:
+        message (str): The serialized message.
+        coalesce_key (str | None): The key shared by the messages this one
+            supersedes, e.g. the earlier vote counts of the same reply.
+        is_control (bool): Whether the message is a ping or pong, which is
+            always sent in its own frame.
+    """
+
+    message: str
+    coalesce_key: str | None = None
+    is_control: bool = False
+
+
+@dataclass(eq=False)
+class WebSocketConnection:
+    """
+    A WebSocket connection of a user.
+
+    A user can hold several connections at once, e.g. from a phone and a browser.
+    Outgoing messages wait in the connection's queue until its writer task
+    sends them, so a slow client only delays its own messages.
+
+    Attributes:
+        user_id (UUID): The unique identifier of the user.
+        websocket (WebSocket): The WebSocket of the connection.
+        queue (asyncio.Queue[OutboundMessage]): The messages waiting to be sent.
+        id (UUID): The unique identifier of the connection.
+        connected_at (datetime): When the connection was registered.
+        last_seen_at (float): The monotonic time the client last sent a frame.
+        topics (set[UUID]): The topics the connection is subscribed to.
+        writer (asyncio.Task | None): The task sending the queued messages.
+        closed (bool): Whether the connection was disconnected.
+    """
+
+    user_id: UUID
+    websocket: WebSocket
+    queue: asyncio.Queue[OutboundMessage] = field(default_factory=asyncio.Queue)
+    id: UUID = field(default_factory=uuid4)
+    connected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_seen_at: float = field(default_factory=time.monotonic)
+    topics: set[UUID] = field(default_factory=set)
+    writer: asyncio.Task | None = None
+    closed: bool = False
+
+
+@dataclass(frozen=True)
+class WebSocketStats:
+    """
+    A snapshot of the WebSocket connections held by a worker.
+
+    Attributes:
+        users (int): The number of connected users.
+        connections (int): The number of open connections.
+        queue_size (int): The capacity of each connection's outbound queue.
+        queued_messages (int): The number of messages waiting in all queues.
+        max_queue_depth (int): The number of messages in the fullest queue.
+        dropped_messages (int): The number of messages dropped from full queues.
+        overflow_disconnects (int): The number of connections closed because
+            their queue was full.
+        idle_disconnects (int): The number of connections closed by the reaper
+            because the socket was closed or, with an idle timeout, the client
+            stopped responding.
+        subscribed_topics (int): The number of topics with subscribers.
+        coalesced_messages (int): The number of messages not sent because a
+            later message in the same batch superseded them.
+    """
+
+    users: int
+    connections: int
+    queue_size: int
+    queued_messages: int
+    max_queue_depth: int
+    dropped_messages: int
+    overflow_disconnects: int
+    idle_disconnects: int
+    subscribed_topics: int
+    coalesced_messages: int
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections for users.
 
+    Each user can hold up to WEBSOCKET_MAX_CONNECTIONS_PER_USER connections,
+    and messages to the user are sent to all of them. Messages are published
+    through a broker, so they reach the receiver even when their connections
+    are held by another worker.
+
+    Every connection has a bounded outbound queue drained by its own writer
+    task. When a queue is full, the overflow policy either drops the oldest
+    queued message ("drop_oldest") or closes the connection ("disconnect").
+    The writer collects the messages queued within the batch window and sends
+    them as a single JSON array frame, skipping the messages superseded by a
+    later one with the same coalesce key. A lone message is sent as is.
+
+    While started, a reaper removes the connections whose socket was closed
+    each heartbeat interval. Dead peers are detected by the protocol-level
+    pings of the server. With an idle timeout, the reaper also pings every
+    connection with nothing queued and closes the connections whose client
+    has not sent anything within the timeout. Pings and pongs are sent in
+    their own frames and never take the place of a queued message.
+
+    A connection can subscribe to up to WEBSOCKET_MAX_TOPIC_SUBSCRIPTIONS
+    topics. Topic events are published through the broker as well and queued
+    on every subscribed connection. Callers must check that the user can read
+    a topic before subscribing them to it. Access can be revoked while the
+    connection is subscribed, so a topic access check, when set, filters the
+    subscribers again before each event is queued.
+
     Methods:
-        connect(websocket: WebSocket, user_id: UUID) -> None:
+        start() -> None:
+            Starts receiving the messages published by all workers and starts the reaper.
+
+        stop() -> None:
+            Stops the reaper and receiving the messages published by other workers.
+
+        connect(websocket: WebSocket, user_id: UUID) -> WebSocketConnection:
             Adds a new WebSocket connection for a user.
 
-        disconnect(user_id: UUID) -> None:
-            Removes the WebSocket connection for a user.
+        disconnect(connection: WebSocketConnection) -> None:
+            Removes and closes a WebSocket connection.
+
+        get_connections(user_id: UUID) -> list[WebSocketConnection]:
+            Returns the connections of a user held by this worker.
+
+        get_stats() -> WebSocketStats:
+            Returns the connection and outbound queue counts of this worker.
+
+        subscribe(connection: WebSocketConnection, topic_id: UUID) -> bool:
+            Subscribes a connection to the events of a topic.
+
+        unsubscribe(connection: WebSocketConnection, topic_id: UUID) -> None:
+            Unsubscribes a connection from the events of a topic.
+
+        get_subscribers(topic_id: UUID) -> list[WebSocketConnection]:
+            Returns the connections subscribed to a topic on this worker.
+
+        set_topic_access_check(check: TopicAccessCheck | None) -> None:
+            Sets the check that filters the subscribers of a topic before an event is queued.
+
+        handle_message(connection: WebSocketConnection, message: str) -> dict | None:
+            Handles a frame received from a client.
+
+        reap_connections() -> int:
+            Closes the dead and, with an idle timeout, the idle connections and pings the others.
 
         close_connection(websocket: WebSocket) -> None:
             Closes the WebSocket connection if it is in the WebSocketState.CONNECTED state.
 
-        send_message_as_json(message: MessageResponse, receiver_id: UUID) -> None:
-            Sends a MessageResponse object as JSON to a specific user via their WebSocket connection.
+        send_message_as_json(message: BaseModel, receiver_id: UUID) -> None:
+            Sends a message or event as JSON to all connections of a specific user.
 
         send_message(message: str, receiver_id: UUID) -> None:
-            Sends a message to a specific user via their WebSocket connection.
+            Sends a message to all connections of a specific user.
+
+        broadcast(message: BaseModel, receiver_ids: Iterable[UUID] | None) -> None:
+            Sends a message or event as JSON to many users, serializing it once.
+
+        send_to_connection(connection: WebSocketConnection, message: BaseModel) -> None:
+            Sends a message or event as JSON to a single connection.
+
+        send_topic_event(event: BaseModel, topic_id: UUID) -> None:
+            Sends an event as JSON to all connections subscribed to a topic.
     """
 
-    def __init__(self) -> None:
-        self._active_connections: dict[UUID, WebSocket] = {}
+    def __init__(
+        self,
+        broker: Broker | None = None,
+        max_connections_per_user: int = WEBSOCKET_MAX_CONNECTIONS_PER_USER,
+        send_queue_size: int = WEBSOCKET_SEND_QUEUE_SIZE,
+        overflow_policy: str = WEBSOCKET_SEND_QUEUE_OVERFLOW,
+        heartbeat_interval_seconds: float = WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS,
+        idle_timeout_seconds: float = WEBSOCKET_IDLE_TIMEOUT_SECONDS,
+        max_topic_subscriptions: int = WEBSOCKET_MAX_TOPIC_SUBSCRIPTIONS,
+        batch_window_seconds: float = WEBSOCKET_BATCH_WINDOW_SECONDS,
+        broadcast_concurrency: int = WEBSOCKET_BROADCAST_CONCURRENCY,
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown send queue overflow policy: {overflow_policy}")
+
+        self._active_connections: dict[UUID, dict[UUID, WebSocketConnection]] = {}
+        self._topic_subscribers: dict[UUID, dict[UUID, WebSocketConnection]] = {}
+        self._max_topic_subscriptions = max_topic_subscriptions
+        self._max_connections_per_user = max_connections_per_user
+        self._send_queue_size = send_queue_size
+        self._overflow_policy = overflow_policy
+        self._heartbeat_interval_seconds = heartbeat_interval_seconds
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._batch_window_seconds = batch_window_seconds
+        self._broadcast_concurrency = broadcast_concurrency
+        self._reaper: asyncio.Task | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._topic_access_check: TopicAccessCheck | None = None
+        self._dropped_messages = 0
+        self._overflow_disconnects = 0
+        self._idle_disconnects = 0
+        self._coalesced_messages = 0
+        self._broker = broker if broker is not None else InMemoryBroker()
+        self._broker.subscribe(self._deliver)
 
-    async def connect(self, websocket: WebSocket, user_id: UUID) -> None:
+    async def start(self) -> None:
+        """
+        Starts receiving the messages published by all workers and starts the reaper.
         """
-        Establishes a WebSocket connection for a given user.
+        await self._broker.start()
+        if self._reaper is None and self._heartbeat_interval_seconds > 0:
+            self._reaper = asyncio.create_task(self._run_reaper())
 
-        If the user is already connected, the existing connection is closed before establishing a new one.
+    async def stop(self) -> None:
+        """
+        Stops the reaper and receiving the messages published by other workers.
+        """
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        await self._broker.stop()
+
+    async def connect(self, websocket: WebSocket, user_id: UUID) -> WebSocketConnection:
+        """
+        Registers a new WebSocket connection for a given user.
+
+        The user's other connections stay open. If the user already holds the
+        maximum number of connections, the oldest one is removed to make room
+        and its WebSocket closed in the background.
 
         Args:
             websocket (WebSocket): The WebSocket connection instance.
             user_id (UUID): The unique identifier of the user.
+
+        Returns:
+            WebSocketConnection: The registered connection.
         """
-        if user_id in self._active_connections:
+        connections = self._active_connections.setdefault(user_id, {})
+        while connections and len(connections) >= self._max_connections_per_user:
+            oldest = next(iter(connections.values()))
             logger.info(
-                f"User {user_id} is already connected. Closing existing connection."
+                f"User {user_id} reached {self._max_connections_per_user} connections. "
+                f"Closing the oldest connection {oldest.id}."
             )
-            await self.disconnect(user_id)
+            self._disconnect_later(oldest)
 
-        self._active_connections[user_id] = websocket
-        logger.info(f"User {user_id} connected from {websocket.client}.")
+        connection = WebSocketConnection(
+            user_id=user_id,
+            websocket=websocket,
+            queue=asyncio.Queue(maxsize=self._send_queue_size),
+        )
+        connection.writer = asyncio.create_task(self._write(connection))
+        self._active_connections.setdefault(user_id, {})[connection.id] = connection
+        logger.info(
+            f"User {user_id} connected from {websocket.client} "
+            f"with connection {connection.id}."
+        )
+
+        return connection
 
-    async def disconnect(self, user_id: UUID) -> None:
+    async def disconnect(self, connection: WebSocketConnection) -> None:
         """
-        Disconnects a user by their user_id.
+        Removes a connection from the active connections, stops its writer
+        task and closes its WebSocket. Messages still queued are discarded.
 
-        This method removes the user's websocket connection from the active connections
-        and closes the websocket connection if it exists.
+        Args:
+            connection (WebSocketConnection): The connection to disconnect.
+        """
+        self._remove(connection)
+        await self.close_connection(connection.websocket)
+
+    def _remove(self, connection: WebSocketConnection) -> None:
+        """
+        Marks a connection as closed, stops its writer task and removes it from
+        the active connections and topic subscriptions, without closing its WebSocket.
+
+        Args:
+            connection (WebSocketConnection): The connection to remove.
+        """
+        connection.closed = True
+        if (
+            connection.writer is not None
+            and connection.writer is not asyncio.current_task()
+        ):
+            connection.writer.cancel()
+
+        for topic_id in list(connection.topics):
+            self.unsubscribe(connection=connection, topic_id=topic_id)
+
+        connections = self._active_connections.get(connection.user_id, {})
+        if connections.pop(connection.id, None) is not None:
+            logger.info(
+                f"Connection {connection.id} of user {connection.user_id} "
+                "removed from the active connections."
+            )
+        if not connections:
+            self._active_connections.pop(connection.user_id, None)
+
+    def _disconnect_later(self, connection: WebSocketConnection) -> None:
+        """
+        Removes a connection at once and closes its WebSocket in a background task.
+
+        Closing waits for the client to answer the close frame, which a client
+        too slow to drain its queue may never do, so the caller must not wait for it.
+
+        Args:
+            connection (WebSocketConnection): The connection to disconnect.
+        """
+        self._remove(connection)
+        task = asyncio.create_task(self.close_connection(connection.websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def get_connections(self, user_id: UUID) -> list[WebSocketConnection]:
+        """
+        Returns the connections of a user held by this worker.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+
+        Returns:
+            list[WebSocketConnection]: The connections of the user, oldest first.
+        """
+        return list(self._active_connections.get(user_id, {}).values())
+
+    def get_stats(self) -> WebSocketStats:
+        """
+        Returns the connection and outbound queue counts of this worker.
+
+        Returns:
+            WebSocketStats: The current counts.
+        """
+        depths = [
+            connection.queue.qsize()
+            for connections in self._active_connections.values()
+            for connection in connections.values()
+        ]
+        return WebSocketStats(
+            users=len(self._active_connections),
+            connections=len(depths),
+            queue_size=self._send_queue_size,
+            queued_messages=sum(depths),
+            max_queue_depth=max(depths, default=0),
+            dropped_messages=self._dropped_messages,
+            overflow_disconnects=self._overflow_disconnects,
+            idle_disconnects=self._idle_disconnects,
+            subscribed_topics=len(self._topic_subscribers),
+            coalesced_messages=self._coalesced_messages,
+        )
+
+    def subscribe(self, connection: WebSocketConnection, topic_id: UUID) -> bool:
+        """
+        Subscribes a connection to the events of a topic.
 
         Args:
-            user_id (UUID): The unique identifier of the user to disconnect.
+            connection (WebSocketConnection): The connection to subscribe.
+            topic_id (UUID): The unique identifier of the topic.
+
+        Returns:
+            bool: True if the connection is subscribed, False if it already
+                holds the maximum number of subscriptions.
+        """
+        if topic_id in connection.topics:
+            return True
+
+        if len(connection.topics) >= self._max_topic_subscriptions:
+            logger.error(
+                f"Connection {connection.id} of user {connection.user_id} reached "
+                f"{self._max_topic_subscriptions} topic subscriptions."
+            )
+            return False
+
+        connection.topics.add(topic_id)
+        self._topic_subscribers.setdefault(topic_id, {})[connection.id] = connection
+        logger.info(
+            f"Connection {connection.id} of user {connection.user_id} "
+            f"subscribed to topic {topic_id}."
+        )
+        return True
+
+    def unsubscribe(self, connection: WebSocketConnection, topic_id: UUID) -> None:
         """
-        websocket = self._active_connections.pop(user_id, None)
-        logger.info(f"User {user_id} removed from the active connections.")
+        Unsubscribes a connection from the events of a topic.
 
-        await self.close_connection(websocket)
+        Args:
+            connection (WebSocketConnection): The connection to unsubscribe.
+            topic_id (UUID): The unique identifier of the topic.
+        """
+        connection.topics.discard(topic_id)
+        subscribers = self._topic_subscribers.get(topic_id, {})
+        if subscribers.pop(connection.id, None) is not None:
+            logger.info(
+                f"Connection {connection.id} of user {connection.user_id} "
+                f"unsubscribed from topic {topic_id}."
+            )
+        if not subscribers:
+            self._topic_subscribers.pop(topic_id, None)
+
+    def get_subscribers(self, topic_id: UUID) -> list[WebSocketConnection]:
+        """
+        Returns the connections subscribed to a topic on this worker.
+
+        Args:
+            topic_id (UUID): The unique identifier of the topic.
+
+        Returns:
+            list[WebSocketConnection]: The subscribed connections.
+        """
+        return list(self._topic_subscribers.get(topic_id, {}).values())
+
+    def set_topic_access_check(self, check: TopicAccessCheck | None) -> None:
+        """
+        Sets the check that filters the subscribers of a topic before an event is queued.
+
+        The check receives the topic ID and its subscribers on this worker and
+        returns the subscribers that can still read the topic. It is expected
+        to unsubscribe the others.
+
+        Args:
+            check (TopicAccessCheck | None): The check, or None to queue topic
+                events on every subscriber.
+        """
+        self._topic_access_check = check
+
+    async def handle_message(
+        self, connection: WebSocketConnection, message: str
+    ) -> dict | None:
+        """
+        Handles a frame received from a client.
+
+        Any frame shows that the client is alive. A ping from the client is
+        answered with a pong; pongs need no answer. Other JSON objects are
+        returned for the caller to handle.
+
+        Args:
+            connection (WebSocketConnection): The connection the frame arrived on.
+            message (str): The text of the frame.
+
+        Returns:
+            dict | None: The frame, or None if it was handled or is not a JSON object.
+        """
+        connection.last_seen_at = time.monotonic()
+        try:
+            frame = json.loads(message)
+        except ValueError:
+            return None
+
+        if not isinstance(frame, dict) or frame.get("type") == "pong":
+            return None
+
+        if frame.get("type") == "ping":
+            self._send_control(connection=connection, message=PONG_FRAME)
+            return None
+
+        return frame
+
+    async def reap_connections(self) -> int:
+        """
+        Closes the dead and, with an idle timeout, the idle connections and pings the others.
+
+        A connection is dead when its socket was closed. It is idle when its
+        client has not sent anything within the idle timeout, which a live
+        client avoids by answering the pings. Without an idle timeout, clients
+        are neither pinged nor closed for staying silent, so receive-only
+        clients keep working. The closed connections are removed at once and
+        their WebSockets closed in the background, so an unresponsive client
+        cannot stall the reaper.
+
+        Returns:
+            int: The number of connections closed.
+        """
+        now = time.monotonic()
+        connections = self._get_all_connections()
+        enforce_idle = self._idle_timeout_seconds > 0
+
+        reaped = 0
+        for connection in connections:
+            is_idle = (
+                enforce_idle
+                and now - connection.last_seen_at > self._idle_timeout_seconds
+            )
+            is_dead = connection.websocket.application_state != WebSocketState.CONNECTED
+            if is_idle or is_dead:
+                self._disconnect_later(connection)
+                reaped += 1
+                continue
+
+            if enforce_idle and connection.queue.empty():
+                self._send_control(connection=connection, message=PING_FRAME)
+
+        self._idle_disconnects += reaped
+        logger.info(
+            f"Reaped {reaped} of {len(connections)} WebSocket connections, "
+            f"{len(connections) - reaped} remain."
+        )
+
+        return reaped
+
+    async def _run_reaper(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval_seconds)
+            try:
+                await self.reap_connections()
+            except Exception as e:
+                logger.error(f"Failed to reap WebSocket connections. Error: {e}")
 
     async def close_connection(self, websocket: WebSocket | None) -> None:
         """
@@ -86,14 +569,13 @@ class WebSocketManager:
                     f"WebSocket connection from {websocket.client} is already closed. Error: {e}"
                 )
 
-    async def send_message_as_json(
-        self, message: MessageResponse, receiver_id: UUID
-    ) -> None:
+    async def send_message_as_json(self, message: BaseModel, receiver_id: UUID) -> None:
         """
         Sends a message to a specified receiver if they are connected.
 
         Args:
-            message (MessageResponse): The message to be sent.
+            message (BaseModel): The message or event to be sent, e.g. a
+                MessageResponse or a ReadReceiptEvent.
             receiver_id (UUID): The unique identifier of the receiver.
         """
         serialized_message = message.model_dump_json()
@@ -107,23 +589,271 @@ class WebSocketManager:
         """
         Sends a message to a specific receiver identified by receiver_id.
 
+        The message is published through the broker and delivered by the
+        worker that holds the receiver's connection.
+
         Args:
             message (str): The message to be sent.
             receiver_id (UUID): The unique identifier of the receiver.
         """
-        receiver = self._active_connections.get(receiver_id)
-        if (
-            receiver is not None
-            and receiver.application_state == WebSocketState.CONNECTED
-        ):
-            try:
-                logger.info(f"Sending message {message} to user {receiver_id}.")
-                await receiver.send_text(message)
-            except (RuntimeError, ConnectionError) as e:
+        await self._broker.publish(receiver_id=receiver_id, message=message)
+
+    async def broadcast(
+        self, message: BaseModel, receiver_ids: Iterable[UUID] | None = None
+    ) -> None:
+        """
+        Sends a message or event as JSON to many users, serializing it once.
+
+        The same serialized frame is published for every receiver, at most
+        WEBSOCKET_BROADCAST_CONCURRENCY publishes at a time. Without receivers,
+        the message is published once and delivered to every connected user
+        on all workers.
+
+        Args:
+            message (BaseModel): The message or event to be sent, e.g. an
+                AnnouncementEvent.
+            receiver_ids (Iterable[UUID] | None): The unique identifiers of the
+                receivers, or None to send to every connected user.
+        """
+        serialized_message = message.model_dump_json()
+        if receiver_ids is None:
+            logger.info(f"Broadcasting {serialized_message} to all users.")
+            await self._broker.publish(
+                receiver_id=BROADCAST_RECEIVER_ID,
+                message=serialized_message,
+                receiver_type=BROADCAST_RECEIVER,
+            )
+            return
+
+        pending = iter(dict.fromkeys(receiver_ids))
+
+        async def publish_pending() -> None:
+            for receiver_id in pending:
+                await self._broker.publish(
+                    receiver_id=receiver_id, message=serialized_message
+                )
+
+        logger.info(f"Broadcasting {serialized_message} to users.")
+        await asyncio.gather(
+            *(publish_pending() for _ in range(self._broadcast_concurrency))
+        )
+
+    async def send_to_connection(
+        self, connection: WebSocketConnection, message: BaseModel
+    ) -> None:
+        """
+        Sends a message or event as JSON to a single connection held by this worker.
+
+        Args:
+            connection (WebSocketConnection): The connection to send the message on.
+            message (BaseModel): The message or event to be sent.
+        """
+        await self._enqueue(connection=connection, message=message.model_dump_json())
+
+    async def send_topic_event(
+        self, event: BaseModel, topic_id: UUID, coalesce_key: str | None = None
+    ) -> None:
+        """
+        Sends an event as JSON to all connections subscribed to a topic.
+
+        The event is published through the broker and delivered by every
+        worker that holds a subscribed connection.
+
+        Args:
+            event (BaseModel): The event to be sent, e.g. a ReplyCreatedEvent.
+            topic_id (UUID): The unique identifier of the topic.
+            coalesce_key (str | None): The key shared by the events this one
+                supersedes. Only the latest event with the key in a batch is sent.
+        """
+        serialized_event = event.model_dump_json()
+        logger.info(f"Sending event {serialized_event} to topic {topic_id}.")
+
+        await self._broker.publish(
+            receiver_id=topic_id,
+            message=serialized_event,
+            receiver_type=TOPIC_RECEIVER,
+            coalesce_key=coalesce_key,
+        )
+
+    async def _deliver(
+        self,
+        receiver_type: str,
+        receiver_id: UUID,
+        message: str,
+        coalesce_key: str | None = None,
+    ) -> None:
+        """
+        Queues a published message on every connection of the receiver held by this worker.
+
+        Args:
+            receiver_type (str): Whether the receiver is a "user" or a "topic".
+            receiver_id (UUID): The unique identifier of the user or topic.
+            message (str): The message to be sent.
+            coalesce_key (str | None): The key shared by the messages this one supersedes.
+        """
+        if receiver_type == TOPIC_RECEIVER:
+            connections = self.get_subscribers(receiver_id)
+            if connections and self._topic_access_check is not None:
+                connections = await self._topic_access_check(receiver_id, connections)
+        elif receiver_type == BROADCAST_RECEIVER:
+            connections = self._get_all_connections()
+        else:
+            connections = self.get_connections(receiver_id)
+
+        for connection in connections:
+            await self._enqueue(
+                connection=connection, message=message, coalesce_key=coalesce_key
+            )
+
+    def _get_all_connections(self) -> list[WebSocketConnection]:
+        return [
+            connection
+            for user_connections in list(self._active_connections.values())
+            for connection in list(user_connections.values())
+        ]
+
+    async def _enqueue(
+        self,
+        connection: WebSocketConnection,
+        message: str,
+        coalesce_key: str | None = None,
+    ) -> None:
+        """
+        Queues a message on a connection, applying the overflow policy if its queue is full.
+
+        Args:
+            connection (WebSocketConnection): The connection to send the message on.
+            message (str): The message to be sent.
+            coalesce_key (str | None): The key shared by the messages this one supersedes.
+        """
+        if connection.closed:
+            return
+
+        if connection.queue.full():
+            if self._overflow_policy == DISCONNECT:
+                self._overflow_disconnects += 1
                 logger.error(
-                    f"Failed to send message to user {receiver_id}. Error: {e}"
+                    f"Send queue of connection {connection.id} of user "
+                    f"{connection.user_id} is full. Closing the connection."
                 )
-                await self.disconnect(receiver_id)
+                self._disconnect_later(connection)
+                return
+
+            connection.queue.get_nowait()
+            connection.queue.task_done()
+            self._dropped_messages += 1
+            logger.error(
+                f"Send queue of connection {connection.id} of user "
+                f"{connection.user_id} is full. Dropped the oldest message."
+            )
+
+        connection.queue.put_nowait(
+            OutboundMessage(message=message, coalesce_key=coalesce_key)
+        )
+
+    def _send_control(self, connection: WebSocketConnection, message: str) -> None:
+        """
+        Queues a ping or pong on a connection if its queue has room.
+
+        A control frame never evicts a queued message or trips the overflow
+        policy. It is skipped instead, as the queued messages already show
+        the client that the connection is alive.
+
+        Args:
+            connection (WebSocketConnection): The connection to send the frame on.
+            message (str): The ping or pong frame.
+        """
+        if connection.closed or connection.queue.full():
+            return
+
+        connection.queue.put_nowait(OutboundMessage(message=message, is_control=True))
+
+    async def _write(self, connection: WebSocketConnection) -> None:
+        """
+        Sends the queued messages of a connection until it fails or is disconnected.
+
+        The messages queued within the batch window after the first one are
+        sent together in a single frame. Pings and pongs are sent first, each
+        in its own frame.
+
+        However the writer stops, other than by being cancelled on disconnect,
+        the connection is removed and its WebSocket is closed in the background.
+
+        Args:
+            connection (WebSocketConnection): The connection to write to.
+        """
+        websocket = connection.websocket
+        try:
+            while True:
+                batch = [await connection.queue.get()]
+                try:
+                    if self._batch_window_seconds > 0:
+                        await asyncio.sleep(self._batch_window_seconds)
+                    while not connection.queue.empty():
+                        batch.append(connection.queue.get_nowait())
+
+                    if websocket.application_state != WebSocketState.CONNECTED:
+                        continue
+
+                    for outbound in batch:
+                        if outbound.is_control:
+                            await websocket.send_text(outbound.message)
+
+                    messages = [
+                        outbound for outbound in batch if not outbound.is_control
+                    ]
+                    if not messages:
+                        continue
+
+                    frame = self._encode_batch(messages)
+                    logger.info(
+                        f"Sending {len(messages)} messages to user {connection.user_id} "
+                        f"on connection {connection.id}."
+                    )
+                    await websocket.send_text(frame)
+                except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
+                    logger.error(
+                        f"Failed to send message on connection {connection.id} "
+                        f"of user {connection.user_id}. Error: {e}"
+                    )
+                    return
+                finally:
+                    for _ in batch:
+                        connection.queue.task_done()
+        finally:
+            if not connection.closed:
+                self._disconnect_later(connection)
+
+    def _encode_batch(self, batch: list[OutboundMessage]) -> str:
+        """
+        Encodes a batch of messages as a single frame.
+
+        Of the messages sharing a coalesce key, only the latest is kept, in its
+        own position. The messages are already serialized, so the JSON array is
+        built by joining them.
+
+        Args:
+            batch (list[OutboundMessage]): The messages in the order they were queued.
+
+        Returns:
+            str: The only message left, or a JSON array of the messages left.
+        """
+        latest = {
+            outbound.coalesce_key: index
+            for index, outbound in enumerate(batch)
+            if outbound.coalesce_key is not None
+        }
+        messages = [
+            outbound.message
+            for index, outbound in enumerate(batch)
+            if outbound.coalesce_key is None or latest[outbound.coalesce_key] == index
+        ]
+        self._coalesced_messages += len(batch) - len(messages)
+
+        if len(messages) == 1:
+            return messages[0]
+
+        return f"[{','.join(messages)}]"
 
 
-websocket_manager = WebSocketManager()
+websocket_manager = WebSocketManager(broker=create_broker())
@@ -45,6 +45,12 @@ ALTER TABLE IF EXISTS public.conversations DROP CONSTRAINT IF EXISTS conversatio
 
 ALTER TABLE IF EXISTS public.conversations DROP CONSTRAINT IF EXISTS conversations_user2_id_fkey;
 
+ALTER TABLE IF EXISTS public.conversation_read_cursors DROP CONSTRAINT IF EXISTS conversation_read_cursors_conversation_id_fkey;
+
+ALTER TABLE IF EXISTS public.conversation_read_cursors DROP CONSTRAINT IF EXISTS conversation_read_cursors_user_id_fkey;
+
+ALTER TABLE IF EXISTS public.conversation_read_cursors DROP CONSTRAINT IF EXISTS conversation_read_cursors_last_read_message_id_fkey;
+
 ALTER TABLE IF EXISTS public.messages DROP CONSTRAINT IF EXISTS messages_author_id_fkey;
 
 ALTER TABLE IF EXISTS public.messages DROP CONSTRAINT IF EXISTS messages_conversation_id_fkey;
@@ -69,6 +75,16 @@ ALTER TABLE IF EXISTS public.user_category_permissions DROP CONSTRAINT IF EXISTS
 
 
 
+DROP TABLE IF EXISTS public.alembic_version;
+
+CREATE TABLE IF NOT EXISTS public.alembic_version
+(
+    version_num character varying(32) COLLATE pg_catalog."default" NOT NULL,
+    CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num)
+);
+
+INSERT INTO public.alembic_version (version_num) VALUES ('0009');
+
 DROP TABLE IF EXISTS public.admins;
 
 CREATE TABLE IF NOT EXISTS public.admins
@@ -80,6 +96,15 @@ CREATE TABLE IF NOT EXISTS public.admins
     CONSTRAINT admins_user_id_key UNIQUE (user_id)
 );
 
+DROP TABLE IF EXISTS public.cache_versions;
+
+CREATE TABLE IF NOT EXISTS public.cache_versions
+(
+    name character varying(50) COLLATE pg_catalog."default" NOT NULL,
+    version bigint NOT NULL DEFAULT 0,
+    CONSTRAINT cache_versions_pkey PRIMARY KEY (name)
+);
+
 DROP TABLE IF EXISTS public.categories;
 
 CREATE TABLE IF NOT EXISTS public.categories
@@ -101,9 +126,14 @@ CREATE TABLE IF NOT EXISTS public.conversations
     created_at timestamp with time zone NOT NULL DEFAULT now(),
     user1_id uuid NOT NULL,
     user2_id uuid NOT NULL,
-    CONSTRAINT conversations_pkey PRIMARY KEY (id)
+    CONSTRAINT conversations_pkey PRIMARY KEY (id),
+    CONSTRAINT uq_conversations_user1_id_user2_id UNIQUE (user1_id, user2_id),
+    CONSTRAINT ck_conversations_ordered_participants CHECK (user1_id <= user2_id)
 );
 
+CREATE INDEX IF NOT EXISTS ix_conversations_user2_id_user1_id
+    ON public.conversations(user2_id, user1_id);
+
 DROP TABLE IF EXISTS public.messages;
 
 CREATE TABLE IF NOT EXISTS public.messages
@@ -116,6 +146,21 @@ CREATE TABLE IF NOT EXISTS public.messages
     CONSTRAINT messages_pkey PRIMARY KEY (id)
 );
 
+CREATE INDEX IF NOT EXISTS ix_messages_conversation_id_created_at_id
+    ON public.messages(conversation_id, created_at, id);
+
+DROP TABLE IF EXISTS public.conversation_read_cursors;
+
+CREATE TABLE IF NOT EXISTS public.conversation_read_cursors
+(
+    conversation_id uuid NOT NULL,
+    user_id uuid NOT NULL,
+    last_read_message_id uuid NOT NULL,
+    last_read_at timestamp with time zone NOT NULL,
+    updated_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT conversation_read_cursors_pkey PRIMARY KEY (conversation_id, user_id)
+);
+
 DROP TABLE IF EXISTS public.replies;
 
 CREATE TABLE IF NOT EXISTS public.replies
@@ -125,9 +170,14 @@ CREATE TABLE IF NOT EXISTS public.replies
     author_id uuid NOT NULL,
     topic_id uuid NOT NULL,
     created_at timestamp with time zone NOT NULL DEFAULT now(),
+    upvotes integer NOT NULL DEFAULT 0,
+    downvotes integer NOT NULL DEFAULT 0,
     CONSTRAINT replies_pkey PRIMARY KEY (id)
 );
 
+CREATE INDEX IF NOT EXISTS ix_replies_topic_id_created_at_id
+    ON public.replies(topic_id, created_at, id);
+
 DROP TABLE IF EXISTS public.reply_reactions;
 
 CREATE TABLE IF NOT EXISTS public.reply_reactions
@@ -139,6 +189,9 @@ CREATE TABLE IF NOT EXISTS public.reply_reactions
     CONSTRAINT reply_reactions_pkey PRIMARY KEY (user_id, reply_id)
 );
 
+CREATE INDEX IF NOT EXISTS ix_reply_reactions_reply_id_reaction
+    ON public.reply_reactions(reply_id, reaction);
+
 DROP TABLE IF EXISTS public.topics;
 
 CREATE TABLE IF NOT EXISTS public.topics
@@ -155,6 +208,18 @@ CREATE TABLE IF NOT EXISTS public.topics
     CONSTRAINT topics_title_key UNIQUE (title)
 );
 
+CREATE INDEX IF NOT EXISTS ix_topics_created_at_id
+    ON public.topics(created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_topics_title_id
+    ON public.topics(title, id);
+
+CREATE INDEX IF NOT EXISTS ix_topics_category_id_created_at_id
+    ON public.topics(category_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_topics_author_id_created_at_id
+    ON public.topics(author_id, created_at, id);
+
 DROP TABLE IF EXISTS public.user_category_permissions;
 
 CREATE TABLE IF NOT EXISTS public.user_category_permissions
@@ -165,6 +230,9 @@ CREATE TABLE IF NOT EXISTS public.user_category_permissions
     CONSTRAINT user_category_permissions_pkey PRIMARY KEY (user_id, category_id)
 );
 
+CREATE INDEX IF NOT EXISTS ix_user_category_permissions_category_id
+    ON public.user_category_permissions(category_id);
+
 DROP TABLE IF EXISTS public.users;
 
 CREATE TABLE IF NOT EXISTS public.users
@@ -183,6 +251,16 @@ CREATE TABLE IF NOT EXISTS public.users
     CONSTRAINT users_username_key UNIQUE (username)
 );
 
+DROP TABLE IF EXISTS public.websocket_payloads;
+
+CREATE TABLE IF NOT EXISTS public.websocket_payloads
+(
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    payload character varying COLLATE pg_catalog."default" NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT websocket_payloads_pkey PRIMARY KEY (id)
+);
+
 ALTER TABLE IF EXISTS public.admins
     ADD CONSTRAINT admins_user_id_fkey FOREIGN KEY (user_id)
     REFERENCES public.users (id) MATCH SIMPLE
@@ -220,6 +298,27 @@ ALTER TABLE IF EXISTS public.messages
     ON DELETE NO ACTION;
 
 
+ALTER TABLE IF EXISTS public.conversation_read_cursors
+    ADD CONSTRAINT conversation_read_cursors_conversation_id_fkey FOREIGN KEY (conversation_id)
+    REFERENCES public.conversations (id) MATCH SIMPLE
+    ON UPDATE NO ACTION
+    ON DELETE NO ACTION;
+
+
+ALTER TABLE IF EXISTS public.conversation_read_cursors
+    ADD CONSTRAINT conversation_read_cursors_user_id_fkey FOREIGN KEY (user_id)
+    REFERENCES public.users (id) MATCH SIMPLE
+    ON UPDATE NO ACTION
+    ON DELETE NO ACTION;
+
+
+ALTER TABLE IF EXISTS public.conversation_read_cursors
+    ADD CONSTRAINT conversation_read_cursors_last_read_message_id_fkey FOREIGN KEY (last_read_message_id)
+    REFERENCES public.messages (id) MATCH SIMPLE
+    ON UPDATE NO ACTION
+    ON DELETE NO ACTION;
+
+
 ALTER TABLE IF EXISTS public.replies
     ADD CONSTRAINT replies_author_id_fkey FOREIGN KEY (author_id)
     REFERENCES public.users (id) MATCH SIMPLE
@@ -332,10 +431,10 @@ INSERT INTO public.categories (id, name, is_private, is_locked, created_at) VALU
 
 INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('8caaa36e-f45c-400c-baa8-70f6e00850d9', '2024-10-30 06:02:40.969559+02', '799bc742-2f6b-45aa-a31f-c1d1150fba9f', 'a3039a40-8752-425e-933d-dabbea0b90c6');
 INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('0e9309cc-c81f-4631-af20-c5b0a40205de', '2024-11-03 08:48:51.438866+02', '799bc742-2f6b-45aa-a31f-c1d1150fba9f', 'd56b32df-fcbf-4c2b-9731-aa4bab8fda30');
-INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('d4238221-d3d4-4ecd-b7c6-109ef6c154c8', '2024-10-21 20:48:41.104691+03', '799bc742-2f6b-45aa-a31f-c1d1150fba9f', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433');
+INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('d4238221-d3d4-4ecd-b7c6-109ef6c154c8', '2024-10-21 20:48:41.104691+03', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433', '799bc742-2f6b-45aa-a31f-c1d1150fba9f');
 INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('003e181a-cffe-4285-93df-6f0c8f7b74f5', '2024-11-04 15:34:57.741071+02', 'a3039a40-8752-425e-933d-dabbea0b90c6', 'd56b32df-fcbf-4c2b-9731-aa4bab8fda30');
-INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('db4303f5-7ac4-4605-9c8e-64fa98b46e48', '2024-10-14 14:53:37.815099+03', 'a3039a40-8752-425e-933d-dabbea0b90c6', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433');
-INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('ad3044db-68b6-4a34-9635-6c7e46da9516', '2024-10-23 01:05:23.615292+03', 'd56b32df-fcbf-4c2b-9731-aa4bab8fda30', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433');
+INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('db4303f5-7ac4-4605-9c8e-64fa98b46e48', '2024-10-14 14:53:37.815099+03', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433', 'a3039a40-8752-425e-933d-dabbea0b90c6');
+INSERT INTO public.conversations (id, created_at, user1_id, user2_id) VALUES ('ad3044db-68b6-4a34-9635-6c7e46da9516', '2024-10-23 01:05:23.615292+03', '1f3ab016-794c-4ddf-9ba6-e6dc7816f433', 'd56b32df-fcbf-4c2b-9731-aa4bab8fda30');
 
 
 --
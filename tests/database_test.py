@@ -1,11 +1,123 @@
+import asyncio
 import unittest
 from typing import Type
 from unittest.mock import MagicMock, patch
 
-from sqlalchemy import Engine, create_engine, inspect
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Engine, UniqueConstraint, create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
-from forum_system_api.persistence.database import Base, create_tables, get_db
+from forum_system_api.persistence import database
+from forum_system_api.persistence.database import (
+    MIGRATIONS_PATH,
+    Base,
+    create_tables,
+    get_async_db,
+    get_db,
+    get_db_session,
+)
+
+BASELINE_DATABASE = "forum_baseline_migration_test"
+
+# The schema Base.metadata.create_all built before migrations were introduced.
+BASELINE_DDL = """
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+
+CREATE TYPE accesslevel AS ENUM ('READ', 'WRITE');
+
+CREATE TABLE users (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    username character varying(50) NOT NULL,
+    password_hash character varying(64) NOT NULL,
+    first_name character varying(50) NOT NULL,
+    last_name character varying(50) NOT NULL,
+    email character varying(255) NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    token_version uuid NOT NULL DEFAULT uuid_generate_v4(),
+    CONSTRAINT users_pkey PRIMARY KEY (id),
+    CONSTRAINT users_email_key UNIQUE (email),
+    CONSTRAINT users_token_version_key UNIQUE (token_version),
+    CONSTRAINT users_username_key UNIQUE (username)
+);
+
+CREATE TABLE admins (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    user_id uuid NOT NULL REFERENCES users (id),
+    CONSTRAINT admins_pkey PRIMARY KEY (id),
+    CONSTRAINT admins_user_id_key UNIQUE (user_id)
+);
+
+CREATE TABLE categories (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    name character varying(50) NOT NULL,
+    is_private boolean NOT NULL DEFAULT false,
+    is_locked boolean NOT NULL DEFAULT false,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT categories_pkey PRIMARY KEY (id),
+    CONSTRAINT categories_name_key UNIQUE (name)
+);
+
+CREATE TABLE topics (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    title character varying(255) NOT NULL,
+    content character varying(999) NOT NULL,
+    is_locked boolean NOT NULL DEFAULT false,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    author_id uuid NOT NULL REFERENCES users (id),
+    category_id uuid NOT NULL REFERENCES categories (id),
+    best_reply_id uuid,
+    CONSTRAINT topics_pkey PRIMARY KEY (id),
+    CONSTRAINT topics_title_key UNIQUE (title)
+);
+
+CREATE TABLE replies (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    content character varying NOT NULL,
+    author_id uuid NOT NULL REFERENCES users (id),
+    topic_id uuid NOT NULL REFERENCES topics (id),
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT replies_pkey PRIMARY KEY (id)
+);
+
+ALTER TABLE topics
+    ADD CONSTRAINT topics_best_reply_id_fkey FOREIGN KEY (best_reply_id)
+    REFERENCES replies (id);
+
+CREATE TABLE reply_reactions (
+    user_id uuid NOT NULL REFERENCES users (id),
+    reply_id uuid NOT NULL REFERENCES replies (id),
+    reaction boolean NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT reply_reactions_pkey PRIMARY KEY (user_id, reply_id)
+);
+
+CREATE TABLE user_category_permissions (
+    user_id uuid NOT NULL REFERENCES users (id),
+    category_id uuid NOT NULL REFERENCES categories (id),
+    access_level accesslevel NOT NULL,
+    CONSTRAINT user_category_permissions_pkey PRIMARY KEY (user_id, category_id)
+);
+
+CREATE TABLE conversations (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    user1_id uuid NOT NULL REFERENCES users (id),
+    user2_id uuid NOT NULL REFERENCES users (id),
+    CONSTRAINT conversations_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE messages (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    content character varying NOT NULL,
+    author_id uuid NOT NULL REFERENCES users (id),
+    conversation_id uuid NOT NULL REFERENCES conversations (id),
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT messages_pkey PRIMARY KEY (id)
+);
+"""
 
 
 class TestDatabase(unittest.TestCase):
@@ -36,17 +148,66 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNotNone(db)
         db.close()
 
+    def _create_baseline_engine(self) -> Engine:
+        server_engine = create_engine(database.engine.url, isolation_level="AUTOCOMMIT")
+        self.addCleanup(server_engine.dispose)
+        with server_engine.connect() as connection:
+            connection.execute(
+                text(f"DROP DATABASE IF EXISTS {BASELINE_DATABASE} WITH (FORCE)")
+            )
+            connection.execute(text(f"CREATE DATABASE {BASELINE_DATABASE}"))
+        self.addCleanup(self._drop_baseline_database, server_engine)
+
+        baseline_engine = create_engine(
+            database.engine.url.set(database=BASELINE_DATABASE)
+        )
+        self.addCleanup(baseline_engine.dispose)
+        with baseline_engine.begin() as connection:
+            connection.execute(text(BASELINE_DDL))
+
+        return baseline_engine
+
+    def _drop_baseline_database(self, server_engine: Engine) -> None:
+        with server_engine.connect() as connection:
+            connection.execute(
+                text(f"DROP DATABASE IF EXISTS {BASELINE_DATABASE} WITH (FORCE)")
+            )
+
+    def _schema_differences(self, connection) -> list:
+        differences = compare_metadata(
+            MigrationContext.configure(connection), Base.metadata
+        )
+        return [
+            difference
+            for difference in differences
+            if not self._is_primary_key_unique_constraint(difference)
+        ]
+
+    def _is_primary_key_unique_constraint(self, difference) -> bool:
+        if difference[0] != "add_constraint":
+            return False
+
+        constraint = difference[1]
+        primary_key = Base.metadata.tables[constraint.table.name].primary_key
+        return isinstance(constraint, UniqueConstraint) and set(
+            constraint.columns.keys()
+        ) == set(primary_key.columns.keys())
+
     def test_createTables_createsAllTables_onSuccess(self) -> None:
         # Arrange
         create_tables()
 
         # Act
-        inspector = inspect(self.engine)
+        inspector = inspect(database.engine)
         tables = inspector.get_table_names()
 
         # Assert
-        self.assertEqual(9, len(tables))
+        self.assertEqual(13, len(tables))
+        self.assertIn("alembic_version", tables)
         self.assertIn("admins", tables)
+        self.assertIn("cache_versions", tables)
+        self.assertIn("conversation_read_cursors", tables)
+        self.assertIn("websocket_payloads", tables)
         self.assertIn("users", tables)
         self.assertIn("categories", tables)
         self.assertIn("user_category_permissions", tables)
@@ -55,6 +216,26 @@ class TestDatabase(unittest.TestCase):
         self.assertIn("replies", tables)
         self.assertIn("reply_reactions", tables)
         self.assertIn("topics", tables)
+        with database.engine.connect() as connection:
+            self.assertEqual([], self._schema_differences(connection))
+
+    def test_createTables_upgradesStampedBaseline_toCurrentModels(self) -> None:
+        # Arrange
+        baseline_engine = self._create_baseline_engine()
+        head = ScriptDirectory(str(MIGRATIONS_PATH)).get_current_head()
+
+        # Act
+        with patch("forum_system_api.persistence.database.engine", baseline_engine):
+            create_tables()
+
+        # Assert
+        with baseline_engine.connect() as connection:
+            version = connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar_one()
+            differences = self._schema_differences(connection)
+        self.assertEqual(head, version)
+        self.assertEqual([], differences)
 
     @patch("forum_system_api.persistence.database.session_local")
     def test_get_db_closesSession_onExit(self, mock_session_local) -> None:
@@ -79,3 +260,112 @@ class TestDatabase(unittest.TestCase):
         # Act & Assert
         with self.assertRaises(StopIteration):
             next(db_gen)
+
+    @patch("forum_system_api.persistence.database.ASYNC_DATABASE_ENABLED", False)
+    def test_getDbSession_returnsGetDb_whenAsyncIsDisabled(self) -> None:
+        # Act
+        dependency = get_db_session()
+
+        # Assert
+        self.assertIs(dependency, get_db)
+
+    @patch("forum_system_api.persistence.database.ASYNC_DATABASE_ENABLED", True)
+    def test_getDbSession_returnsGetAsyncDb_whenAsyncIsEnabled(self) -> None:
+        # Act
+        dependency = get_db_session()
+
+        # Assert
+        self.assertIs(dependency, get_async_db)
+
+    @patch("forum_system_api.persistence.database.async_session_local", None)
+    def test_getAsyncDb_raisesRuntimeError_whenAsyncIsDisabled(self) -> None:
+        # Arrange
+        db_gen = get_async_db()
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            asyncio.run(db_gen.__anext__())
+
+    @patch("forum_system_api.persistence.database.command")
+    @patch("forum_system_api.persistence.database.inspect")
+    def test_createTables_stampsBaseline_whenDatabaseIsUnversioned(
+        self, mock_inspect, mock_command
+    ) -> None:
+        # Arrange
+        mock_inspect.return_value.get_table_names.return_value = ["users", "topics"]
+
+        # Act
+        create_tables()
+
+        # Assert
+        mock_command.stamp.assert_called_once()
+        self.assertEqual("0001", mock_command.stamp.call_args.args[1])
+        mock_command.upgrade.assert_called_once()
+        self.assertEqual("head", mock_command.upgrade.call_args.args[1])
+
+    @patch("forum_system_api.persistence.database.command")
+    @patch("forum_system_api.persistence.database.inspect")
+    def test_createTables_onlyUpgrades_whenDatabaseIsVersioned(
+        self, mock_inspect, mock_command
+    ) -> None:
+        # Arrange
+        mock_inspect.return_value.get_table_names.return_value = [
+            "users",
+            "alembic_version",
+        ]
+
+        # Act
+        create_tables()
+
+        # Assert
+        mock_command.stamp.assert_not_called()
+        mock_command.upgrade.assert_called_once()
+
+    def test_createTables_mergesSelfConversations_whenUpgradingBaseline(
+        self,
+    ) -> None:
+        # Arrange
+        baseline_engine = self._create_baseline_engine()
+        with baseline_engine.begin() as connection:
+            user_id = connection.execute(
+                text(
+                    "INSERT INTO users "
+                    "(username, password_hash, first_name, last_name, email) "
+                    "VALUES ('self', 'hash', 'Self', 'Self', 'self@example.com') "
+                    "RETURNING id"
+                )
+            ).scalar_one()
+            for _ in range(2):
+                connection.execute(
+                    text(
+                        "WITH conversation AS ("
+                        "INSERT INTO conversations (user1_id, user2_id) "
+                        "VALUES (:user_id, :user_id) RETURNING id) "
+                        "INSERT INTO messages (content, author_id, conversation_id) "
+                        "SELECT 'note', :user_id, id FROM conversation"
+                    ),
+                    {"user_id": user_id},
+                )
+
+        # Act
+        with patch("forum_system_api.persistence.database.engine", baseline_engine):
+            create_tables()
+
+        # Assert
+        with baseline_engine.connect() as connection:
+            conversation_ids = (
+                connection.execute(
+                    text("SELECT id FROM conversations WHERE user1_id = user2_id")
+                )
+                .scalars()
+                .all()
+            )
+            message_conversation_ids = (
+                connection.execute(
+                    text("SELECT DISTINCT conversation_id FROM messages")
+                )
+                .scalars()
+                .all()
+            )
+        self.assertEqual(1, len(conversation_ids))
+        self.assertEqual(conversation_ids, message_conversation_ids)
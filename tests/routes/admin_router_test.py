@@ -0,0 +1,140 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from forum_system_api.main import app
+from forum_system_api.persistence.models.user import User
+from forum_system_api.schemas.pool import PoolStatusResponse
+from forum_system_api.schemas.websocket import AnnouncementEvent
+from forum_system_api.services.auth_service import require_admin_role
+from forum_system_api.services.websocket_manager import WebSocketManager, WebSocketStats
+
+ADMIN_POOL_ENDPOINT = "/api/v1/admin/database/pool"
+ADMIN_WEBSOCKETS_ENDPOINT = "/api/v1/admin/websockets"
+ADMIN_ANNOUNCEMENTS_ENDPOINT = "/api/v1/admin/announcements"
+
+
+class AdminRouter_Should(unittest.TestCase):
+    client: TestClient
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = TestClient(app)
+
+    def setUp(self) -> None:
+        self.client = self.__class__.client
+        self.mock_admin = MagicMock(spec=User)
+        self.pool_status = PoolStatusResponse(
+            name="primary",
+            pool_size=5,
+            max_overflow=10,
+            checked_out=2,
+            idle=3,
+            overflow=0,
+            checkouts=20,
+            timeouts=0,
+            total_wait_seconds=0.5,
+            average_wait_seconds=0.025,
+            max_wait_seconds=0.1,
+        )
+
+    def tearDown(self) -> None:
+        app.dependency_overrides = {}
+
+    @patch("forum_system_api.services.pool_service.get_pool_statuses")
+    def test_getPoolStatus_returns200_onSuccess(self, mock_get_pool_statuses) -> None:
+        # Arrange
+        app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
+        mock_get_pool_statuses.return_value = [self.pool_status]
+
+        # Act
+        response = self.client.get(ADMIN_POOL_ENDPOINT)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [self.pool_status.model_dump()])
+        mock_get_pool_statuses.assert_called_once()
+
+    def test_getPoolStatus_returns401_whenNotAuthenticated(self) -> None:
+        # Act
+        response = self.client.get(ADMIN_POOL_ENDPOINT)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @patch.object(WebSocketManager, "get_stats")
+    def test_getWebSocketStatus_returns200_onSuccess(self, mock_get_stats) -> None:
+        # Arrange
+        app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
+        mock_get_stats.return_value = WebSocketStats(
+            users=2,
+            connections=3,
+            queue_size=100,
+            queued_messages=7,
+            max_queue_depth=5,
+            dropped_messages=1,
+            overflow_disconnects=0,
+            idle_disconnects=2,
+            subscribed_topics=4,
+            coalesced_messages=6,
+        )
+
+        # Act
+        response = self.client.get(ADMIN_WEBSOCKETS_ENDPOINT)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["max_queue_depth"], 5)
+        self.assertEqual(response.json()["dropped_messages"], 1)
+
+    def test_getWebSocketStatus_returns401_whenNotAuthenticated(self) -> None:
+        # Act
+        response = self.client.get(ADMIN_WEBSOCKETS_ENDPOINT)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @patch.object(WebSocketManager, "broadcast", new_callable=AsyncMock)
+    def test_createAnnouncement_returns202_andBroadcastsToAllUsers(
+        self, mock_broadcast
+    ) -> None:
+        # Arrange
+        app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
+
+        # Act
+        response = self.client.post(
+            ADMIN_ANNOUNCEMENTS_ENDPOINT, json={"content": "Maintenance at noon"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()["type"], "announcement")
+        self.assertEqual(response.json()["content"], "Maintenance at noon")
+        event = mock_broadcast.await_args.kwargs["message"]
+        self.assertIsInstance(event, AnnouncementEvent)
+        self.assertEqual(event.content, "Maintenance at noon")
+
+    @patch.object(WebSocketManager, "broadcast", new_callable=AsyncMock)
+    def test_createAnnouncement_returns422_whenContentEmpty(
+        self, mock_broadcast
+    ) -> None:
+        # Arrange
+        app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
+
+        # Act
+        response = self.client.post(ADMIN_ANNOUNCEMENTS_ENDPOINT, json={"content": ""})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        mock_broadcast.assert_not_awaited()
+
+    def test_createAnnouncement_returns401_whenNotAuthenticated(self) -> None:
+        # Act
+        response = self.client.post(
+            ADMIN_ANNOUNCEMENTS_ENDPOINT, json={"content": "Maintenance at noon"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
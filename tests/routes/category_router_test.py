@@ -5,7 +5,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from forum_system_api.main import app
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.reply import Reply
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
@@ -51,7 +51,7 @@ class TestCategoryRouter_Should(unittest.TestCase):
     @patch("forum_system_api.services.category_service.get_all")
     def test_get_categories_returns200_onSuccess(self, mock_get_all) -> None:
         # Arrange
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         mock_get_all.return_value = [td.CATEGORY_1, td.CATEGORY_2]
 
         # Act
@@ -62,9 +62,9 @@ class TestCategoryRouter_Should(unittest.TestCase):
         self.assertIsInstance(response.json(), list)
 
     @patch("forum_system_api.services.topic_service.get_topics_for_category")
-    @patch("forum_system_api.services.topic_service.get_replies")
+    @patch("forum_system_api.services.topic_service.get_replies_for_topics")
     def test_view_category_returns200_onSuccess(
-        self, mock_get_replies, mock_get_topics_for_category
+        self, mock_get_replies_for_topics, mock_get_topics_for_category
     ) -> None:
         # Arrange
         topic = Topic(**VALID_TOPIC_1)
@@ -72,8 +72,8 @@ class TestCategoryRouter_Should(unittest.TestCase):
         reply = Reply(**VALID_REPLY)
         reply.author = self.user
         mock_get_topics_for_category.return_value = [topic]
-        mock_get_replies.return_value = [reply]
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        mock_get_replies_for_topics.return_value = {topic.id: [reply]}
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         app.dependency_overrides[get_current_user] = lambda: self.user
 
         # Act
@@ -5,11 +5,15 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from forum_system_api.main import app
+from forum_system_api.persistence.database import get_read_db
+from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
 from forum_system_api.services.auth_service import get_current_user
+from forum_system_api.services.conversation_service import InboxEntry
 from tests.services import test_data as td
 
 CONVERSATION_CONTACTS_ENDPOINT = "/api/v1/conversations/contacts"
+CONVERSATION_INBOX_ENDPOINT = "/api/v1/conversations/inbox"
 CONVERSATION_MESSAGES_BY_RECEIVER_ENDPOINT = "/api/v1/conversations/{}"
 
 
@@ -34,6 +38,7 @@ class TestConversationRouter_Should(unittest.TestCase):
         # Arrange
         mock_get_users_from_conversations.return_value = [User(**td.USER_1)]
         app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
 
         # Act
         response = client.get(CONVERSATION_CONTACTS_ENDPOINT)
@@ -41,15 +46,20 @@ class TestConversationRouter_Should(unittest.TestCase):
         # Assert
         self.assertEqual(response.status_code, 200)
 
+    @patch(
+        "forum_system_api.api.api_v1.routes.conversation_router.get_sync_cursor",
+        return_value=None,
+    )
     @patch(
         "forum_system_api.api.api_v1.routes.conversation_router.get_messages_with_receiver"
     )
     def test_get_messages_with_receiver_route_returns200_onSuccess(
-        self, mock_get_messages_with_receiver
+        self, mock_get_messages_with_receiver, mock_get_sync_cursor
     ) -> None:
         # Arrange
         mock_get_messages_with_receiver.return_value = [td.MESSAGE_1]
         app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
 
         # Act
         response = client.get(
@@ -58,3 +68,84 @@ class TestConversationRouter_Should(unittest.TestCase):
 
         # Assert
         self.assertEqual(response.status_code, 200)
+
+    @patch(
+        "forum_system_api.api.api_v1.routes.conversation_router.get_sync_cursor",
+        return_value="sync_cursor",
+    )
+    @patch(
+        "forum_system_api.api.api_v1.routes.conversation_router.get_messages_with_receiver"
+    )
+    def test_get_messages_with_receiver_route_setsSyncCursorHeader(
+        self, mock_get_messages_with_receiver, mock_get_sync_cursor
+    ) -> None:
+        # Arrange
+        mock_get_messages_with_receiver.return_value = []
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
+
+        # Act
+        response = client.get(
+            CONVERSATION_MESSAGES_BY_RECEIVER_ENDPOINT.format(td.USER_1["id"]),
+            params={"since": "since_cursor"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Sync-Cursor"], "sync_cursor")
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
+    def test_get_messages_with_receiver_route_returns400_withAfterAndSince(
+        self,
+    ) -> None:
+        # Arrange
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
+
+        # Act
+        response = client.get(
+            CONVERSATION_MESSAGES_BY_RECEIVER_ENDPOINT.format(td.USER_1["id"]),
+            params={"after": "cursor", "since": "cursor"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+    @patch("forum_system_api.api.api_v1.routes.conversation_router.get_inbox")
+    def test_get_inbox_route_returns200_onSuccess(self, mock_get_inbox) -> None:
+        # Arrange
+        message = Message(**td.MESSAGE_1)
+        mock_get_inbox.return_value = [
+            InboxEntry(
+                id=td.MESSAGE_1["conversation_id"],
+                user=User(**td.USER_2),
+                last_message=message,
+                last_message_at=message.created_at,
+                unread_count=3,
+                last_read_message_id=None,
+                receiver_last_read_message_id=message.id,
+            )
+        ]
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
+
+        # Act
+        response = client.get(CONVERSATION_INBOX_ENDPOINT, params={"limit": 10})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response.json()[0]["unread_count"], 3)
+        self.assertEqual(response.json()[0]["user"]["id"], str(td.USER_2["id"]))
+        self.assertEqual(mock_get_inbox.call_args.kwargs["filter_params"].limit, 10)
+
+    def test_get_inbox_route_returns422_withInvalidLimit(self) -> None:
+        # Arrange
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
+
+        # Act
+        response = client.get(CONVERSATION_INBOX_ENDPOINT, params={"limit": 0})
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
@@ -3,18 +3,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.main import app
 from forum_system_api.persistence.database import get_db
 from forum_system_api.persistence.models.user import User
-from forum_system_api.schemas.message import MessageCreate, MessageResponse
+from forum_system_api.schemas.message import (
+    MessageCreate,
+    MessageResponse,
+    ReadReceiptEvent,
+)
 from forum_system_api.services.auth_service import get_current_user
+from forum_system_api.services.message_service import ReadReceipt
 from forum_system_api.services.websocket_manager import WebSocketManager
 from tests.services import test_data as td
 
 MESSAGE_ENDPOINT_SEND_MESSAGE = "/api/v1/messages/"
 MESSAGE_CREATE_BY_USERNAME = "/api/v1/messages/by-username"
+MESSAGE_MARK_AS_READ_ENDPOINT = "/api/v1/messages/{}/read"
 
 
 client = TestClient(app)
@@ -54,6 +61,34 @@ class MessageRouterTests(IsolatedAsyncioTestCase):
         )
         self.assertEqual(response.status_code, 201)
 
+    @patch.object(WebSocketManager, "send_message_as_json", new_callable=AsyncMock)
+    @patch(
+        "forum_system_api.api.api_v1.routes.message_router.send_message_async",
+        new_callable=AsyncMock,
+    )
+    async def test_create_message_usesAsyncService_whenSessionIsAsync(
+        self, mock_send_message_async, mock_ws_send_message_as_json
+    ):
+        # Arrange
+        async_db = MagicMock(spec=AsyncSession)
+        mock_send_message_async.return_value = td.MESSAGE_1
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_db] = lambda: async_db
+
+        # Act
+        response = client.post(MESSAGE_ENDPOINT_SEND_MESSAGE, json=td.MESSAGE_CREATE)
+
+        # Assert
+        mock_send_message_async.assert_awaited_once_with(
+            db=async_db,
+            message_data=MessageCreate(**td.MESSAGE_CREATE),
+            user=self.user,
+        )
+        mock_ws_send_message_as_json.assert_awaited_once_with(
+            message=self.message_response, receiver_id=self.receiver_id
+        )
+        self.assertEqual(response.status_code, 201)
+
     @patch.object(WebSocketManager, "send_message_as_json", new_callable=AsyncMock)
     @patch("forum_system_api.api.api_v1.routes.message_router.send_message")
     @patch(
@@ -102,3 +137,66 @@ class MessageRouterTests(IsolatedAsyncioTestCase):
 
         # Assert
         self.assertEqual(response.status_code, 400)
+
+    @patch.object(WebSocketManager, "send_message_as_json", new_callable=AsyncMock)
+    @patch("forum_system_api.api.api_v1.routes.message_router.mark_as_read")
+    async def test_markMessageAsRead_returns200_andNotifiesReceiver(
+        self, mock_mark_as_read, mock_ws_send_message_as_json
+    ):
+        # Arrange
+        read_receipt = ReadReceipt(
+            conversation_id=td.VALID_CONVERSATION_ID,
+            user_id=self.user.id,
+            receiver_id=td.VALID_USER_ID_2,
+            last_read_message_id=td.VALID_MESSAGE_ID,
+            last_read_at=td.VALID_CREATED_AT,
+        )
+        mock_mark_as_read.return_value = read_receipt
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_db] = lambda: self.mock_db
+
+        # Act
+        response = client.put(MESSAGE_MARK_AS_READ_ENDPOINT.format(td.VALID_MESSAGE_ID))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["last_read_message_id"], str(td.VALID_MESSAGE_ID)
+        )
+        mock_mark_as_read.assert_called_once_with(
+            db=self.mock_db, message_id=td.VALID_MESSAGE_ID, user=self.user
+        )
+        mock_ws_send_message_as_json.assert_awaited_once_with(
+            message=ReadReceiptEvent.model_validate(read_receipt),
+            receiver_id=td.VALID_USER_ID_2,
+        )
+
+    @patch.object(WebSocketManager, "send_message_as_json", new_callable=AsyncMock)
+    @patch(
+        "forum_system_api.api.api_v1.routes.message_router.mark_as_read_async",
+        new_callable=AsyncMock,
+    )
+    async def test_markMessageAsRead_usesAsyncService_whenSessionIsAsync(
+        self, mock_mark_as_read_async, mock_ws_send_message_as_json
+    ):
+        # Arrange
+        async_db = MagicMock(spec=AsyncSession)
+        mock_mark_as_read_async.return_value = ReadReceipt(
+            conversation_id=td.VALID_CONVERSATION_ID,
+            user_id=self.user.id,
+            receiver_id=td.VALID_USER_ID_2,
+            last_read_message_id=td.VALID_MESSAGE_ID,
+            last_read_at=td.VALID_CREATED_AT,
+        )
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_db] = lambda: async_db
+
+        # Act
+        response = client.put(MESSAGE_MARK_AS_READ_ENDPOINT.format(td.VALID_MESSAGE_ID))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_mark_as_read_async.assert_awaited_once_with(
+            db=async_db, message_id=td.VALID_MESSAGE_ID, user=self.user
+        )
+        mock_ws_send_message_as_json.assert_awaited_once()
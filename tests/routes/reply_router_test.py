@@ -1,6 +1,6 @@
 import unittest
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
@@ -10,7 +10,8 @@ from forum_system_api.persistence.database import get_db
 from forum_system_api.persistence.models.reply import Reply
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
-from forum_system_api.services.auth_service import get_current_user
+from forum_system_api.services import topic_event_service
+from forum_system_api.services.auth_service import get_current_user, require_admin_role
 from tests.services import test_data_obj as tobj
 
 
@@ -28,14 +29,8 @@ class ReplyRouterShould(unittest.TestCase):
         app.dependency_overrides = {}
 
     def test_get_by_id_returns200_onSuccess(self):
-        with (
-            patch(
-                "forum_system_api.services.reply_service.get_by_id",
-                return_value=self.reply,
-            ),
-            patch(
-                "forum_system_api.services.reply_service.get_votes", return_value=(1, 0)
-            ),
+        with patch(
+            "forum_system_api.services.reply_service.get_by_id", return_value=self.reply
         ):
             app.dependency_overrides[get_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
@@ -43,6 +38,8 @@ class ReplyRouterShould(unittest.TestCase):
             response = self.client.get(f"/api/v1/replies/{self.reply.id}")
 
             self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["upvotes"], self.reply.upvotes)
+            self.assertEqual(response.json()["downvotes"], self.reply.downvotes)
 
     def test_get_by_id_returns404_replyNotFound(self):
         with patch(
@@ -83,6 +80,48 @@ class ReplyRouterShould(unittest.TestCase):
 
             self.assertEqual(response.status_code, 201)
 
+    def test_create_publishesReplyCreatedEvent_onSuccess(self):
+        with (
+            patch(
+                "forum_system_api.services.reply_service.create",
+                return_value=self.reply,
+            ),
+            patch(
+                "forum_system_api.services.topic_event_service.publish",
+                new_callable=AsyncMock,
+            ) as mock_publish,
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            self.client.post(
+                f"/api/v1/replies/{self.topic.id}", json=tobj.VALID_REPLY_CREATE
+            )
+
+            mock_publish.assert_awaited_once_with(
+                event=topic_event_service.reply_created_event(reply=self.reply)
+            )
+
+    def test_create_doesNotPublishEvent_onError(self):
+        with (
+            patch(
+                "forum_system_api.services.reply_service.create",
+                side_effect=HTTPException(status_code=403, detail="Unauthorized"),
+            ),
+            patch(
+                "forum_system_api.services.topic_event_service.publish",
+                new_callable=AsyncMock,
+            ) as mock_publish,
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            self.client.post(
+                f"/api/v1/replies/{self.topic.id}", json=tobj.VALID_REPLY_CREATE
+            )
+
+            mock_publish.assert_not_awaited()
+
     def test_create_returns_403_noPermissions(self):
         with patch(
             "forum_system_api.services.reply_service.create",
@@ -98,14 +137,8 @@ class ReplyRouterShould(unittest.TestCase):
             self.assertEqual(response.status_code, 403)
 
     def test_update_returns_200_onSuccess(self):
-        with (
-            patch(
-                "forum_system_api.services.reply_service.update",
-                return_value=self.reply,
-            ),
-            patch(
-                "forum_system_api.services.reply_service.get_votes", return_value=(1, 0)
-            ),
+        with patch(
+            "forum_system_api.services.reply_service.update", return_value=self.reply
         ):
             app.dependency_overrides[get_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
@@ -147,23 +180,41 @@ class ReplyRouterShould(unittest.TestCase):
             self.assertIn("Reply not found", response.json()["detail"])
 
     def test_create_reaction_returns_200_onSuccess(self):
+        with patch(
+            "forum_system_api.services.reply_service.vote", return_value=self.reply
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            response = self.client.patch(
+                f"/api/v1/replies/{self.reply.id}",
+                json=tobj.VALID_REPLY_REACTION_CREATE_TRUE,
+            )
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_create_reaction_publishesReplyVotedEvent_onSuccess(self):
         with (
             patch(
-                "forum_system_api.services.reply_service.vote", return_value=self.reply
+                "forum_system_api.services.reply_service.vote",
+                return_value=self.reply,
             ),
             patch(
-                "forum_system_api.services.reply_service.get_votes", return_value=(1, 0)
-            ),
+                "forum_system_api.services.topic_event_service.publish",
+                new_callable=AsyncMock,
+            ) as mock_publish,
         ):
             app.dependency_overrides[get_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
-            response = self.client.patch(
+            self.client.patch(
                 f"/api/v1/replies/{self.reply.id}",
                 json=tobj.VALID_REPLY_REACTION_CREATE_TRUE,
             )
 
-            self.assertEqual(response.status_code, 200)
+            mock_publish.assert_awaited_once_with(
+                event=topic_event_service.reply_voted_event(reply=self.reply)
+            )
 
     def test_create_reaction_returns_404_replyNotFound(self):
         with patch(
@@ -196,3 +247,18 @@ class ReplyRouterShould(unittest.TestCase):
 
             self.assertEqual(response.status_code, 405)
             self.assertIn("Unauthorized", response.json()["detail"])
+
+    def test_recalculate_vote_counts_returns200_onSuccess(self):
+        with patch(
+            "forum_system_api.services.reply_service.recalculate_vote_counts",
+            return_value=3,
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[require_admin_role] = lambda: self.user
+
+            response = self.client.post("/api/v1/replies/votes/recalculate")
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.json(), {"msg": "Recalculated vote counts for 3 replies"}
+            )
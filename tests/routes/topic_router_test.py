@@ -1,16 +1,17 @@
 import unittest
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from forum_system_api.main import app
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.reply import Reply
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.topic import TopicUpdate
+from forum_system_api.services import topic_event_service
 from forum_system_api.services.auth_service import get_current_user
 from tests.services import test_data_const as tc
 from tests.services import test_data_obj as tobj
@@ -30,10 +31,17 @@ class TopicRouterShould(unittest.TestCase):
         app.dependency_overrides = {}
 
     def test_get_all_returns200_onSuccess(self):
-        with patch(
-            "forum_system_api.services.topic_service.get_all", return_value=[self.topic]
+        with (
+            patch(
+                "forum_system_api.services.topic_service.get_all",
+                return_value=[self.topic],
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_replies_for_topics",
+                return_value={self.topic.id: []},
+            ),
         ):
-            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_read_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
             response = self.client.get("/api/v1/topics/")
@@ -41,22 +49,72 @@ class TopicRouterShould(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
 
     def test_get_public_returns200_onSuccess(self):
-        with patch(
-            "forum_system_api.services.topic_service.get_public",
-            return_value=[self.topic],
+        with (
+            patch(
+                "forum_system_api.services.topic_service.get_public",
+                return_value=[self.topic],
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_replies_for_topics",
+                return_value={self.topic.id: []},
+            ),
         ):
-            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_read_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
             response = self.client.get("/api/v1/topics/public")
 
             self.assertEqual(response.status_code, 200)
 
+    def test_get_public_setsNextCursorHeader_fullPage(self):
+        with (
+            patch(
+                "forum_system_api.services.topic_service.get_public",
+                return_value=[self.topic],
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_next_cursor",
+                return_value="cursor",
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_replies_for_topics",
+                return_value={self.topic.id: []},
+            ),
+        ):
+            app.dependency_overrides[get_read_db] = lambda: self.db
+
+            response = self.client.get("/api/v1/topics/public", params={"limit": 1})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["X-Next-Cursor"], "cursor")
+
+    def test_get_all_loadsRepliesInSingleBatch(self):
+        with (
+            patch(
+                "forum_system_api.services.topic_service.get_all",
+                return_value=[self.topic],
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_replies_for_topics",
+                return_value={self.topic.id: [self.reply]},
+            ) as mock_get_replies_for_topics,
+        ):
+            app.dependency_overrides[get_read_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            response = self.client.get("/api/v1/topics/")
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()[0]["replies"]), 1)
+            mock_get_replies_for_topics.assert_called_once_with(
+                topic_ids=[self.topic.id], db=self.db
+            )
+
     def test_get_by_id_returns200_onSuccess(self):
         with patch(
             "forum_system_api.services.topic_service.get_by_id", return_value=self.topic
         ):
-            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_read_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
             response = self.client.get(f"/api/v1/topics/{self.topic.id}")
@@ -68,7 +126,7 @@ class TopicRouterShould(unittest.TestCase):
             "forum_system_api.services.topic_service.get_by_id",
             side_effect=HTTPException(status_code=404, detail="Topic not found"),
         ):
-            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_read_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
             response = self.client.get(f"/api/v1/topics/{uuid.uuid4()}")
@@ -81,7 +139,7 @@ class TopicRouterShould(unittest.TestCase):
             "forum_system_api.services.topic_service.get_by_id",
             side_effect=HTTPException(status_code=403, detail="Unauthorized"),
         ):
-            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_read_db] = lambda: self.db
             app.dependency_overrides[get_current_user] = lambda: self.user
 
             response = self.client.get(f"/api/v1/topics/{self.topic.id}")
@@ -89,6 +147,45 @@ class TopicRouterShould(unittest.TestCase):
             self.assertEqual(response.status_code, 403)
             self.assertIn("Unauthorized", response.json()["detail"])
 
+    def test_get_replies_returns200_onSuccess(self):
+        with (
+            patch(
+                "forum_system_api.services.topic_service.get_by_id",
+                return_value=self.topic,
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_replies",
+                return_value=[self.reply],
+            ),
+            patch(
+                "forum_system_api.services.topic_service.get_next_reply_cursor",
+                return_value="cursor",
+            ),
+        ):
+            app.dependency_overrides[get_read_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            response = self.client.get(
+                f"/api/v1/topics/{self.topic.id}/replies", params={"limit": 1}
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()), 1)
+            self.assertEqual(response.headers["X-Next-Cursor"], "cursor")
+
+    def test_get_replies_returns403_noTopicPermissions(self):
+        with patch(
+            "forum_system_api.services.topic_service.get_by_id",
+            side_effect=HTTPException(status_code=403, detail="Unauthorized"),
+        ):
+            app.dependency_overrides[get_read_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            response = self.client.get(f"/api/v1/topics/{self.topic.id}/replies")
+
+            self.assertEqual(response.status_code, 403)
+            self.assertIn("Unauthorized", response.json()["detail"])
+
     def test_create_returns_201_onSuccess(self):
         with patch(
             "forum_system_api.services.topic_service.create", return_value=self.topic
@@ -180,6 +277,26 @@ class TopicRouterShould(unittest.TestCase):
 
             self.assertEqual(response.status_code, 200)
 
+    def test_lock_publishesTopicLockedEvent_onSuccess(self):
+        with (
+            patch(
+                "forum_system_api.services.topic_service.lock",
+                return_value=self.topic,
+            ),
+            patch(
+                "forum_system_api.services.topic_event_service.publish",
+                new_callable=AsyncMock,
+            ) as mock_publish,
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            self.client.patch(f"/api/v1/topics/{self.topic.id}/lock", json=True)
+
+            mock_publish.assert_awaited_once_with(
+                event=topic_event_service.topic_locked_event(topic=self.topic)
+            )
+
     def test_best_reply_returns_200_onSuccess(self):
         with patch(
             "forum_system_api.services.topic_service.select_best_reply",
@@ -193,3 +310,25 @@ class TopicRouterShould(unittest.TestCase):
             )
 
             self.assertEqual(response.status_code, 200)
+
+    def test_best_reply_publishesBestReplySelectedEvent_onSuccess(self):
+        with (
+            patch(
+                "forum_system_api.services.topic_service.select_best_reply",
+                return_value=self.topic,
+            ),
+            patch(
+                "forum_system_api.services.topic_event_service.publish",
+                new_callable=AsyncMock,
+            ) as mock_publish,
+        ):
+            app.dependency_overrides[get_db] = lambda: self.db
+            app.dependency_overrides[get_current_user] = lambda: self.user
+
+            self.client.patch(
+                f"/api/v1/topics/{self.topic.id}/replies/{self.reply.id}/best"
+            )
+
+            mock_publish.assert_awaited_once_with(
+                event=topic_event_service.best_reply_selected_event(topic=self.topic)
+            )
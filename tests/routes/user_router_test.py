@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from forum_system_api.main import app
-from forum_system_api.persistence.database import get_db
+from forum_system_api.persistence.database import get_db, get_read_db
 from forum_system_api.persistence.models.user import User
 from forum_system_api.services.auth_service import get_current_user, require_admin_role
 from tests.services import test_data as td
@@ -55,7 +55,7 @@ class TestUserRouter_Should(TestCase):
     def test_getAllUsers_returns200_onSuccess(self, mock_get_all) -> None:
         # Arrange
         mock_get_all.return_value = [self.mock_user, self.mock_user2]
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
 
         # Act
@@ -88,7 +88,7 @@ class TestUserRouter_Should(TestCase):
             self.mock_user: permission1,
             self.mock_user2: permission2,
         }
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
 
         # Act
@@ -104,7 +104,7 @@ class TestUserRouter_Should(TestCase):
     def test_viewUserPermissions_returns200_onSuccess(self, mock_get_by_id) -> None:
         # Arrange
         mock_get_by_id.return_value = self.mock_user
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
 
         # Act
@@ -122,7 +122,7 @@ class TestUserRouter_Should(TestCase):
     ) -> None:
         # Arrange
         mock_get_by_id.return_value = None
-        app.dependency_overrides[get_db] = lambda: self.mock_db
+        app.dependency_overrides[get_read_db] = lambda: self.mock_db
         app.dependency_overrides[require_admin_role] = lambda: self.mock_admin
 
         # Act
@@ -7,7 +7,10 @@ from sqlalchemy.orm import Session
 
 from forum_system_api.main import app
 from forum_system_api.persistence.database import get_db
-from forum_system_api.services.websocket_manager import WebSocketManager
+from forum_system_api.services.websocket_manager import (
+    WebSocketConnection,
+    WebSocketManager,
+)
 from tests.services.test_data import VALID_USER_ID
 
 WEBSOCKET_CONNECT_ENDPOINT = "/api/v1/ws/connect"
@@ -29,13 +32,16 @@ class TestWebSocketRouter_Should(IsolatedAsyncioTestCase):
     def tearDown(self) -> None:
         app.dependency_overrides = {}
 
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
     @patch.object(WebSocketManager, "connect", new_callable=AsyncMock)
     @patch("forum_system_api.services.auth_service.authenticate_websocket_user")
     async def test_websocketConnect_successfullyConnects(
-        self, mock_authenticate, mock_connect
+        self, mock_authenticate, mock_connect, mock_disconnect, mock_close_connection
     ) -> None:
         # Arrange
         mock_authenticate.return_value = self.user_id
+        mock_connect.return_value = MagicMock(spec=WebSocketConnection)
         app.dependency_overrides[get_db] = lambda: self.mock_db
 
         # Act
@@ -83,7 +89,7 @@ class TestWebSocketRouter_Should(IsolatedAsyncioTestCase):
         # Assert
         mock_authenticate.assert_called_once_with(data=self.token, db=self.mock_db)
         mock_connect.assert_awaited_once_with(websocket=ANY, user_id=self.user_id)
-        mock_disconnect.assert_awaited_once_with(self.user_id)
+        mock_disconnect.assert_not_awaited()
         mock_close_connection.assert_awaited_once_with(ANY)
 
     @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
@@ -105,5 +111,94 @@ class TestWebSocketRouter_Should(IsolatedAsyncioTestCase):
         # Assert
         mock_authenticate.assert_called_once_with(data=self.token, db=self.mock_db)
         mock_connect.assert_awaited_once_with(websocket=ANY, user_id=self.user_id)
-        mock_disconnect.assert_awaited_once_with(self.user_id)
+        mock_disconnect.assert_not_awaited()
         mock_close_connection.assert_awaited_once_with(ANY)
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "connect", new_callable=AsyncMock)
+    @patch("forum_system_api.services.auth_service.authenticate_websocket_user")
+    async def test_websocketDisconnect_disconnectsConnection_whenClientCloses(
+        self, mock_authenticate, mock_connect, mock_disconnect, mock_close_connection
+    ) -> None:
+        # Arrange
+        connection = MagicMock(spec=WebSocketConnection)
+        mock_connect.return_value = connection
+        mock_authenticate.return_value = self.user_id
+        app.dependency_overrides[get_db] = lambda: self.mock_db
+
+        # Act
+        with self.client.websocket_connect(WEBSOCKET_CONNECT_ENDPOINT) as websocket:
+            websocket.send_json(self.token)
+            websocket.close()
+
+        # Assert
+        mock_disconnect.assert_awaited_once_with(connection)
+        mock_close_connection.assert_awaited_once_with(ANY)
+
+    @patch.object(WebSocketManager, "handle_message", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "connect", new_callable=AsyncMock)
+    @patch("forum_system_api.services.auth_service.authenticate_websocket_user")
+    async def test_websocketConnect_handlesReceivedFrames(
+        self,
+        mock_authenticate,
+        mock_connect,
+        mock_disconnect,
+        mock_close_connection,
+        mock_handle_message,
+    ) -> None:
+        # Arrange
+        connection = MagicMock(spec=WebSocketConnection)
+        mock_connect.return_value = connection
+        mock_handle_message.return_value = None
+        mock_authenticate.return_value = self.user_id
+        app.dependency_overrides[get_db] = lambda: self.mock_db
+
+        # Act
+        with self.client.websocket_connect(WEBSOCKET_CONNECT_ENDPOINT) as websocket:
+            websocket.send_json(self.token)
+            websocket.send_text('{"type": "pong"}')
+            websocket.close()
+
+        # Assert
+        mock_handle_message.assert_awaited_once_with(
+            connection=connection, message='{"type": "pong"}'
+        )
+        mock_disconnect.assert_awaited_once_with(connection)
+
+    @patch(
+        "forum_system_api.services.topic_event_service.handle_frame",
+        new_callable=AsyncMock,
+    )
+    @patch.object(WebSocketManager, "handle_message", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
+    @patch.object(WebSocketManager, "connect", new_callable=AsyncMock)
+    @patch("forum_system_api.services.auth_service.authenticate_websocket_user")
+    async def test_websocketConnect_passesUnhandledFramesToTopicEvents(
+        self,
+        mock_authenticate,
+        mock_connect,
+        mock_disconnect,
+        mock_close_connection,
+        mock_handle_message,
+        mock_handle_frame,
+    ) -> None:
+        # Arrange
+        connection = MagicMock(spec=WebSocketConnection)
+        frame = {"type": "subscribe", "topic_id": str(self.user_id)}
+        mock_connect.return_value = connection
+        mock_handle_message.return_value = frame
+        mock_authenticate.return_value = self.user_id
+        app.dependency_overrides[get_db] = lambda: self.mock_db
+
+        # Act
+        with self.client.websocket_connect(WEBSOCKET_CONNECT_ENDPOINT) as websocket:
+            websocket.send_json(self.token)
+            websocket.send_json(frame)
+            websocket.close()
+
+        # Assert
+        mock_handle_frame.assert_awaited_once_with(connection=connection, frame=frame)
@@ -1,23 +1,32 @@
 import unittest
 from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
 from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.user import User
 from forum_system_api.services import auth_service
+from forum_system_api.services.utils.principal_utils import Principal
+from forum_system_api.services.utils.token_version_cache import (
+    clear_token_versions,
+    get_token_version,
+    set_token_version,
+)
 from tests.services.test_data import USER_1, VALID_PASSWORD
 
 
 class AuthService_Should(unittest.TestCase):
     def setUp(self):
+        clear_token_versions()
         self.mock_db = MagicMock(spec=Session)
         self.user = User(**USER_1)
         self.mock_access_token = "access_token"
         self.mock_refresh_token = "refresh_token"
+        self.mock_request = Request({"type": "http", "headers": []})
         self.payload = {
             "sub": str(self.user.id),
             "token_version": str(self.user.token_version),
@@ -165,6 +174,62 @@ class AuthService_Should(unittest.TestCase):
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
         self.assertEqual("Could not verify token", ctx.exception.detail)
 
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_verifyToken_usesCachedTokenVersion(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=self.user.token_version)
+
+        # Act
+        result = auth_service.verify_token(
+            token=self.mock_access_token, db=self.mock_db
+        )
+
+        # Assert
+        mock_get_by_id.assert_not_called()
+        self.assertDictEqual(self.payload, result)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_verifyToken_raises401_whenCachedAndStoredTokenVersionMismatch(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=uuid4())
+        mock_get_by_id.return_value = User(id=self.user.id, token_version=uuid4())
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as ctx:
+            auth_service.verify_token(token=self.mock_access_token, db=self.mock_db)
+
+        mock_get_by_id.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_verifyToken_returnsPayload_whenCachedTokenVersionIsStale(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=uuid4())
+        mock_get_by_id.return_value = self.user
+
+        # Act
+        result = auth_service.verify_token(
+            token=self.mock_access_token, db=self.mock_db
+        )
+
+        # Assert
+        self.assertDictEqual(self.payload, result)
+        self.assertEqual(
+            self.user.token_version, get_token_version(user_id=self.user.id)
+        )
+
     @patch("forum_system_api.services.auth_service.jwt.decode")
     def test_verifyToken_raises401_whenTokenIsInvalid(self, mock_jwt_decode) -> None:
         # Arrange
@@ -190,6 +255,23 @@ class AuthService_Should(unittest.TestCase):
         # Assert
         self.assertEqual(self.user.token_version, token_version)
 
+    @patch("forum_system_api.services.auth_service.uuid4")
+    @patch("forum_system_api.services.user_service.get_by_id")
+    def test_updateTokenVersion_updatesCachedTokenVersion(
+        self, mock_get_user_by_id, mock_uuid4
+    ) -> None:
+        # Arrange
+        new_token_version = uuid4()
+        mock_get_user_by_id.return_value = self.user
+        mock_uuid4.return_value = new_token_version
+        set_token_version(user_id=self.user.id, token_version=uuid4())
+
+        # Act
+        auth_service.update_token_version(user_id=self.user.id, db=self.mock_db)
+
+        # Assert
+        self.assertEqual(new_token_version, get_token_version(user_id=self.user.id))
+
     @patch("forum_system_api.services.user_service.get_by_id")
     def test_updateTokenVersion_raises404_whenUserIsNotFound(
         self, mock_get_user_by_id
@@ -326,38 +408,147 @@ class AuthService_Should(unittest.TestCase):
         mock_is_admin.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
         self.assertDictEqual(self.payload, payload)
 
-    @patch("forum_system_api.services.user_service.get_by_id")
-    @patch("forum_system_api.services.auth_service.verify_token")
-    def test_getCurrentUser_returnsUser(
-        self, mock_verify_token, mock_get_user_by_id
+    @patch("forum_system_api.services.auth_service.set_principal")
+    @patch("forum_system_api.services.auth_service.user_service.query_is_admin")
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_getCurrentPrincipal_returnsPrincipal(
+        self, mock_get_by_id, mock_jwt_decode, mock_query_is_admin, mock_set_principal
     ) -> None:
         # Arrange
-        mock_verify_token.return_value = {"sub": str(self.user.id)}
-        mock_get_user_by_id.return_value = self.user
+        mock_jwt_decode.return_value = self.payload
+        mock_get_by_id.return_value = self.user
+        mock_query_is_admin.return_value = True
 
         # Act
-        user = auth_service.get_current_user(
-            token=self.mock_access_token, db=self.mock_db
+        principal = auth_service.get_current_principal(
+            request=self.mock_request, token=self.mock_access_token, db=self.mock_db
         )
 
         # Assert
-        mock_verify_token.assert_called_once_with(
-            token=self.mock_access_token, db=self.mock_db
+        mock_get_by_id.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
+        mock_set_principal.assert_called_once_with(principal=principal, db=self.mock_db)
+        self.assertEqual(self.user.id, principal.user_id)
+        self.assertEqual(self.user, principal.user)
+        self.assertTrue(principal.is_admin)
+        self.assertIs(principal, self.mock_request.state.principal)
+        mock_query_is_admin.assert_called_once_with(
+            user_id=self.user.id, db=self.mock_db
         )
-        self.assertEqual(self.user, user)
 
-    @patch("forum_system_api.services.auth_service.verify_token")
-    def test_getCurrentUser_raises401_whenTokenIsInvalid(
-        self, mock_verify_token
+    @patch("forum_system_api.services.auth_service.user_service.query_is_admin")
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_getCurrentPrincipal_skipsQueries_whenTokenVersionIsCached(
+        self, mock_get_by_id, mock_jwt_decode, mock_query_is_admin
     ) -> None:
         # Arrange
-        mock_verify_token.side_effect = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=self.user.token_version)
+
+        # Act
+        principal = auth_service.get_current_principal(
+            request=self.mock_request, token=self.mock_access_token, db=self.mock_db
+        )
+
+        # Assert
+        self.assertEqual(self.user.id, principal.user_id)
+        mock_get_by_id.assert_not_called()
+        mock_query_is_admin.assert_not_called()
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_getCurrentPrincipal_loadsUserOnFirstUse_whenTokenVersionIsCached(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        mock_get_by_id.return_value = self.user
+        set_token_version(user_id=self.user.id, token_version=self.user.token_version)
+        principal = auth_service.get_current_principal(
+            request=self.mock_request, token=self.mock_access_token, db=self.mock_db
         )
 
+        # Act
+        users = [principal.user, principal.user]
+
+        # Assert
+        self.assertEqual([self.user, self.user], users)
+        mock_get_by_id.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_getCurrentPrincipal_raises401_whenCachedAndStoredTokenVersionMismatch(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=uuid4())
+        mock_get_by_id.return_value = User(id=self.user.id, token_version=uuid4())
+
         # Act & Assert
-        with self.assertRaises(HTTPException):
-            auth_service.get_current_user(token=self.mock_access_token, db=self.mock_db)
+        with self.assertRaises(HTTPException) as ctx:
+            auth_service.get_current_principal(
+                request=self.mock_request,
+                token=self.mock_access_token,
+                db=self.mock_db,
+            )
+
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
+        mock_get_by_id.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch("forum_system_api.services.auth_service.user_service.get_by_id")
+    def test_getCurrentPrincipal_returnsPrincipal_whenCachedTokenVersionIsStale(
+        self, mock_get_by_id, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        set_token_version(user_id=self.user.id, token_version=uuid4())
+        mock_get_by_id.return_value = self.user
+
+        # Act
+        principal = auth_service.get_current_principal(
+            request=self.mock_request,
+            token=self.mock_access_token,
+            db=self.mock_db,
+        )
+
+        # Assert
+        self.assertEqual(self.user.id, principal.user_id)
+        self.assertEqual(self.user, principal.user)
+        mock_get_by_id.assert_called_once_with(user_id=self.user.id, db=self.mock_db)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    def test_getCurrentPrincipal_raises401_whenTokenIsInvalid(
+        self, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.side_effect = JWTError()
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as ctx:
+            auth_service.get_current_principal(
+                request=self.mock_request,
+                token=self.mock_access_token,
+                db=self.mock_db,
+            )
+
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
+
+    def test_getCurrentUser_returnsUser(self) -> None:
+        # Arrange
+        principal = Principal(
+            user_id=self.user.id,
+            load_user=lambda: self.user,
+            load_is_admin=lambda: False,
+        )
+
+        # Act
+        user = auth_service.get_current_user(principal=principal)
+
+        # Assert
+        self.assertEqual(self.user, user)
 
     @patch("forum_system_api.services.user_service.is_admin")
     def test_requireAdminRole_returnsUser_whenUserIsAdmin(self, mock_is_admin) -> None:
@@ -381,3 +572,99 @@ class AuthService_Should(unittest.TestCase):
 
         self.assertEqual(status.HTTP_403_FORBIDDEN, ctx.exception.status_code)
         self.assertEqual("Access denied", ctx.exception.detail)
+
+    @patch("forum_system_api.services.auth_service.ASYNC_DATABASE_ENABLED", False)
+    def test_getCurrentUserDependency_returnsGetCurrentUser_whenAsyncIsDisabled(
+        self,
+    ) -> None:
+        # Act
+        dependency = auth_service.get_current_user_dependency()
+
+        # Assert
+        self.assertIs(dependency, auth_service.get_current_user)
+
+    @patch("forum_system_api.services.auth_service.ASYNC_DATABASE_ENABLED", True)
+    def test_getCurrentUserDependency_returnsGetCurrentUserAsync_whenAsyncIsEnabled(
+        self,
+    ) -> None:
+        # Act
+        dependency = auth_service.get_current_user_dependency()
+
+        # Assert
+        self.assertIs(dependency, auth_service.get_current_user_async)
+
+
+class AuthServiceAsync_Should(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        clear_token_versions()
+        self.mock_db = MagicMock(spec=AsyncSession)
+        self.user = User(**USER_1)
+        self.payload = {
+            "sub": str(self.user.id),
+            "token_version": str(self.user.token_version),
+            "is_admin": False,
+        }
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch(
+        "forum_system_api.services.user_service.get_by_id_async",
+        new_callable=AsyncMock,
+    )
+    async def test_getCurrentUserAsync_returnsUser_whenTokenIsValid(
+        self, mock_get_by_id_async, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        mock_get_by_id_async.return_value = self.user
+
+        # Act
+        user = await auth_service.get_current_user_async(
+            token="access_token", db=self.mock_db
+        )
+
+        # Assert
+        self.assertEqual(self.user, user)
+        mock_get_by_id_async.assert_awaited_once_with(
+            user_id=self.user.id, db=self.mock_db
+        )
+        self.assertEqual(self.user.token_version, get_token_version(self.user.id))
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch(
+        "forum_system_api.services.user_service.get_by_id_async",
+        new_callable=AsyncMock,
+    )
+    async def test_getCurrentUserAsync_raises401_whenTokenVersionMismatch(
+        self, mock_get_by_id_async, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = {**self.payload, "token_version": str(uuid4())}
+        mock_get_by_id_async.return_value = self.user
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as ctx:
+            await auth_service.get_current_user_async(
+                token="access_token", db=self.mock_db
+            )
+
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
+
+    @patch("forum_system_api.services.auth_service.jwt.decode")
+    @patch(
+        "forum_system_api.services.user_service.get_by_id_async",
+        new_callable=AsyncMock,
+    )
+    async def test_getCurrentUserAsync_raises401_whenUserIsNotFound(
+        self, mock_get_by_id_async, mock_jwt_decode
+    ) -> None:
+        # Arrange
+        mock_jwt_decode.return_value = self.payload
+        mock_get_by_id_async.return_value = None
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as ctx:
+            await auth_service.get_current_user_async(
+                token="access_token", db=self.mock_db
+            )
+
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, ctx.exception.status_code)
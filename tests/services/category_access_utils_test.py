@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from forum_system_api.persistence.models.access_level import AccessLevel
 from forum_system_api.persistence.models.category import Category
 from forum_system_api.persistence.models.topic import Topic
 from forum_system_api.persistence.models.user import User
@@ -11,12 +12,14 @@ from forum_system_api.persistence.models.user_category_permission import (
     UserCategoryPermission,
 )
 from forum_system_api.services.utils import category_access_utils as utils
+from forum_system_api.services.utils.category_acl_cache import clear_acls
 from tests.services import test_data_const as td
 from tests.services import test_data_obj as tobj
 
 
 class CategoryAccessUtilsShould(unittest.TestCase):
     def setUp(self):
+        clear_acls()
         self.db = MagicMock(spec=Session)
         self.user = User(**tobj.USER_1)
         self.topic = Topic(**tobj.VALID_TOPIC_1)
@@ -29,7 +32,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
     def test_user_permission_categoryNotFound_returns404(self):
         with patch(
-            "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+            "forum_system_api.services.utils.category_access_utils.get_category_metadata",
             return_value=None,
         ):
             with self.assertRaises(HTTPException) as context:
@@ -43,7 +46,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
@@ -59,7 +62,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
@@ -76,7 +79,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
@@ -92,7 +95,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
         self.category.is_private = False
 
         with patch(
-            "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+            "forum_system_api.services.utils.category_access_utils.get_category_metadata",
             return_value=self.category,
         ):
             result = utils.user_permission(self.user, self.topic.category_id, self.db)
@@ -101,7 +104,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
     def test_get_access_level_noAccessLevel_returnsNone(self):
         self.user.permissions = []
 
-        result = utils.get_access_level(self.user, self.category.id)
+        result = utils.get_access_level(self.user, self.category.id, self.db)
         self.assertIsNone(result)
 
     def test_get_access_level_returnsAccessLevel(self):
@@ -109,30 +112,42 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         self.user.permissions = [self.permission]
 
-        result = utils.get_access_level(self.user, self.category.id)
+        result = utils.get_access_level(self.user, self.category.id, self.db)
 
         self.assertEqual(result, td.VALID_ACCESS_LEVEL_1)
 
-    def test_category_permission_userHasAccessLevel_returnsTrue(self):
+    def test_category_permission_userHasWriteAccess_returnsTrue(self):
+        self.permission.access_level = AccessLevel.WRITE
+        self.user.permissions = [self.permission]
+
         with patch(
-            "forum_system_api.services.utils.category_access_utils.get_access_level",
-            return_value=td.VALID_ACCESS_LEVEL_1,
+            "forum_system_api.services.utils.category_access_utils.is_admin",
+            return_value=False,
         ):
             result = utils.category_write_permission(
-                self.user, self.topic.category_id, self.db
+                self.user, self.category.id, self.db
             )
             self.assertTrue(result)
 
+    def test_category_permission_userHasReadAccess_notAdmin_returnsFalse(self):
+        self.permission.access_level = AccessLevel.READ
+        self.user.permissions = [self.permission]
+
+        with patch(
+            "forum_system_api.services.utils.category_access_utils.is_admin",
+            return_value=False,
+        ):
+            result = utils.category_write_permission(
+                self.user, self.category.id, self.db
+            )
+            self.assertFalse(result)
+
     def test_category_permission_userHasNoAccessLevel_notAdmin_returnsFalse(self):
-        with (
-            patch(
-                "forum_system_api.services.utils.category_access_utils.get_access_level",
-                return_value=None,
-            ),
-            patch(
-                "forum_system_api.services.utils.category_access_utils.is_admin",
-                return_value=False,
-            ),
+        self.user.permissions = []
+
+        with patch(
+            "forum_system_api.services.utils.category_access_utils.is_admin",
+            return_value=False,
         ):
             result = utils.category_write_permission(
                 self.user, self.topic.category_id, self.db
@@ -140,21 +155,33 @@ class CategoryAccessUtilsShould(unittest.TestCase):
             self.assertFalse(result)
 
     def test_category_permission_userHasNoAccessLevel_isAdmin_returnsTrue(self):
-        with (
-            patch(
-                "forum_system_api.services.utils.category_access_utils.get_access_level",
-                return_value=None,
-            ),
-            patch(
-                "forum_system_api.services.utils.category_access_utils.is_admin",
-                return_value=True,
-            ),
+        self.user.permissions = []
+
+        with patch(
+            "forum_system_api.services.utils.category_access_utils.is_admin",
+            return_value=True,
         ):
             result = utils.category_write_permission(
                 self.user, self.topic.category_id, self.db
             )
             self.assertTrue(result)
 
+    def test_get_category_acl_compilesPermissionsOnce(self):
+        self.user.permissions = [self.permission]
+
+        with patch(
+            "forum_system_api.services.utils.category_access_utils.is_admin",
+            return_value=False,
+        ) as mock_is_admin:
+            first = utils.get_category_acl(self.user, self.db)
+            second = utils.get_category_acl(self.user, self.db)
+
+        self.assertIs(first, second)
+        self.assertEqual(
+            first.access_levels, {self.category.id: td.VALID_ACCESS_LEVEL_1}
+        )
+        mock_is_admin.assert_called_once_with(user_id=self.user.id, db=self.db)
+
     def test_verify_topic_permission_categoryIsPrivate_userHasNoAccess_raises403(self):
         self.user.permissions = []
 
@@ -162,7 +189,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
@@ -183,7 +210,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
@@ -204,7 +231,7 @@ class CategoryAccessUtilsShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.utils.category_access_utils.get_category_by_id",
+                "forum_system_api.services.utils.category_access_utils.get_category_metadata",
                 return_value=self.category,
             ),
             patch(
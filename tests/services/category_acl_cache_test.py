@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.access_level import AccessLevel
+from forum_system_api.services.utils import category_acl_cache as cache
+
+
+class CategoryAclCache_Should(unittest.TestCase):
+    def setUp(self):
+        cache.clear_acls()
+        self.mock_db = MagicMock(spec=Session)
+        self.user_id = uuid4()
+        self.acl = cache.CategoryAcl(
+            is_admin=False, access_levels={uuid4(): AccessLevel.READ}
+        )
+
+    def tearDown(self):
+        cache.clear_acls()
+
+    def _set_stored_version(self, version: int) -> None:
+        query_mock = self.mock_db.query.return_value
+        query_mock.filter.return_value.scalar.return_value = version
+
+    @patch.object(cache._version_check, "interval_seconds", 5)
+    @patch("forum_system_api.services.utils.cache_version.time.monotonic")
+    def test_syncVersion_dropsAcls_whenVersionChanged(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self._set_stored_version(1)
+        cache.sync_version(self.mock_db)
+        cache.set_acl(self.user_id, self.acl)
+        mock_monotonic.return_value = 106.0
+        self._set_stored_version(2)
+
+        # Act
+        cache.sync_version(self.mock_db)
+
+        # Assert
+        self.assertIsNone(cache.get_acl(self.user_id))
+
+    @patch.object(cache._version_check, "interval_seconds", 5)
+    @patch("forum_system_api.services.utils.cache_version.time.monotonic")
+    def test_syncVersion_keepsAcls_whenVersionUnchanged(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self._set_stored_version(1)
+        cache.sync_version(self.mock_db)
+        cache.set_acl(self.user_id, self.acl)
+        mock_monotonic.return_value = 106.0
+
+        # Act
+        cache.sync_version(self.mock_db)
+
+        # Assert
+        self.assertEqual(self.acl, cache.get_acl(self.user_id))
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.category import Category
+from forum_system_api.services.utils import category_cache as cache
+from tests.services.test_data import CATEGORY_1
+
+
+class CategoryCache_Should(unittest.TestCase):
+    def setUp(self):
+        cache.clear_categories()
+        self.mock_db = MagicMock(spec=Session)
+        self.category = Category(**CATEGORY_1)
+
+    def tearDown(self):
+        cache.clear_categories()
+
+    def _set_stored_version(self, version: int) -> None:
+        query_mock = self.mock_db.query.return_value
+        query_mock.filter.return_value.scalar.return_value = version
+
+    def test_setCategory_cachesMetadata(self) -> None:
+        # Act
+        cache.set_category(self.category)
+
+        # Assert
+        self.assertEqual(
+            cache.CategoryMetadata.from_category(self.category),
+            cache.get_category(self.category.id),
+        )
+
+    @patch.object(cache._version_check, "interval_seconds", 0)
+    def test_syncVersion_skipsQuery_whenDisabled(self) -> None:
+        # Act
+        cache.sync_version(self.mock_db)
+
+        # Assert
+        self.mock_db.query.assert_not_called()
+
+    @patch.object(cache._version_check, "interval_seconds", 5)
+    @patch("forum_system_api.services.utils.cache_version.time.monotonic")
+    def test_syncVersion_dropsCache_whenVersionChanged(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self._set_stored_version(1)
+        cache.sync_version(self.mock_db)
+        cache.set_category(self.category)
+        mock_monotonic.return_value = 106.0
+        self._set_stored_version(2)
+
+        # Act
+        cache.sync_version(self.mock_db)
+
+        # Assert
+        self.assertIsNone(cache.get_category(self.category.id))
+
+    @patch.object(cache._version_check, "interval_seconds", 5)
+    @patch("forum_system_api.services.utils.cache_version.time.monotonic")
+    def test_syncVersion_keepsCache_withinCheckInterval(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self._set_stored_version(1)
+        cache.sync_version(self.mock_db)
+        cache.set_category(self.category)
+        mock_monotonic.return_value = 102.0
+        self._set_stored_version(2)
+
+        # Act
+        cache.sync_version(self.mock_db)
+
+        # Assert
+        self.assertIsNotNone(cache.get_category(self.category.id))
+        self.mock_db.query.assert_called_once()
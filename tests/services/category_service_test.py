@@ -7,7 +7,13 @@ from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.category import Category
 from forum_system_api.schemas.category import CategoryResponse, CreateCategory
+from forum_system_api.schemas.common import FilterParams
 from forum_system_api.services import category_service
+from forum_system_api.services.utils.category_cache import (
+    CategoryMetadata,
+    clear_categories,
+    get_category,
+)
 from tests.services.test_data import CATEGORY_1, CATEGORY_2
 from tests.services.utils import assert_filter_called_with
 
@@ -15,6 +21,7 @@ from tests.services.utils import assert_filter_called_with
 class CategoryService_Should(unittest.TestCase):
 
     def setUp(self):
+        clear_categories()
         self.mock_db = MagicMock(spec=Session)
         self.category_id = uuid4()
         self.category = Category(**CATEGORY_1)
@@ -46,31 +53,71 @@ class CategoryService_Should(unittest.TestCase):
     def test_getAll_returnsAllCategories(self) -> None:
         # Arrange
         query_mock = self.mock_db.query.return_value
-        query_mock.all.return_value = [self.category, self.category2]
+        paginated_mock = (
+            query_mock.outerjoin.return_value.group_by.return_value.order_by.return_value.offset.return_value.limit.return_value
+        )
+        paginated_mock.all.return_value = [(self.category, 3), (self.category2, 0)]
 
         # Act
-        categories = category_service.get_all(self.mock_db)
+        categories = category_service.get_all(FilterParams(), self.mock_db)
 
         # Assert
         self.assertListEqual(
-            categories, [CategoryResponse(**CATEGORY_1), CategoryResponse(**CATEGORY_2)]
+            categories,
+            [
+                CategoryResponse(**CATEGORY_1, topic_count=3),
+                CategoryResponse(**CATEGORY_2, topic_count=0),
+            ],
         )
-        self.mock_db.query.assert_called_once_with(Category)
-        query_mock.all.assert_called_once()
+        self.mock_db.query.assert_called_once()
+        self.assertEqual(self.mock_db.query.call_args.args[0], Category)
+        paginated_mock.all.assert_called_once()
+
+    def test_getAll_appliesPagination(self) -> None:
+        # Arrange
+        filter_params = FilterParams(limit=5, offset=10)
+        order_by_mock = (
+            self.mock_db.query.return_value.outerjoin.return_value.group_by.return_value.order_by.return_value
+        )
+        order_by_mock.offset.return_value.limit.return_value.all.return_value = [
+            (self.category, 1)
+        ]
+
+        # Act
+        category_service.get_all(filter_params, self.mock_db)
+
+        # Assert
+        order_by_mock.offset.assert_called_once_with(10)
+        order_by_mock.offset.return_value.limit.assert_called_once_with(5)
 
     def test_getAll_raisesHTTP404_whenNoCategoriesExist(self) -> None:
         # Arrange
         query_mock = self.mock_db.query.return_value
-        query_mock.all.return_value = []
+        paginated_mock = (
+            query_mock.outerjoin.return_value.group_by.return_value.order_by.return_value.offset.return_value.limit.return_value
+        )
+        paginated_mock.all.return_value = []
 
         # Act & Assert
         with self.assertRaises(category_service.HTTPException) as context:
-            category_service.get_all(self.mock_db)
+            category_service.get_all(FilterParams(), self.mock_db)
 
         self.assertEqual(context.exception.status_code, 404)
         self.assertEqual(context.exception.detail, "There are no categories yet")
-        self.mock_db.query.assert_called_once_with(Category)
-        query_mock.all.assert_called_once()
+        paginated_mock.all.assert_called_once()
+
+    def test_getAll_returnsEmptyList_whenOffsetIsPastLastCategory(self) -> None:
+        # Arrange
+        order_by_mock = (
+            self.mock_db.query.return_value.outerjoin.return_value.group_by.return_value.order_by.return_value
+        )
+        order_by_mock.offset.return_value.limit.return_value.all.return_value = []
+
+        # Act
+        categories = category_service.get_all(FilterParams(offset=40), self.mock_db)
+
+        # Assert
+        self.assertEqual(categories, [])
 
     def test_getById_returnsCorrect_whenCategoryIsFound(self) -> None:
         # Arrange
@@ -100,6 +147,34 @@ class CategoryService_Should(unittest.TestCase):
         self.mock_db.query.assert_called_once_with(Category)
         assert_filter_called_with(query_mock, Category.id == self.category_id)
 
+    @patch("forum_system_api.services.category_service.sync_version")
+    def test_getMetadata_returnsMetadata_andCachesIt(self, mock_sync_version) -> None:
+        # Arrange
+        query_mock = self.mock_db.query.return_value
+        filter_mock = query_mock.filter.return_value
+        filter_mock.first.return_value = self.category
+
+        # Act
+        first = category_service.get_metadata(self.category.id, self.mock_db)
+        second = category_service.get_metadata(self.category.id, self.mock_db)
+
+        # Assert
+        self.assertEqual(CategoryMetadata.from_category(self.category), first)
+        self.assertEqual(first, second)
+        self.mock_db.query.assert_called_once_with(Category)
+
+    def test_getMetadata_returnsNone_whenCategoryIsNotFound(self) -> None:
+        # Arrange
+        query_mock = self.mock_db.query.return_value
+        query_mock.filter.return_value.first.return_value = None
+
+        # Act
+        metadata = category_service.get_metadata(self.category_id, self.mock_db)
+
+        # Assert
+        self.assertIsNone(metadata)
+        self.assertIsNone(get_category(self.category_id))
+
     def test_makePrivateOrPublic_updatesPrivacySuccessfully(self) -> None:
         # Arrange
         query_mock = self.mock_db.query.return_value
@@ -113,6 +188,8 @@ class CategoryService_Should(unittest.TestCase):
 
         # Assert
         self.assertTrue(updated_category.is_private)
+        self.assertTrue(get_category(self.category.id).is_private)
+        self.mock_db.execute.assert_called_once()
         self.mock_db.commit.assert_called_once()
         self.mock_db.refresh.assert_called_once_with(updated_category)
         assert_filter_called_with(query_mock, Category.id == self.category_id)
@@ -144,6 +221,8 @@ class CategoryService_Should(unittest.TestCase):
 
         # Assert
         self.assertTrue(locked_category.is_locked)
+        self.assertTrue(get_category(self.category.id).is_locked)
+        self.mock_db.execute.assert_called_once()
         self.mock_db.commit.assert_called_once()
         self.mock_db.refresh.assert_called_once_with(locked_category)
         assert_filter_called_with(query_mock, Category.id == self.category_id)
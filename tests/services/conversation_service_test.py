@@ -1,66 +1,376 @@
 import unittest
-from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.conversation import Conversation
 from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
+from forum_system_api.schemas.common import InboxFilterParams, MessageFilterParams
 from forum_system_api.services.conversation_service import (
+    MESSAGE_SYNC_OVERLAP,
+    InboxEntry,
+    build_inbox_query,
+    get_conversation,
+    get_inbox,
     get_messages_with_receiver,
+    get_next_message_cursor,
+    get_sync_cursor,
     get_users_from_conversations,
 )
+from forum_system_api.services.utils.conversation_utils import order_participants
+from forum_system_api.services.utils.cursor_utils import (
+    decode_sync_cursor,
+    encode_cursor,
+    encode_sync_cursor,
+)
 
 
 class GetUsersFromConversations_Should(unittest.TestCase):
     def setUp(self):
-        self.user1 = Mock(spec=User)
-        self.user2 = Mock(spec=User)
-        self.user3 = Mock(spec=User)
+        self.mock_db = MagicMock(spec=Session)
+        self.user = User(id=uuid4())
+        self.contact = User(id=uuid4())
+
+    def test_returnsOtherParticipants(self) -> None:
+        # Arrange
+        query_mock = self.mock_db.query.return_value
+        query_mock.join.return_value.filter.return_value.all.return_value = [
+            self.contact
+        ]
+
+        # Act
+        users = get_users_from_conversations(self.user, self.mock_db)
+
+        # Assert
+        self.assertEqual(users, [self.contact])
+        self.mock_db.query.assert_called_once_with(User)
+        query_mock.join.assert_called_once()
+
+    def test_returnsEmptyList_whenNoConversations(self) -> None:
+        # Arrange
+        query_mock = self.mock_db.query.return_value
+        query_mock.join.return_value.filter.return_value.all.return_value = []
+
+        # Act
+        users = get_users_from_conversations(self.user, self.mock_db)
+
+        # Assert
+        self.assertEqual(users, [])
+
+
+class GetInbox_Should(unittest.TestCase):
+    def setUp(self):
+        self.mock_db = MagicMock(spec=Session)
+        self.user = User(id=uuid4())
+        self.contact = User(id=uuid4())
+        self.message = Message(id=uuid4(), created_at=datetime.now(timezone.utc))
+
+    def test_returnsInboxEntries(self) -> None:
+        # Arrange
+        conversation_id = uuid4()
+        self.mock_db.execute.return_value.all.return_value = [
+            (
+                conversation_id,
+                self.contact,
+                self.message,
+                self.message.created_at,
+                2,
+                None,
+                self.message.id,
+            )
+        ]
+
+        # Act
+        inbox = get_inbox(self.user, InboxFilterParams(), self.mock_db)
+
+        # Assert
+        self.assertEqual(
+            inbox,
+            [
+                InboxEntry(
+                    id=conversation_id,
+                    user=self.contact,
+                    last_message=self.message,
+                    last_message_at=self.message.created_at,
+                    unread_count=2,
+                    last_read_message_id=None,
+                    receiver_last_read_message_id=self.message.id,
+                )
+            ],
+        )
+        self.mock_db.execute.assert_called_once()
+
+    def test_buildInboxQuery_sortsByRecencyAndPaginates(self) -> None:
+        # Act
+        query = build_inbox_query(
+            user_id=self.user.id, filter_params=InboxFilterParams(limit=5, offset=10)
+        )
+
+        # Assert
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        self.assertIn("LATERAL", sql)
+        self.assertIn("count(messages.id)", sql)
+        self.assertIn("LEFT OUTER JOIN conversation_read_cursors", sql)
+        self.assertIn(
+            "ORDER BY coalesce(anon_1.created_at, conversations.created_at) DESC", sql
+        )
+        self.assertEqual(query._limit, 5)
+        self.assertEqual(query._offset, 10)
+
+
+class GetMessagesWithReceiver_Should(unittest.TestCase):
+    def setUp(self):
+        self.mock_db = MagicMock(spec=Session)
+        self.user = User(id=uuid4())
         self.receiver_id = uuid4()
+        self.conversation = Conversation(id=uuid4())
+        created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.messages = [
+            Message(id=uuid4(), created_at=created_at + timedelta(minutes=minute))
+            for minute in range(3)
+        ]
 
-        self.conversation = Mock()
-        self.conversation.user1 = self.user1
-        self.conversation.user2 = self.user2
-        self.conversation.messages = [Mock(spec=Message)]
+    def test_getConversation_filtersByOrderedPair(self) -> None:
+        # Arrange
+        user1_id, user2_id = order_participants(self.user.id, self.receiver_id)
+        filter_mock = self.mock_db.query.return_value.filter
+        filter_mock.return_value.first.return_value = self.conversation
 
-        self.user1.conversations = [self.conversation]
+        # Act
+        conversation = get_conversation(self.receiver_id, self.user.id, self.mock_db)
+
+        # Assert
+        self.assertEqual(conversation, self.conversation)
+        self.mock_db.query.assert_called_once_with(Conversation)
+        self.assertListEqual(
+            [str(arg) for arg in filter_mock.call_args.args],
+            [
+                str(Conversation.user1_id == user1_id),
+                str(Conversation.user2_id == user2_id),
+            ],
+        )
+
+    @patch("forum_system_api.services.conversation_service.get_conversation")
+    def test_returnsEmptyList_whenNoConversationExists(
+        self, mock_get_conversation
+    ) -> None:
+        # Arrange
+        mock_get_conversation.return_value = None
 
-    def test_return_users_in_conversations(self):
         # Act
-        users = get_users_from_conversations(self.user1)
+        messages = get_messages_with_receiver(
+            self.user, self.receiver_id, MessageFilterParams(), self.mock_db
+        )
 
         # Assert
-        expected_users = {self.user1, self.user2}
-        self.assertEqual(set(users), expected_users)
+        self.assertEqual(messages, [])
+        self.mock_db.query.assert_not_called()
 
-    def test_return_empty_list_if_no_conversations(self):
+    @patch("forum_system_api.services.conversation_service.get_conversation")
+    def test_returnsPageOfMessages(self, mock_get_conversation) -> None:
         # Arrange
-        self.user1.conversations = []
+        mock_get_conversation.return_value = self.conversation
+        order_by_mock = self.mock_db.query.return_value.filter.return_value.order_by
+        order_by_mock.return_value.limit.return_value.all.return_value = self.messages
 
         # Act
-        users = get_users_from_conversations(self.user1)
+        messages = get_messages_with_receiver(
+            self.user, self.receiver_id, MessageFilterParams(limit=3), self.mock_db
+        )
 
         # Assert
-        self.assertEqual(set(users), set())
+        self.assertEqual(messages, self.messages)
+        self.mock_db.query.assert_called_once_with(Message)
+        order_by_mock.return_value.limit.assert_called_once_with(3)
+        self.assertIn("DESC", str(order_by_mock.call_args.args[0]))
 
-    def test_return_messages_with_receiver(self):
+    @patch("forum_system_api.services.conversation_service.get_conversation")
+    def test_returnsNewerMessagesOldestFirst_withSinceCursor(
+        self, mock_get_conversation
+    ) -> None:
         # Arrange
-        self.conversation.user1_id = self.user1.id
-        self.conversation.user2_id = self.receiver_id
+        mock_get_conversation.return_value = self.conversation
+        since = encode_sync_cursor(
+            sort_key="created_at",
+            sort_value=self.messages[0].created_at,
+            row_id=self.messages[0].id,
+            seen={self.messages[0].id: self.messages[0].created_at},
+        )
+        order_by_mock = self.mock_db.query.return_value.filter.return_value.order_by
+        paged_mock = order_by_mock.return_value.filter.return_value.limit
+        paged_mock.return_value.all.return_value = self.messages[1:]
 
-        self.conversation.messages = [Mock(spec=Message)]
+        # Act
+        messages = get_messages_with_receiver(
+            self.user,
+            self.receiver_id,
+            MessageFilterParams(since=since),
+            self.mock_db,
+        )
 
+        # Assert
+        self.assertEqual(messages, self.messages[1:])
+        self.assertIn("ASC", str(order_by_mock.call_args.args[0]))
+        window_filter, seen_filter = order_by_mock.return_value.filter.call_args.args
+        self.assertEqual(window_filter.operator.__name__, "gt")
+        self.assertEqual(
+            window_filter.right.value,
+            self.messages[0].created_at - MESSAGE_SYNC_OVERLAP,
+        )
+        self.assertEqual(seen_filter.operator.__name__, "not_in_op")
+        self.assertEqual(seen_filter.right.value, [self.messages[0].id])
+
+    @patch("forum_system_api.services.conversation_service.get_conversation")
+    def test_raisesHTTP400_withInvalidCursor(self, mock_get_conversation) -> None:
+        # Arrange
+        mock_get_conversation.return_value = self.conversation
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            get_messages_with_receiver(
+                self.user,
+                self.receiver_id,
+                MessageFilterParams(after="invalid"),
+                self.mock_db,
+            )
+
+        self.assertEqual(context.exception.status_code, 400)
+
+    def test_raisesHTTP400_withAfterAndSince(self) -> None:
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            get_messages_with_receiver(
+                self.user,
+                self.receiver_id,
+                MessageFilterParams(after="after", since="since"),
+                self.mock_db,
+            )
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.mock_db.query.assert_not_called()
+
+    def test_getNextMessageCursor_returnsCursor_forFullPage(self) -> None:
         # Act
-        messages = get_messages_with_receiver(self.user1, self.receiver_id)
+        cursor = get_next_message_cursor(self.messages, MessageFilterParams(limit=3))
 
         # Assert
-        self.assertEqual(messages, self.conversation.messages)
+        self.assertEqual(
+            cursor,
+            encode_cursor(
+                sort_key="created_at",
+                sort_value=self.messages[-1].created_at,
+                row_id=self.messages[-1].id,
+            ),
+        )
+
+    def test_getNextMessageCursor_returnsNone_forLastPage(self) -> None:
+        # Act
+        cursor = get_next_message_cursor(self.messages, MessageFilterParams(limit=4))
 
-    def test_return_empty_list_if_no_conversation_with_receiver(self):
+        # Assert
+        self.assertIsNone(cursor)
+
+    def test_getSyncCursor_returnsNewestMessageCursor(self) -> None:
         # Arrange
-        self.user1.conversations = []
+        since = encode_sync_cursor(
+            sort_key="created_at",
+            sort_value=self.messages[0].created_at,
+            row_id=self.messages[0].id,
+            seen={self.messages[0].id: self.messages[0].created_at},
+        )
 
         # Act
-        messages = get_messages_with_receiver(self.user1, self.receiver_id)
+        cursor = get_sync_cursor(self.messages[1:], MessageFilterParams(since=since))
 
         # Assert
-        self.assertEqual(messages, [])
+        self.assertEqual(
+            decode_sync_cursor(cursor, "created_at"),
+            (
+                self.messages[-1].created_at,
+                self.messages[-1].id,
+                {self.messages[-1].id: self.messages[-1].created_at},
+            ),
+        )
+
+    def test_getSyncCursor_keepsSeenMessages_withinOverlap(self) -> None:
+        # Arrange
+        late_message = Message(
+            id=uuid4(), created_at=self.messages[-1].created_at - timedelta(seconds=1)
+        )
+        since = encode_sync_cursor(
+            sort_key="created_at",
+            sort_value=self.messages[-1].created_at,
+            row_id=self.messages[-1].id,
+            seen={self.messages[-1].id: self.messages[-1].created_at},
+        )
+
+        # Act
+        cursor = get_sync_cursor([late_message], MessageFilterParams(since=since))
+
+        # Assert
+        self.assertEqual(
+            decode_sync_cursor(cursor, "created_at"),
+            (
+                self.messages[-1].created_at,
+                self.messages[-1].id,
+                {
+                    self.messages[-1].id: self.messages[-1].created_at,
+                    late_message.id: late_message.created_at,
+                },
+            ),
+        )
+
+    def test_getSyncCursor_dropsMessagesOutsideOverlap_whenSyncingContinuously(
+        self,
+    ) -> None:
+        # Arrange
+        since = None
+        created_at = self.messages[0].created_at
+
+        # Act
+        for second in range(0, 500, 2):
+            message = Message(
+                id=uuid4(), created_at=created_at + timedelta(seconds=second)
+            )
+            since = get_sync_cursor([message], MessageFilterParams(since=since))
+
+        # Assert
+        newest_at, _, seen = decode_sync_cursor(since, "created_at")
+        self.assertLessEqual(len(since), 8000)
+        self.assertEqual(len(seen), MESSAGE_SYNC_OVERLAP // timedelta(seconds=2))
+        self.assertTrue(
+            all(seen_at > newest_at - MESSAGE_SYNC_OVERLAP for seen_at in seen.values())
+        )
+
+    def test_getSyncCursor_returnsSince_whenNoNewMessages(self) -> None:
+        # Act
+        cursor = get_sync_cursor([], MessageFilterParams(since="since"))
+
+        # Assert
+        self.assertEqual(cursor, "since")
+
+    def test_getSyncCursor_returnsNewestMessageCursor_forFirstPage(self) -> None:
+        # Act
+        cursor = get_sync_cursor(list(reversed(self.messages)), MessageFilterParams())
+
+        # Assert
+        self.assertEqual(
+            decode_sync_cursor(cursor, "created_at"),
+            (
+                self.messages[-1].created_at,
+                self.messages[-1].id,
+                {self.messages[-1].id: self.messages[-1].created_at},
+            ),
+        )
+
+    def test_getSyncCursor_returnsNone_forLaterPages(self) -> None:
+        # Act
+        cursor = get_sync_cursor(self.messages, MessageFilterParams(after="after"))
+
+        # Assert
+        self.assertIsNone(cursor)
@@ -0,0 +1,30 @@
+import unittest
+from uuid import UUID
+
+from forum_system_api.services.utils.conversation_utils import order_participants
+
+SMALLER_ID = UUID("00000000-0000-0000-0000-000000000001")
+LARGER_ID = UUID("ffffffff-0000-0000-0000-000000000000")
+
+
+class ConversationUtils_Should(unittest.TestCase):
+    def test_orderParticipants_keepsOrderedPair(self) -> None:
+        # Act
+        result = order_participants(SMALLER_ID, LARGER_ID)
+
+        # Assert
+        self.assertEqual((SMALLER_ID, LARGER_ID), result)
+
+    def test_orderParticipants_swapsReversedPair(self) -> None:
+        # Act
+        result = order_participants(LARGER_ID, SMALLER_ID)
+
+        # Assert
+        self.assertEqual((SMALLER_ID, LARGER_ID), result)
+
+    def test_orderParticipants_keepsSameUserPair(self) -> None:
+        # Act
+        result = order_participants(SMALLER_ID, SMALLER_ID)
+
+        # Assert
+        self.assertEqual((SMALLER_ID, SMALLER_ID), result)
@@ -0,0 +1,132 @@
+import base64
+import json
+import unittest
+from datetime import timedelta
+
+from fastapi import HTTPException, status
+
+from forum_system_api.services.utils import cursor_utils as utils
+from tests.services import test_data_const as tc
+
+
+def _forge_cursor(sort_key, sort_value, datetime_value):
+    payload = {
+        "key": sort_key,
+        "value": sort_value,
+        "datetime": datetime_value,
+        "id": str(tc.VALID_TOPIC_ID_1),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class CursorUtilsShould(unittest.TestCase):
+    def test_decode_cursor_returnsDatetimeValue(self):
+        cursor = utils.encode_cursor(
+            "created_at", tc.VALID_TOPIC_CREATED_AT_1, tc.VALID_TOPIC_ID_1
+        )
+
+        result = utils.decode_cursor(cursor, "created_at")
+
+        self.assertEqual(result, (tc.VALID_TOPIC_CREATED_AT_1, tc.VALID_TOPIC_ID_1))
+
+    def test_decode_cursor_returnsStringValue(self):
+        cursor = utils.encode_cursor(
+            "title", tc.VALID_TOPIC_TITLE_1, tc.VALID_TOPIC_ID_1
+        )
+
+        result = utils.decode_cursor(cursor, "title")
+
+        self.assertEqual(result, (tc.VALID_TOPIC_TITLE_1, tc.VALID_TOPIC_ID_1))
+
+    def test_decode_cursor_differentSortKey_raises400(self):
+        cursor = utils.encode_cursor(
+            "title", tc.VALID_TOPIC_TITLE_1, tc.VALID_TOPIC_ID_1
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_cursor(cursor, "created_at")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+
+    def test_decode_cursor_malformedCursor_raises400(self):
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_cursor("not-a-cursor", "created_at")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+
+    def test_decode_cursor_stringValueForDatetimeKey_raises400(self):
+        cursor = _forge_cursor("created_at", "not-a-date", datetime_value=False)
+
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_cursor(cursor, "created_at")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+
+    def test_decode_cursor_numberValueForStringKey_raises400(self):
+        cursor = _forge_cursor("title", 42, datetime_value=False)
+
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_cursor(cursor, "title")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+
+    def test_decode_cursor_datetimeValueForStringKey_raises400(self):
+        cursor = _forge_cursor(
+            "title", tc.VALID_TOPIC_CREATED_AT_1.isoformat(), datetime_value=True
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_cursor(cursor, "title")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+
+    def test_decode_sync_cursor_returnsSeenMessages(self):
+        cursor = utils.encode_sync_cursor(
+            "created_at",
+            tc.VALID_TOPIC_CREATED_AT_1,
+            tc.VALID_TOPIC_ID_1,
+            {
+                tc.VALID_TOPIC_ID_1: tc.VALID_TOPIC_CREATED_AT_1,
+                tc.VALID_TOPIC_ID_2: tc.VALID_TOPIC_CREATED_AT_1
+                - timedelta(seconds=1, microseconds=5),
+            },
+        )
+
+        result = utils.decode_sync_cursor(cursor, "created_at")
+
+        self.assertEqual(
+            result,
+            (
+                tc.VALID_TOPIC_CREATED_AT_1,
+                tc.VALID_TOPIC_ID_1,
+                {
+                    tc.VALID_TOPIC_ID_1: tc.VALID_TOPIC_CREATED_AT_1,
+                    tc.VALID_TOPIC_ID_2: tc.VALID_TOPIC_CREATED_AT_1
+                    - timedelta(seconds=1, microseconds=5),
+                },
+            ),
+        )
+
+    def test_decode_sync_cursor_returnsNoSeenMessages_forPlainCursor(self):
+        cursor = utils.encode_cursor(
+            "created_at", tc.VALID_TOPIC_CREATED_AT_1, tc.VALID_TOPIC_ID_1
+        )
+
+        result = utils.decode_sync_cursor(cursor, "created_at")
+
+        self.assertEqual(result, (tc.VALID_TOPIC_CREATED_AT_1, tc.VALID_TOPIC_ID_1, {}))
+
+    def test_decode_sync_cursor_stringValue_raises400(self):
+        cursor = utils.encode_cursor(
+            "created_at", tc.VALID_TOPIC_TITLE_1, tc.VALID_TOPIC_ID_1
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            utils.decode_sync_cursor(cursor, "created_at")
+
+        self.assertEqual(context.exception.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,16 +1,30 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.conversation import Conversation
+from forum_system_api.persistence.models.conversation_read_cursor import (
+    ConversationReadCursor,
+)
+from forum_system_api.persistence.models.message import Message
 from forum_system_api.persistence.models.user import User
 from forum_system_api.schemas.message import MessageCreate
 from forum_system_api.services.message_service import (
+    ReadReceipt,
     get_or_create_conversation,
+    get_or_create_conversation_async,
+    mark_as_read,
+    mark_as_read_async,
     send_message,
+    send_message_async,
 )
+from forum_system_api.services.utils.conversation_utils import order_participants
 from tests.services.test_data import USER_1, USER_2
 from tests.services.utils import assert_filter_called_with
 
@@ -31,9 +45,9 @@ class MessageService_Should(unittest.TestCase):
 
     def test_get_or_create_conversation_existing_conversation(self) -> None:
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            self.conversation
-        )
+        user1_id, user2_id = order_participants(self.sender.id, self.receiver.id)
+        filter_mock = self.mock_db.query.return_value.filter
+        filter_mock.return_value.first.return_value = self.conversation
 
         # Act
         result = get_or_create_conversation(
@@ -42,22 +56,39 @@ class MessageService_Should(unittest.TestCase):
 
         # Assert
         self.assertEqual(result, self.conversation)
-        assert_filter_called_with(
-            self.mock_db.query.return_value,
-            (
-                (Conversation.user1_id == self.sender.id)
-                & (Conversation.user2_id == self.receiver.id)
-            )
-            | (
-                (Conversation.user1_id == self.receiver.id)
-                & (Conversation.user2_id == self.sender.id)
-            ),
+        self.assertListEqual(
+            [str(arg) for arg in filter_mock.call_args.args],
+            [
+                str(Conversation.user1_id == user1_id),
+                str(Conversation.user2_id == user2_id),
+            ],
+        )
+        self.mock_db.execute.assert_not_called()
+
+    def test_get_or_create_conversation_looksUpOrderedPair_forEitherSender(
+        self,
+    ) -> None:
+        # Arrange
+        filter_mock = self.mock_db.query.return_value.filter
+        filter_mock.return_value.first.return_value = self.conversation
+
+        # Act
+        get_or_create_conversation(self.mock_db, self.sender.id, self.receiver.id)
+        get_or_create_conversation(self.mock_db, self.receiver.id, self.sender.id)
+
+        # Assert
+        first_call, second_call = filter_mock.call_args_list
+        self.assertEqual(
+            [str(arg.right.value) for arg in first_call.args],
+            [str(arg.right.value) for arg in second_call.args],
         )
 
     def test_get_or_create_conversation_creates_new_conversation(self) -> None:
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
-        self.mock_db.add.return_value = None
+        self.mock_db.query.return_value.filter.return_value.first.side_effect = [
+            None,
+            self.conversation,
+        ]
 
         # Act
         result = get_or_create_conversation(
@@ -65,11 +96,14 @@ class MessageService_Should(unittest.TestCase):
         )
 
         # Assert
-        self.mock_db.add.assert_called_once_with(result)
+        self.assertEqual(result, self.conversation)
+        self.mock_db.execute.assert_called_once()
+        statement = self.mock_db.execute.call_args.args[0]
+        self.assertIn(
+            "ON CONFLICT", str(statement.compile(dialect=postgresql.dialect()))
+        )
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(result)
-        self.assertEqual(result.user1_id, self.sender.id)
-        self.assertEqual(result.user2_id, self.receiver.id)
+        self.mock_db.add.assert_not_called()
 
     def test_send_message_receiver_not_found(self) -> None:
         # Arrange
@@ -107,5 +141,209 @@ class MessageService_Should(unittest.TestCase):
             self.mock_db, self.sender.id, self.message_data.receiver_id
         )
         self.mock_db.add.assert_called_once_with(message)
+        self.mock_db.flush.assert_called_once()
+        self.mock_db.execute.assert_called_once()
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(message)
+        self.mock_db.refresh.assert_called_with(message)
+
+    def test_mark_as_read_movesCursorForward(self) -> None:
+        # Arrange
+        message = Message(
+            id=uuid4(),
+            conversation_id=self.conversation.id,
+            created_at=datetime.now(timezone.utc),
+        )
+        cursor = ConversationReadCursor(
+            conversation_id=self.conversation.id,
+            user_id=self.sender.id,
+            last_read_message_id=message.id,
+            last_read_at=message.created_at,
+        )
+        self.mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+            message,
+            self.conversation,
+        )
+        self.mock_db.get.return_value = cursor
+
+        # Act
+        read_receipt = mark_as_read(self.mock_db, message.id, self.sender)
+
+        # Assert
+        self.assertEqual(
+            read_receipt,
+            ReadReceipt(
+                conversation_id=self.conversation.id,
+                user_id=self.sender.id,
+                receiver_id=self.receiver.id,
+                last_read_message_id=message.id,
+                last_read_at=message.created_at,
+            ),
+        )
+        statement = self.mock_db.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (conversation_id, user_id) DO UPDATE", sql)
+        self.assertIn(
+            "WHERE (conversation_read_cursors.last_read_at, "
+            "conversation_read_cursors.last_read_message_id) < "
+            "(excluded.last_read_at, excluded.last_read_message_id)",
+            sql,
+        )
+        self.mock_db.commit.assert_called_once()
+        self.mock_db.get.assert_called_once_with(
+            ConversationReadCursor,
+            (self.conversation.id, self.sender.id),
+            populate_existing=True,
+        )
+
+    def test_mark_as_read_raisesHTTP404_whenMessageNotFound(self) -> None:
+        # Arrange
+        self.mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+            None
+        )
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as exc:
+            mark_as_read(self.mock_db, uuid4(), self.sender)
+
+        self.assertEqual(exc.exception.status_code, 404)
+        self.mock_db.execute.assert_not_called()
+
+    def test_mark_as_read_raisesHTTP403_whenUserIsNotParticipant(self) -> None:
+        # Arrange
+        message = Message(id=uuid4(), conversation_id=self.conversation.id)
+        self.mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+            message,
+            self.conversation,
+        )
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as exc:
+            mark_as_read(self.mock_db, message.id, User(id=uuid4()))
+
+        self.assertEqual(exc.exception.status_code, 403)
+        self.mock_db.execute.assert_not_called()
+
+
+class MessageServiceAsync_Should(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.mock_db = MagicMock(spec=AsyncSession)
+
+        self.sender = User(**USER_1)
+        self.receiver = User(**USER_2)
+        self.conversation = Conversation(
+            id=1, user1_id=self.sender.id, user2_id=self.receiver.id
+        )
+        self.message_data = MessageCreate(
+            content="Hello!", receiver_id=self.receiver.id
+        )
+
+    async def test_get_or_create_conversation_async_existing_conversation(
+        self,
+    ) -> None:
+        # Arrange
+        result_mock = MagicMock()
+        result_mock.scalars.return_value.first.return_value = self.conversation
+        self.mock_db.execute.return_value = result_mock
+
+        # Act
+        result = await get_or_create_conversation_async(
+            self.mock_db, self.sender.id, self.receiver.id
+        )
+
+        # Assert
+        self.assertEqual(result, self.conversation)
+        self.mock_db.execute.assert_awaited_once()
+        self.mock_db.add.assert_not_called()
+
+    async def test_get_or_create_conversation_async_creates_new_conversation(
+        self,
+    ) -> None:
+        # Arrange
+        missing_mock = MagicMock()
+        missing_mock.scalars.return_value.first.return_value = None
+        found_mock = MagicMock()
+        found_mock.scalars.return_value.first.return_value = self.conversation
+        self.mock_db.execute.side_effect = [missing_mock, MagicMock(), found_mock]
+
+        # Act
+        result = await get_or_create_conversation_async(
+            self.mock_db, self.sender.id, self.receiver.id
+        )
+
+        # Assert
+        self.assertEqual(result, self.conversation)
+        self.assertEqual(self.mock_db.execute.await_count, 3)
+        statement = self.mock_db.execute.await_args_list[1].args[0]
+        self.assertIn(
+            "ON CONFLICT", str(statement.compile(dialect=postgresql.dialect()))
+        )
+        self.mock_db.commit.assert_awaited_once()
+        self.mock_db.add.assert_not_called()
+
+    async def test_send_message_async_receiver_not_found(self) -> None:
+        # Arrange
+        self.mock_db.get.return_value = None
+
+        # Act & Assert
+        with self.assertRaises(HTTPException) as exc:
+            await send_message_async(self.mock_db, self.message_data, self.sender)
+
+        self.assertEqual(exc.exception.status_code, 404)
+        self.assertEqual(exc.exception.detail, "Receiver not found")
+        self.mock_db.get.assert_awaited_once_with(User, self.receiver.id)
+
+    @patch(
+        "forum_system_api.services.message_service.get_or_create_conversation_async",
+        new_callable=AsyncMock,
+    )
+    async def test_send_message_async_creates_message(
+        self, mock_get_or_create_conversation_async
+    ) -> None:
+        # Arrange
+        self.mock_db.get.return_value = self.receiver
+        mock_get_or_create_conversation_async.return_value = self.conversation
+
+        # Act
+        message = await send_message_async(self.mock_db, self.message_data, self.sender)
+
+        # Assert
+        self.assertEqual(message.content, self.message_data.content)
+        self.assertEqual(message.author_id, self.sender.id)
+        mock_get_or_create_conversation_async.assert_awaited_once_with(
+            self.mock_db, self.sender.id, self.message_data.receiver_id
+        )
+        self.mock_db.add.assert_called_once_with(message)
+        self.mock_db.flush.assert_awaited_once()
+        self.mock_db.refresh.assert_awaited_once_with(message)
+        self.mock_db.execute.assert_awaited_once()
+        self.mock_db.commit.assert_awaited_once()
+
+    async def test_mark_as_read_async_movesCursorForward(self) -> None:
+        # Arrange
+        message = Message(
+            id=uuid4(),
+            conversation_id=self.conversation.id,
+            created_at=datetime.now(timezone.utc),
+        )
+        cursor = ConversationReadCursor(
+            conversation_id=self.conversation.id,
+            user_id=self.receiver.id,
+            last_read_message_id=message.id,
+            last_read_at=message.created_at,
+        )
+        self.mock_db.execute.return_value = MagicMock()
+        self.mock_db.execute.return_value.first.return_value = (
+            message,
+            self.conversation,
+        )
+        self.mock_db.get.return_value = cursor
+
+        # Act
+        read_receipt = await mark_as_read_async(self.mock_db, message.id, self.receiver)
+
+        # Assert
+        self.assertEqual(read_receipt.receiver_id, self.sender.id)
+        self.assertEqual(read_receipt.last_read_message_id, message.id)
+        self.assertEqual(self.mock_db.execute.await_count, 2)
+        self.mock_db.commit.assert_awaited_once()
@@ -0,0 +1,166 @@
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from forum_system_api.persistence.pool import InstrumentedQueuePool, PoolWaitMetrics
+from forum_system_api.services import pool_service
+
+
+class PoolWaitMetrics_Should(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = PoolWaitMetrics()
+
+    def test_record_accumulatesCheckouts(self) -> None:
+        # Act
+        self.metrics.record(0.5)
+        self.metrics.record(1.5)
+
+        # Assert
+        stats = self.metrics.snapshot()
+        self.assertEqual(stats.checkouts, 2)
+        self.assertEqual(stats.timeouts, 0)
+        self.assertEqual(stats.total_wait_seconds, 2.0)
+        self.assertEqual(stats.max_wait_seconds, 1.5)
+
+    def test_record_countsTimeoutsSeparately(self) -> None:
+        # Act
+        self.metrics.record(30.0, timed_out=True)
+
+        # Assert
+        stats = self.metrics.snapshot()
+        self.assertEqual(stats.checkouts, 0)
+        self.assertEqual(stats.timeouts, 1)
+        self.assertEqual(stats.max_wait_seconds, 30.0)
+
+    def test_reset_clearsCounters(self) -> None:
+        # Arrange
+        self.metrics.record(1.0)
+
+        # Act
+        self.metrics.reset()
+
+        # Assert
+        stats = self.metrics.snapshot()
+        self.assertEqual(stats.checkouts, 0)
+        self.assertEqual(stats.total_wait_seconds, 0.0)
+
+
+class InstrumentedQueuePool_Should(unittest.TestCase):
+
+    def test_connect_recordsCheckout(self) -> None:
+        # Arrange
+        pool = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0)
+
+        # Act
+        connection = pool.connect()
+        connection.close()
+
+        # Assert
+        self.assertEqual(pool.wait_metrics.snapshot().checkouts, 1)
+
+    def test_connect_recordsTimeout_whenPoolIsExhausted(self) -> None:
+        # Arrange
+        pool = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0)
+        connection = pool.connect()
+
+        # Act & Assert
+        with self.assertRaises(PoolTimeoutError):
+            pool.connect()
+
+        connection.close()
+        stats = pool.wait_metrics.snapshot()
+        self.assertEqual(stats.checkouts, 1)
+        self.assertEqual(stats.timeouts, 1)
+
+    def test_connect_recordsCheckoutsPerPool(self) -> None:
+        # Arrange
+        primary = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0)
+        replica = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0)
+
+        # Act
+        primary.connect().close()
+
+        # Assert
+        self.assertEqual(primary.wait_metrics.snapshot().checkouts, 1)
+        self.assertEqual(replica.wait_metrics.snapshot().checkouts, 0)
+
+
+class PoolService_Should(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = MagicMock(spec=Engine)
+
+    def test_getPoolStatus_returnsPoolCountsAndWaitTimes(self) -> None:
+        # Arrange
+        pool = MagicMock(spec=InstrumentedQueuePool)
+        pool.size.return_value = 5
+        pool._max_overflow = 10
+        pool.checkedout.return_value = 7
+        pool.checkedin.return_value = 0
+        pool.overflow.return_value = 2
+        pool.wait_metrics = PoolWaitMetrics()
+        pool.wait_metrics.record(0.2)
+        pool.wait_metrics.record(0.4)
+        self.engine.pool = pool
+
+        # Act
+        status = pool_service.get_pool_status("primary", self.engine)
+
+        # Assert
+        self.assertEqual(status.name, "primary")
+        self.assertEqual(status.pool_size, 5)
+        self.assertEqual(status.max_overflow, 10)
+        self.assertEqual(status.checked_out, 7)
+        self.assertEqual(status.idle, 0)
+        self.assertEqual(status.overflow, 2)
+        self.assertEqual(status.checkouts, 2)
+        self.assertAlmostEqual(status.average_wait_seconds, 0.3)
+        self.assertAlmostEqual(status.max_wait_seconds, 0.4)
+
+    def test_getPoolStatus_reportsNegativeOverflowAsZero(self) -> None:
+        # Arrange
+        pool = MagicMock(spec=QueuePool)
+        pool.size.return_value = 5
+        pool._max_overflow = 10
+        pool.checkedout.return_value = 1
+        pool.checkedin.return_value = 0
+        pool.overflow.return_value = -4
+        self.engine.pool = pool
+
+        # Act
+        status = pool_service.get_pool_status("primary", self.engine)
+
+        # Assert
+        self.assertEqual(status.overflow, 0)
+        self.assertEqual(status.average_wait_seconds, 0.0)
+
+    def test_getPoolStatus_returnsZeroCounts_whenPoolIsNotQueued(self) -> None:
+        # Arrange
+        self.engine.pool = MagicMock(spec=NullPool)
+
+        # Act
+        status = pool_service.get_pool_status("primary", self.engine)
+
+        # Assert
+        self.assertEqual(status.pool_size, 0)
+        self.assertEqual(status.checked_out, 0)
+
+    def test_getPoolStatuses_labelsEachPool_byEngineName(self) -> None:
+        # Arrange
+        primary = MagicMock(spec=Engine)
+        primary.pool = InstrumentedQueuePool(MagicMock, pool_size=5, max_overflow=10)
+        replica = MagicMock(spec=Engine)
+        replica.pool = InstrumentedQueuePool(MagicMock, pool_size=2, max_overflow=1)
+        primary.pool.connect().close()
+
+        # Act
+        statuses = pool_service.get_pool_statuses({"primary": primary, "read": replica})
+
+        # Assert
+        self.assertEqual([status.name for status in statuses], ["primary", "read"])
+        self.assertEqual([status.max_overflow for status in statuses], [10, 1])
+        self.assertEqual([status.checkouts for status in statuses], [1, 0])
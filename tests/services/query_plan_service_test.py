@@ -0,0 +1,14 @@
+import unittest
+
+from forum_system_api.persistence.database import engine
+from forum_system_api.services.query_plan_service import find_seq_scans
+
+
+class QueryPlanService_Should(unittest.TestCase):
+    def test_findSeqScans_returnsNoQueries_whenIndexesAreMigrated(self) -> None:
+        # Act
+        with engine.connect() as connection:
+            seq_scans = find_seq_scans(connection)
+
+        # Assert
+        self.assertDictEqual({}, seq_scans)
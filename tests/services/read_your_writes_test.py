@@ -0,0 +1,267 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from fastapi import Response
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from forum_system_api.persistence.database import get_read_db
+from forum_system_api.persistence.models.user import User
+from forum_system_api.services.utils import read_your_writes
+from forum_system_api.services.utils.principal_utils import (
+    Principal,
+    _pin_principal_reads,
+    set_principal,
+)
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "headers": raw_headers})
+
+
+def _signed(last_write_at: float) -> str:
+    return read_your_writes._encode_last_write(last_write_at)
+
+
+class ReadYourWrites_Should(unittest.TestCase):
+    def setUp(self):
+        self.user_id = uuid4()
+        self.principal = Principal(
+            user_id=self.user_id,
+            load_user=lambda: User(id=self.user_id),
+            load_is_admin=lambda: False,
+        )
+
+    def test_requiresPrimary_returnsTrue_whenHeaderHasRecentWrite(self) -> None:
+        # Arrange
+        request = _request({read_your_writes.LAST_WRITE_HEADER: _signed(time.time())})
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertTrue(result)
+
+    def test_requiresPrimary_returnsTrue_whenCookieHasRecentWrite(self) -> None:
+        # Arrange
+        request = _request(
+            {"Cookie": f"{read_your_writes.LAST_WRITE_COOKIE}={_signed(time.time())}"}
+        )
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertTrue(result)
+
+    @patch(
+        "forum_system_api.services.utils.read_your_writes.READ_YOUR_WRITES_SECONDS", 5
+    )
+    def test_requiresPrimary_returnsFalse_whenWriteIsOlderThanWindow(self) -> None:
+        # Arrange
+        request = _request(
+            {read_your_writes.LAST_WRITE_HEADER: _signed(time.time() - 10)}
+        )
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsFalse_withoutWrite(self) -> None:
+        # Act
+        result = read_your_writes.requires_primary(_request())
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsFalse_withInvalidValue(self) -> None:
+        # Arrange
+        request = _request({read_your_writes.LAST_WRITE_HEADER: "invalid"})
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsFalse_whenSignatureIsInvalid(self) -> None:
+        # Arrange
+        forged = f"{time.time():.6f}.{'0' * 64}"
+        request = _request({read_your_writes.LAST_WRITE_HEADER: forged})
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsFalse_whenUnsigned(self) -> None:
+        # Arrange
+        request = _request({read_your_writes.LAST_WRITE_HEADER: str(time.time())})
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsFalse_whenWriteIsInFuture(self) -> None:
+        # Arrange
+        request = _request(
+            {read_your_writes.LAST_WRITE_HEADER: _signed(time.time() + 3600)}
+        )
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_requiresPrimary_returnsTrue_whenWriteIsWithinClockSkew(self) -> None:
+        # Arrange
+        request = _request(
+            {
+                read_your_writes.LAST_WRITE_HEADER: _signed(
+                    time.time() + read_your_writes.CLOCK_SKEW_SECONDS / 2
+                )
+            }
+        )
+
+        # Act
+        result = read_your_writes.requires_primary(request)
+
+        # Assert
+        self.assertTrue(result)
+
+    def test_pinReads_setsHeaderAndCookie(self) -> None:
+        # Arrange
+        response = Response()
+
+        # Act
+        read_your_writes.pin_reads(response=response, last_write_at=100.5)
+
+        # Assert
+        value = _signed(100.5)
+        self.assertTrue(value.startswith("100.500000."))
+        self.assertEqual(response.headers[read_your_writes.LAST_WRITE_HEADER], value)
+        self.assertIn(
+            f"{read_your_writes.LAST_WRITE_COOKIE}={value}",
+            response.headers["set-cookie"],
+        )
+
+    def test_pinPrincipalReads_recordsWrite_whenPrincipalCommits(self) -> None:
+        # Arrange
+        db = MagicMock(spec=Session)
+        db.info = {}
+        set_principal(self.principal, db)
+
+        # Act
+        _pin_principal_reads(db)
+
+        # Assert
+        self.assertIsNotNone(self.principal.last_write_at)
+
+    def test_pinPrincipalReads_doesNothing_withoutPrincipal(self) -> None:
+        # Arrange
+        db = MagicMock(spec=Session)
+        db.info = {}
+
+        # Act
+        _pin_principal_reads(db)
+
+        # Assert
+        self.assertIsNone(self.principal.last_write_at)
+
+    @patch("forum_system_api.persistence.database.read_engine", MagicMock())
+    @patch("forum_system_api.persistence.database.read_session_local")
+    def test_getReadDb_usesReplica_whenClientDidNotWrite(
+        self, mock_read_session_local
+    ) -> None:
+        # Arrange
+        primary_db = MagicMock(spec=Session)
+        primary_db.info = {}
+        set_principal(self.principal, primary_db)
+        db_gen = get_read_db(_request(), primary_db)
+
+        # Act
+        db = next(db_gen)
+
+        # Assert
+        self.assertIs(db, mock_read_session_local.return_value)
+        self.assertIs(db.info, primary_db.info)
+        db_gen.close()
+        db.close.assert_called_once()
+
+    @patch("forum_system_api.persistence.database.read_engine", MagicMock())
+    @patch("forum_system_api.persistence.database.read_session_local")
+    def test_getReadDb_usesPrimary_whenClientWroteRecently(
+        self, mock_read_session_local
+    ) -> None:
+        # Arrange
+        primary_db = MagicMock(spec=Session)
+        request = _request({read_your_writes.LAST_WRITE_HEADER: _signed(time.time())})
+        db_gen = get_read_db(request, primary_db)
+
+        # Act
+        db = next(db_gen)
+
+        # Assert
+        self.assertIs(db, primary_db)
+        mock_read_session_local.assert_not_called()
+
+    @patch("forum_system_api.persistence.database.read_session_local")
+    def test_getReadDb_reusesPrimary_whenReplicaIsNotConfigured(
+        self, mock_read_session_local
+    ) -> None:
+        # Arrange
+        primary_db = MagicMock(spec=Session)
+        db_gen = get_read_db(_request(), primary_db)
+
+        # Act
+        db = next(db_gen)
+
+        # Assert
+        self.assertIs(db, primary_db)
+        mock_read_session_local.assert_not_called()
+
+
+class PinReadsMiddleware_Should(unittest.IsolatedAsyncioTestCase):
+    async def test_pinReads_whenPrincipalCommittedWrite(self) -> None:
+        # Arrange
+        request = _request()
+        principal = Principal(
+            user_id=uuid4(), load_user=MagicMock(), load_is_admin=MagicMock()
+        )
+        principal.last_write_at = 100.0
+        setattr(request.state, read_your_writes.PRINCIPAL_STATE, principal)
+
+        async def call_next(request: Request) -> Response:
+            return Response()
+
+        # Act
+        response = await read_your_writes.pin_reads_middleware(request, call_next)
+
+        # Assert
+        self.assertEqual(
+            response.headers[read_your_writes.LAST_WRITE_HEADER], _signed(100.0)
+        )
+
+    async def test_leavesResponse_whenRequestDidNotWrite(self) -> None:
+        # Arrange
+        async def call_next(request: Request) -> Response:
+            return Response()
+
+        # Act
+        response = await read_your_writes.pin_reads_middleware(_request(), call_next)
+
+        # Assert
+        self.assertNotIn(read_your_writes.LAST_WRITE_HEADER, response.headers)
+        self.assertNotIn("set-cookie", response.headers)
@@ -349,12 +349,18 @@ class ReplyServiceShould(unittest.TestCase):
                 "forum_system_api.services.reply_service._get_vote_by_id",
                 return_value=existing_reaction_mock,
             ),
+            patch(
+                "forum_system_api.services.reply_service._update_vote_counts"
+            ) as mock_update_vote_counts,
         ):
             result = reply_service.vote(
                 self.reply.id, reply_reaction, self.user, self.db
             )
 
             self.assertEqual(result.reactions, self.reply.reactions)
+            mock_update_vote_counts.assert_called_once_with(
+                reply_id=self.reply.id, upvotes=-1, downvotes=0, db=self.db
+            )
             self.db.delete.assert_called_once_with(existing_reaction_mock)
             self.db.commit.assert_called_once()
             self.db.refresh.assert_called_once_with(result)
@@ -374,12 +380,19 @@ class ReplyServiceShould(unittest.TestCase):
                 "forum_system_api.services.reply_service._get_vote_by_id",
                 return_value=existing_reaction_mock,
             ),
+            patch(
+                "forum_system_api.services.reply_service._update_vote_counts"
+            ) as mock_update_vote_counts,
         ):
             result = reply_service.vote(
                 self.reply.id, reply_reaction, self.user, self.db
             )
 
             self.assertEqual(result.reactions, self.reply.reactions)
+            self.assertEqual(existing_reaction_mock.reaction, True)
+            mock_update_vote_counts.assert_called_once_with(
+                reply_id=self.reply.id, upvotes=1, downvotes=-1, db=self.db
+            )
             self.db.commit.assert_called_once()
             self.db.refresh.assert_called_once_with(result)
 
@@ -387,8 +400,15 @@ class ReplyServiceShould(unittest.TestCase):
         reaction_create = ReplyReactionCreate(reaction=tc.VALID_REPLY_REACTION_TRUE)
         self.reply.reactions = [self.reaction]
 
-        result = reply_service.create_vote(
-            self.user.id, self.reply, reaction_create, self.db
+        with patch(
+            "forum_system_api.services.reply_service._update_vote_counts"
+        ) as mock_update_vote_counts:
+            result = reply_service.create_vote(
+                self.user.id, self.reply, reaction_create, self.db
+            )
+
+        mock_update_vote_counts.assert_called_once_with(
+            reply_id=self.reply.id, upvotes=1, downvotes=0, db=self.db
         )
 
         added_vote = self.db.add.call_args[0][0]
@@ -404,7 +424,8 @@ class ReplyServiceShould(unittest.TestCase):
     def test_get_vote_by_id_returnsVote_voteExists(self):
         query_mock = self.db.query.return_value
         filter_mock = query_mock.filter_by.return_value
-        filter_mock.first.return_value = self.reaction
+        lock_mock = filter_mock.with_for_update.return_value
+        lock_mock.first.return_value = self.reaction
 
         result = reply_service._get_vote_by_id(self.reply.id, self.user.id, db=self.db)
 
@@ -417,7 +438,8 @@ class ReplyServiceShould(unittest.TestCase):
     def test_get_vote_by_id_returnsNone_notExists(self):
         query_mock = self.db.query.return_value
         filter_mock = query_mock.filter_by.return_value
-        filter_mock.first.return_value = None
+        lock_mock = filter_mock.with_for_update.return_value
+        lock_mock.first.return_value = None
         self.reply.reactions = []
 
         result = reply_service._get_vote_by_id(self.reply.id, self.user.id, db=self.db)
@@ -427,39 +449,33 @@ class ReplyServiceShould(unittest.TestCase):
         query_mock.filter_by.assert_called_once_with(
             user_id=self.user.id, reply_id=self.reply.id
         )
-        filter_mock.first.assert_called_once()
-
-    def test_get_votes_returnsUpvotes(self):
-        self.reaction.reaction = tc.VALID_REPLY_REACTION_TRUE
-        self.reply.reactions = [self.reaction]
-
-        result = reply_service.get_votes(self.reply)
+        filter_mock.with_for_update.assert_called_once()
+        lock_mock.first.assert_called_once()
 
-        self.assertEqual(result, (1, 0))
-
-    def test_get_votes_returnsDownvotes(self):
-        self.reaction.reaction = tc.VALID_REPLY_REACTION_FALSE
-        self.reply.reactions = [self.reaction]
-
-        result = reply_service.get_votes(self.reply)
-
-        self.assertEqual(result, (0, 1))
-
-    def test_get_votes_returnsZero(self):
-        self.reply.reactions = []
+    def test_recalculate_vote_counts_returnsUpdatedCount(self):
+        query_mock = self.db.query.return_value
+        filter_mock = query_mock.filter.return_value
+        filter_mock.update.return_value = 3
 
-        result = reply_service.get_votes(self.reply)
+        result = reply_service.recalculate_vote_counts(self.db)
 
-        self.assertEqual(result, (0, 0))
+        self.assertEqual(result, 3)
+        self.db.query.assert_called_once_with(Reply)
+        filter_mock.update.assert_called_once()
+        self.db.commit.assert_called_once()
 
-    def test_get_votes_returnsMultiple(self):
-        reaction1 = ReplyReaction(reaction=tc.VALID_REPLY_REACTION_TRUE)
-        reaction2 = ReplyReaction(reaction=tc.VALID_REPLY_REACTION_FALSE)
-        self.reply.reactions = [reaction1, reaction2, self.reaction]
+    def test_update_vote_counts_incrementsCounts(self):
+        query_mock = self.db.query.return_value
+        filter_mock = query_mock.filter.return_value
 
-        result = reply_service.get_votes(self.reply)
+        reply_service._update_vote_counts(self.reply.id, 1, -1, self.db)
 
-        self.assertEqual(result, (2, 1))
+        self.db.query.assert_called_once_with(Reply)
+        assert_filter_called_with(query_mock, Reply.id == self.reply.id)
+        values = filter_mock.update.call_args[0][0]
+        self.assertEqual(str(values[Reply.upvotes]), str(Reply.upvotes + 1))
+        self.assertEqual(str(values[Reply.downvotes]), str(Reply.downvotes + -1))
+        self.db.commit.assert_not_called()
 
     def test_validate_reply_access_returnsTopic_topicNotLocked(self):
         self.topic.is_locked = tc.VALID_TOPIC_IS_LOCKED_2
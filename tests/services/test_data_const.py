@@ -58,6 +58,8 @@ VALID_REPLY_CONTENT = "Test Content"
 VALID_REPLY_AUTHOR_ID = uuid4()
 VALID_REPLY_TOPIC_ID = uuid4()
 VALID_REPLY_CREATED_AT = datetime.now(timezone.utc)
+VALID_REPLY_UPVOTES = 2
+VALID_REPLY_DOWNVOTES = 1
 
 VALID_REPLY_CONTENT_2 = "Test Content 2"
 
@@ -78,6 +78,8 @@ VALID_REPLY = {
     "author_id": tc.VALID_REPLY_AUTHOR_ID,
     "topic_id": tc.VALID_REPLY_TOPIC_ID,
     "created_at": tc.VALID_REPLY_CREATED_AT,
+    "upvotes": tc.VALID_REPLY_UPVOTES,
+    "downvotes": tc.VALID_REPLY_DOWNVOTES,
 }
 
 
@@ -0,0 +1,31 @@
+import unittest
+from uuid import uuid4
+
+from forum_system_api.services.utils import token_version_cache as cache
+
+
+class TokenVersionCache_Should(unittest.TestCase):
+    def setUp(self):
+        cache.clear_token_versions()
+        self.user_id = uuid4()
+        self.token_version = uuid4()
+
+    def tearDown(self):
+        cache.clear_token_versions()
+
+    def test_getTokenVersion_returnsCachedVersion(self) -> None:
+        # Arrange
+        cache.set_token_version(self.user_id, self.token_version)
+
+        # Act
+        result = cache.get_token_version(self.user_id)
+
+        # Assert
+        self.assertEqual(self.token_version, result)
+
+    def test_getTokenVersion_returnsNone_whenNotCached(self) -> None:
+        # Act
+        result = cache.get_token_version(self.user_id)
+
+        # Assert
+        self.assertIsNone(result)
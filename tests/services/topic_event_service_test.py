@@ -0,0 +1,468 @@
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException, WebSocket, status
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from forum_system_api.persistence.models.access_level import AccessLevel
+from forum_system_api.persistence.models.reply import Reply
+from forum_system_api.persistence.models.topic import Topic
+from forum_system_api.persistence.models.user import User
+from forum_system_api.services import topic_event_service
+from forum_system_api.services.utils.category_acl_cache import CategoryAcl
+from forum_system_api.services.utils.category_cache import CategoryMetadata
+from forum_system_api.services.websocket_manager import (
+    WebSocketConnection,
+    WebSocketManager,
+)
+from tests.services import test_data_const as tc
+from tests.services import test_data_obj as tobj
+
+SERVICE = "forum_system_api.services.topic_event_service"
+
+
+class TopicEventService_Should(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock(spec=Session)
+        self.user = User(**tobj.USER_1)
+        self.manager = WebSocketManager()
+        self.connection = WebSocketConnection(
+            user_id=self.user.id, websocket=AsyncMock(spec=WebSocket)
+        )
+        self.topic = Topic(**tobj.VALID_TOPIC_1)
+        self.reply = Reply(**tobj.VALID_REPLY)
+        self.reply.author = self.user
+
+        patcher = patch(f"{SERVICE}.websocket_manager", self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        session_patcher = patch(f"{SERVICE}.session_local")
+        session_local = session_patcher.start()
+        session_local.return_value.__enter__.return_value = self.db
+        self.addCleanup(session_patcher.stop)
+        self.addCleanup(topic_event_service._topic_categories.clear)
+
+    def _sent_frames(self) -> list[dict]:
+        frames = []
+        while not self.connection.queue.empty():
+            frames.append(json.loads(self.connection.queue.get_nowait().message))
+        return frames
+
+    @patch(f"{SERVICE}.topic_service.get_by_id")
+    @patch(f"{SERVICE}.user_service.get_by_id")
+    async def test_handleFrame_subscribes_whenUserCanReadTopic(
+        self, mock_get_user, mock_get_topic
+    ) -> None:
+        # Arrange
+        mock_get_user.return_value = self.user
+        mock_get_topic.return_value = self.topic
+        frame = {"type": "subscribe", "topic_id": str(tc.VALID_TOPIC_ID_1)}
+
+        # Act
+        await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        mock_get_topic.assert_called_once_with(
+            topic_id=tc.VALID_TOPIC_ID_1, user=self.user, db=self.db
+        )
+        self.assertEqual(
+            self.manager.get_subscribers(tc.VALID_TOPIC_ID_1), [self.connection]
+        )
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "subscribed",
+                    "topic_id": str(tc.VALID_TOPIC_ID_1),
+                    "detail": None,
+                }
+            ],
+        )
+
+    @patch(f"{SERVICE}.topic_service.get_by_id")
+    @patch(f"{SERVICE}.user_service.get_by_id")
+    async def test_handleFrame_respondsWithError_whenUserCannotReadTopic(
+        self, mock_get_user, mock_get_topic
+    ) -> None:
+        # Arrange
+        mock_get_user.return_value = self.user
+        mock_get_topic.side_effect = HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized"
+        )
+        frame = {"type": "subscribe", "topic_id": str(tc.VALID_TOPIC_ID_1)}
+
+        # Act
+        await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        self.assertEqual(self.manager.get_subscribers(tc.VALID_TOPIC_ID_1), [])
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "subscription_error",
+                    "topic_id": str(tc.VALID_TOPIC_ID_1),
+                    "detail": "Unauthorized",
+                }
+            ],
+        )
+
+    @patch(f"{SERVICE}.topic_service.get_by_id")
+    @patch(f"{SERVICE}.user_service.get_by_id")
+    async def test_handleFrame_respondsWithError_whenUserNotFound(
+        self, mock_get_user, mock_get_topic
+    ) -> None:
+        # Arrange
+        mock_get_user.return_value = None
+        frame = {"type": "subscribe", "topic_id": str(tc.VALID_TOPIC_ID_1)}
+
+        # Act
+        await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        mock_get_topic.assert_not_called()
+        self.assertEqual(self._sent_frames()[0]["detail"], "User not found")
+
+    @patch(f"{SERVICE}.topic_service.get_by_id")
+    @patch(f"{SERVICE}.user_service.get_by_id")
+    async def test_handleFrame_respondsWithError_whenSubscriptionCapReached(
+        self, mock_get_user, mock_get_topic
+    ) -> None:
+        # Arrange
+        self.manager._max_topic_subscriptions = 0
+        mock_get_user.return_value = self.user
+        frame = {"type": "subscribe", "topic_id": str(tc.VALID_TOPIC_ID_1)}
+
+        # Act
+        await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        self.assertEqual(
+            self._sent_frames()[0]["detail"], "Too many topic subscriptions"
+        )
+
+    async def test_handleFrame_unsubscribes(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, tc.VALID_TOPIC_ID_1)
+        frame = {"type": "unsubscribe", "topic_id": str(tc.VALID_TOPIC_ID_1)}
+
+        # Act
+        await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        self.assertEqual(self.manager.get_subscribers(tc.VALID_TOPIC_ID_1), [])
+        self.assertEqual(self._sent_frames()[0]["type"], "unsubscribed")
+
+    async def test_handleFrame_ignoresOtherFrameTypes(self) -> None:
+        # Act
+        await topic_event_service.handle_frame(self.connection, {"type": "other"})
+
+        # Assert
+        self.assertEqual(self._sent_frames(), [])
+
+    async def test_handleFrame_ignoresInvalidSubscriptionFrame(self) -> None:
+        # Act
+        await topic_event_service.handle_frame(
+            self.connection, {"type": "subscribe", "topic_id": "invalid"}
+        )
+
+        # Assert
+        self.assertEqual(self._sent_frames(), [])
+        self.assertEqual(self.connection.topics, set())
+
+    async def test_publish_sendsReplyCreatedEventToTopic(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, self.reply.topic_id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.reply_created_event(reply=self.reply)
+        )
+
+        # Assert
+        event = self._sent_frames()[0]
+        self.assertEqual(event["type"], "reply_created")
+        self.assertEqual(event["topic_id"], str(self.reply.topic_id))
+        self.assertEqual(event["reply"]["id"], str(self.reply.id))
+
+    async def test_publish_sendsReplyVoteCountsToTopic(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, self.reply.topic_id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.reply_voted_event(reply=self.reply)
+        )
+
+        # Assert
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "reply_voted",
+                    "topic_id": str(self.reply.topic_id),
+                    "reply_id": str(self.reply.id),
+                    "upvotes": self.reply.upvotes,
+                    "downvotes": self.reply.downvotes,
+                }
+            ],
+        )
+
+    async def test_publish_coalescesReplyVotesByReply(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, self.reply.topic_id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.reply_voted_event(reply=self.reply)
+        )
+
+        # Assert
+        self.assertEqual(
+            self.connection.queue.get_nowait().coalesce_key,
+            f"reply_voted:{self.reply.id}",
+        )
+
+    async def test_publish_sendsLockStateToTopic(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.topic_locked_event(topic=self.topic)
+        )
+
+        # Assert
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "topic_locked",
+                    "topic_id": str(self.topic.id),
+                    "is_locked": self.topic.is_locked,
+                }
+            ],
+        )
+
+    async def test_publish_sendsBestReplyToTopic(self) -> None:
+        # Arrange
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.best_reply_selected_event(topic=self.topic)
+        )
+
+        # Assert
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "best_reply_selected",
+                    "topic_id": str(self.topic.id),
+                    "best_reply_id": str(self.topic.best_reply_id),
+                }
+            ],
+        )
+
+    @patch(f"{SERVICE}._get_topic_readers")
+    async def test_filterReaders_keepsSubscribersThatCanReadTopic(
+        self, mock_get_topic_readers
+    ) -> None:
+        # Arrange
+        mock_get_topic_readers.return_value = {self.user.id}
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        readers = await topic_event_service.filter_readers(
+            self.topic.id, [self.connection]
+        )
+
+        # Assert
+        mock_get_topic_readers.assert_called_once_with(
+            topic_id=self.topic.id, user_ids={self.user.id}
+        )
+        self.assertEqual(readers, [self.connection])
+        self.assertEqual(self.manager.get_subscribers(self.topic.id), [self.connection])
+        self.assertEqual(self._sent_frames(), [])
+
+    @patch(f"{SERVICE}._get_topic_readers")
+    async def test_filterReaders_unsubscribes_whenAccessWasRevoked(
+        self, mock_get_topic_readers
+    ) -> None:
+        # Arrange
+        mock_get_topic_readers.return_value = set()
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        readers = await topic_event_service.filter_readers(
+            self.topic.id, [self.connection]
+        )
+
+        # Assert
+        self.assertEqual(readers, [])
+        self.assertEqual(self.manager.get_subscribers(self.topic.id), [])
+        self.assertEqual(
+            self._sent_frames(),
+            [
+                {
+                    "type": "unsubscribed",
+                    "topic_id": str(self.topic.id),
+                    "detail": "Unauthorized",
+                }
+            ],
+        )
+
+    @patch(f"{SERVICE}._get_topic_readers")
+    async def test_filterReaders_sendsToNoOne_whenCheckFails(
+        self, mock_get_topic_readers
+    ) -> None:
+        # Arrange
+        mock_get_topic_readers.side_effect = OperationalError("SELECT", {}, None)
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        readers = await topic_event_service.filter_readers(
+            self.topic.id, [self.connection]
+        )
+
+        # Assert
+        self.assertEqual(readers, [])
+        self.assertEqual(self.manager.get_subscribers(self.topic.id), [self.connection])
+
+    @patch(f"{SERVICE}._get_topic_readers")
+    async def test_publish_skipsRevokedSubscribers_whenAccessCheckIsSet(
+        self, mock_get_topic_readers
+    ) -> None:
+        # Arrange
+        mock_get_topic_readers.return_value = set()
+        self.manager.set_topic_access_check(topic_event_service.filter_readers)
+        self.manager.subscribe(self.connection, self.topic.id)
+
+        # Act
+        await topic_event_service.publish(
+            event=topic_event_service.topic_locked_event(topic=self.topic)
+        )
+
+        # Assert
+        self.assertEqual(
+            [frame["type"] for frame in self._sent_frames()], ["unsubscribed"]
+        )
+
+    async def test_handleFrame_subscribes_inNewSession(self) -> None:
+        # Arrange
+        frame = {"type": "subscribe", "topic_id": str(self.topic.id)}
+
+        # Act
+        with (
+            patch(f"{SERVICE}.user_service.get_by_id", return_value=self.user),
+            patch(f"{SERVICE}.topic_service.get_by_id", return_value=self.topic),
+        ):
+            await topic_event_service.handle_frame(self.connection, frame)
+
+        # Assert
+        topic_event_service.session_local.assert_called_once_with()
+        self.assertEqual(
+            topic_event_service._topic_categories.get(self.topic.id),
+            self.topic.category_id,
+        )
+
+    @patch(f"{SERVICE}.get_acl")
+    @patch(f"{SERVICE}.sync_acl_version")
+    @patch(f"{SERVICE}.get_category_metadata")
+    def test_getTopicReaders_usesCachedPermissions(
+        self, mock_get_category_metadata, mock_sync_acl_version, mock_get_acl
+    ) -> None:
+        # Arrange
+        other_user = User(**tobj.USER_2)
+        topic_event_service._topic_categories.set(self.topic.id, self.topic.category_id)
+        mock_get_category_metadata.return_value = CategoryMetadata(
+            id=self.topic.category_id, name="Private", is_private=True, is_locked=False
+        )
+        acls = {
+            self.user.id: CategoryAcl(
+                is_admin=False,
+                access_levels={self.topic.category_id: AccessLevel.READ},
+            ),
+            other_user.id: CategoryAcl(is_admin=False, access_levels={}),
+        }
+        mock_get_acl.side_effect = lambda user_id: acls[user_id]
+
+        # Act
+        readers = topic_event_service._get_topic_readers(
+            topic_id=self.topic.id, user_ids={self.user.id, other_user.id}
+        )
+
+        # Assert
+        self.assertEqual(readers, {self.user.id})
+        mock_sync_acl_version.assert_called_once_with(db=self.db)
+        self.db.query.assert_not_called()
+
+    @patch(f"{SERVICE}.get_category_acl")
+    @patch(f"{SERVICE}.get_acl", return_value=None)
+    @patch(f"{SERVICE}.sync_acl_version")
+    @patch(f"{SERVICE}.get_category_metadata")
+    def test_getTopicReaders_compilesPermissions_whenNotCached(
+        self,
+        mock_get_category_metadata,
+        mock_sync_acl_version,
+        mock_get_acl,
+        mock_get_category_acl,
+    ) -> None:
+        # Arrange
+        topic_event_service._topic_categories.set(self.topic.id, self.topic.category_id)
+        mock_get_category_metadata.return_value = CategoryMetadata(
+            id=self.topic.category_id, name="Private", is_private=True, is_locked=False
+        )
+        self.db.query.return_value.filter.return_value.all.return_value = [self.user]
+        mock_get_category_acl.return_value = CategoryAcl(
+            is_admin=True, access_levels={}
+        )
+
+        # Act
+        readers = topic_event_service._get_topic_readers(
+            topic_id=self.topic.id, user_ids={self.user.id}
+        )
+
+        # Assert
+        self.assertEqual(readers, {self.user.id})
+        mock_get_category_acl.assert_called_once_with(user=self.user, db=self.db)
+
+    @patch(f"{SERVICE}.get_category_metadata")
+    def test_getTopicReaders_returnsEveryone_forPublicCategory(
+        self, mock_get_category_metadata
+    ) -> None:
+        # Arrange
+        self.db.query.return_value.filter.return_value.scalar.return_value = (
+            self.topic.category_id
+        )
+        mock_get_category_metadata.return_value = CategoryMetadata(
+            id=self.topic.category_id, name="Public", is_private=False, is_locked=False
+        )
+
+        # Act
+        readers = topic_event_service._get_topic_readers(
+            topic_id=self.topic.id, user_ids={self.user.id}
+        )
+
+        # Assert
+        self.assertEqual(readers, {self.user.id})
+        self.assertEqual(
+            topic_event_service._topic_categories.get(self.topic.id),
+            self.topic.category_id,
+        )
+
+    def test_getTopicReaders_returnsNoOne_whenTopicNotFound(self) -> None:
+        # Arrange
+        self.db.query.return_value.filter.return_value.scalar.return_value = None
+
+        # Act
+        readers = topic_event_service._get_topic_readers(
+            topic_id=self.topic.id, user_ids={self.user.id}
+        )
+
+        # Assert
+        self.assertEqual(readers, set())
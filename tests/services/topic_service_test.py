@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from fastapi import HTTPException, status
+from sqlalchemy import literal, select
 from sqlalchemy.orm import Session
 
 from forum_system_api.persistence.models.category import Category
@@ -11,9 +12,10 @@ from forum_system_api.persistence.models.user import User
 from forum_system_api.persistence.models.user_category_permission import (
     UserCategoryPermission,
 )
-from forum_system_api.schemas.common import TopicFilterParams
+from forum_system_api.schemas.common import ReplyFilterParams, TopicFilterParams
 from forum_system_api.schemas.topic import TopicCreate, TopicUpdate
 from forum_system_api.services import topic_service
+from forum_system_api.services.utils.category_acl_cache import CategoryAcl
 from tests.services import test_data_const as td
 from tests.services import test_data_obj as tobj
 from tests.services.utils import assert_filter_called_with
@@ -39,10 +41,9 @@ class TopicServiceShould(unittest.TestCase):
         self.topic.category_id = self.category.id
         self.topic2.category_id = self.category2.id
 
-        self.user.permissions = [self.permission]
-
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -53,7 +54,11 @@ class TopicServiceShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.topic_service.is_admin", return_value=True
+                "forum_system_api.services.topic_service.get_category_acl",
+                return_value=CategoryAcl(
+                    is_admin=True,
+                    access_levels={self.category.id: td.VALID_ACCESS_LEVEL_1},
+                ),
             ),
             patch(
                 "forum_system_api.services.topic_service.getattr",
@@ -71,10 +76,9 @@ class TopicServiceShould(unittest.TestCase):
         self.topic.category_id = self.category.id
         self.topic2.category_id = self.category2.id
 
-        self.user.permissions = [self.permission]
-
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -85,7 +89,11 @@ class TopicServiceShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.topic_service.is_admin", return_value=False
+                "forum_system_api.services.topic_service.get_category_acl",
+                return_value=CategoryAcl(
+                    is_admin=False,
+                    access_levels={self.category.id: td.VALID_ACCESS_LEVEL_1},
+                ),
             ),
             patch(
                 "forum_system_api.services.topic_service.getattr",
@@ -103,10 +111,9 @@ class TopicServiceShould(unittest.TestCase):
         self.topic.category_id = self.category.id
         self.topic2.category_id = self.category2.id
 
-        self.user.permissions = []
-
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -117,7 +124,8 @@ class TopicServiceShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.topic_service.is_admin", return_value=False
+                "forum_system_api.services.topic_service.get_category_acl",
+                return_value=CategoryAcl(is_admin=False, access_levels={}),
             ),
             patch(
                 "forum_system_api.services.topic_service.getattr",
@@ -136,10 +144,9 @@ class TopicServiceShould(unittest.TestCase):
         self.topic.author_id = self.user.id
         self.topic2.category_id = self.category2.id
 
-        self.user.permissions = []
-
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -150,7 +157,8 @@ class TopicServiceShould(unittest.TestCase):
 
         with (
             patch(
-                "forum_system_api.services.topic_service.is_admin", return_value=False
+                "forum_system_api.services.topic_service.get_category_acl",
+                return_value=CategoryAcl(is_admin=False, access_levels={}),
             ),
             patch(
                 "forum_system_api.services.topic_service.getattr",
@@ -164,7 +172,8 @@ class TopicServiceShould(unittest.TestCase):
 
     def test_get_public_returnsPublicTopics(self):
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -181,7 +190,8 @@ class TopicServiceShould(unittest.TestCase):
 
     def test_get_public_returnsNoTopics_private(self):
         query_mock = self.db.query.return_value
-        join_mock = query_mock.join.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
         filter_mock = join_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
         offset_mock = order_by_mock.offset.return_value
@@ -198,6 +208,53 @@ class TopicServiceShould(unittest.TestCase):
         limit_mock.all.assert_called_once()
         offset_mock.limit.assert_called_once_with(self.filter_params.limit)
 
+    def test_get_public_withCursor_filtersAfterCursor(self):
+        self.filter_params.after = "cursor"
+        query_mock = self.db.query.return_value
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
+        filter_mock = join_mock.filter.return_value
+        order_by_mock = filter_mock.order_by.return_value
+        cursor_filter_mock = order_by_mock.filter.return_value
+        limit_mock = cursor_filter_mock.limit.return_value
+        limit_mock.all.return_value = [self.topic2]
+
+        with patch(
+            "forum_system_api.services.topic_service.decode_cursor",
+            return_value=(self.topic.created_at, self.topic.id),
+        ) as mock_decode_cursor:
+            topics = topic_service.get_public(self.filter_params, self.db)
+
+        self.assertEqual(topics, [self.topic2])
+        mock_decode_cursor.assert_called_once_with(
+            cursor="cursor", sort_key=self.filter_params.order_by
+        )
+        order_by_mock.offset.assert_not_called()
+        cursor_filter_mock.limit.assert_called_once_with(self.filter_params.limit)
+
+    def test_get_next_cursor_returnsCursor_fullPage(self):
+        self.filter_params.limit = 2
+
+        with patch(
+            "forum_system_api.services.topic_service.encode_cursor",
+            return_value="cursor",
+        ) as mock_encode_cursor:
+            cursor = topic_service.get_next_cursor(
+                [self.topic, self.topic2], self.filter_params
+            )
+
+        self.assertEqual(cursor, "cursor")
+        mock_encode_cursor.assert_called_once_with(
+            sort_key=self.filter_params.order_by,
+            sort_value=self.topic2.created_at,
+            row_id=self.topic2.id,
+        )
+
+    def test_get_next_cursor_returnsNone_lastPage(self):
+        cursor = topic_service.get_next_cursor([self.topic], self.filter_params)
+
+        self.assertIsNone(cursor)
+
     def test_get_by_id_returnsTopic_userIsAdmin(self):
         query_mock = self.db.query.return_value
         filter_mock = query_mock.filter.return_value
@@ -439,32 +496,36 @@ class TopicServiceShould(unittest.TestCase):
             self.db.refresh.assert_not_called()
 
     def test_get_replies_returnsReplies_replies(self):
+        filter_params = ReplyFilterParams()
         query_mock = self.db.query.return_value
         options_mock = query_mock.options.return_value
         filter_mock = options_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
-        order_by_mock.all.return_value = [self.reply]
+        limit_mock = order_by_mock.limit.return_value
+        limit_mock.all.return_value = [self.reply]
 
         self.topic.replies = [self.reply]
 
-        replies = topic_service.get_replies(self.topic.id, self.db)
+        replies = topic_service.get_replies(self.topic.id, filter_params, self.db)
 
         self.assertEqual(replies, self.topic.replies)
 
         self.db.query.assert_called_once_with(Reply)
         assert_filter_called_with(options_mock, Reply.topic_id == self.topic.id)
         query_mock.options.assert_called_once()
+        order_by_mock.limit.assert_called_once_with(filter_params.limit)
 
     def test_get_replies_returnsEmptyList_noReplies(self):
         query_mock = self.db.query.return_value
         options_mock = query_mock.options.return_value
         filter_mock = options_mock.filter.return_value
         order_by_mock = filter_mock.order_by.return_value
-        order_by_mock.all.return_value = []
+        limit_mock = order_by_mock.limit.return_value
+        limit_mock.all.return_value = []
 
         self.topic.replies = []
 
-        replies = topic_service.get_replies(self.topic.id, self.db)
+        replies = topic_service.get_replies(self.topic.id, ReplyFilterParams(), self.db)
 
         self.assertEqual(replies, self.topic.replies)
 
@@ -472,6 +533,81 @@ class TopicServiceShould(unittest.TestCase):
         assert_filter_called_with(options_mock, Reply.topic_id == self.topic.id)
         query_mock.options.assert_called_once()
 
+    def test_get_replies_withCursor_filtersAfterCursor(self):
+        filter_params = ReplyFilterParams(after="cursor", order="asc")
+        query_mock = self.db.query.return_value
+        options_mock = query_mock.options.return_value
+        filter_mock = options_mock.filter.return_value
+        order_by_mock = filter_mock.order_by.return_value
+        cursor_filter_mock = order_by_mock.filter.return_value
+        limit_mock = cursor_filter_mock.limit.return_value
+        limit_mock.all.return_value = [self.reply]
+
+        with patch(
+            "forum_system_api.services.topic_service.decode_cursor",
+            return_value=(self.reply.created_at, self.reply.id),
+        ) as mock_decode_cursor:
+            replies = topic_service.get_replies(self.topic.id, filter_params, self.db)
+
+        self.assertEqual(replies, [self.reply])
+        mock_decode_cursor.assert_called_once_with(
+            cursor="cursor", sort_key="created_at"
+        )
+        order_by_mock.filter.assert_called_once()
+        cursor_filter_mock.limit.assert_called_once_with(filter_params.limit)
+
+    def test_get_next_reply_cursor_returnsCursor_fullPage(self):
+        filter_params = ReplyFilterParams(limit=1)
+
+        with patch(
+            "forum_system_api.services.topic_service.encode_cursor",
+            return_value="cursor",
+        ) as mock_encode_cursor:
+            cursor = topic_service.get_next_reply_cursor([self.reply], filter_params)
+
+        self.assertEqual(cursor, "cursor")
+        mock_encode_cursor.assert_called_once_with(
+            sort_key="created_at",
+            sort_value=self.reply.created_at,
+            row_id=self.reply.id,
+        )
+
+    def test_get_next_reply_cursor_returnsNone_lastPage(self):
+        cursor = topic_service.get_next_reply_cursor([self.reply], ReplyFilterParams())
+
+        self.assertIsNone(cursor)
+
+    def test_get_replies_for_topics_groupsRepliesByTopic(self):
+        self.reply.topic_id = self.topic.id
+        query_mock = self.db.query.return_value
+        query_mock.filter.return_value.subquery.return_value = select(
+            Reply.id, literal(1).label("position")
+        ).subquery()
+        options_mock = query_mock.options.return_value
+        join_mock = options_mock.join.return_value
+        filter_mock = join_mock.filter.return_value
+        order_by_mock = filter_mock.order_by.return_value
+        order_by_mock.all.return_value = [self.reply]
+
+        replies = topic_service.get_replies_for_topics(
+            [self.topic.id, self.topic2.id], self.db
+        )
+
+        self.assertEqual(replies, {self.topic.id: [self.reply], self.topic2.id: []})
+
+        self.assertEqual(self.db.query.call_count, 2)
+        self.db.query.assert_called_with(Reply)
+        query_mock.options.assert_called_once()
+        assert_filter_called_with(
+            query_mock, Reply.topic_id.in_([self.topic.id, self.topic2.id])
+        )
+
+    def test_get_replies_for_topics_noTopics_skipsQuery(self):
+        replies = topic_service.get_replies_for_topics([], self.db)
+
+        self.assertEqual(replies, {})
+        self.db.query.assert_not_called()
+
     def test_lock_updatesTopic(self):
         topic_lock = td.VALID_TOPIC_IS_LOCKED_2
 
@@ -507,11 +643,12 @@ class TopicServiceShould(unittest.TestCase):
 
     def test_get_topics_for_category_returnsTopics(self):
         query_mock = self.db.query.return_value
-        filter_mock = query_mock.filter.return_value
+        options_mock = query_mock.options.return_value
+        filter_mock = options_mock.filter.return_value
         filter_mock.all.return_value = [self.topic]
 
         with patch(
-            "forum_system_api.services.category_service.get_by_id",
+            "forum_system_api.services.category_service.get_metadata",
             return_value=self.category,
         ):
             topics = topic_service.get_topics_for_category(
@@ -521,12 +658,13 @@ class TopicServiceShould(unittest.TestCase):
         self.assertEqual(topics, [self.topic])
 
         self.db.query.assert_called_once_with(Topic)
-        assert_filter_called_with(query_mock, Topic.category_id == self.category.id)
+        query_mock.options.assert_called_once()
+        assert_filter_called_with(options_mock, Topic.category_id == self.category.id)
         filter_mock.all.assert_called_once()
 
     def test_get_topics_for_category_raises404_noCategory(self):
         with patch(
-            "forum_system_api.services.category_service.get_by_id",
+            "forum_system_api.services.category_service.get_metadata",
             return_value=None,
         ):
             with self.assertRaises(HTTPException) as context:
@@ -540,12 +678,12 @@ class TopicServiceShould(unittest.TestCase):
     def test_get_topics_for_category_raises403_noPermissions(self):
         with (
             patch(
-                "forum_system_api.services.category_service.get_by_id",
+                "forum_system_api.services.category_service.get_metadata",
                 return_value=self.category2,
             ),
             patch(
-                "forum_system_api.services.topic_service.is_admin",
-                return_value=False,
+                "forum_system_api.services.topic_service.get_category_acl",
+                return_value=CategoryAcl(is_admin=False, access_levels={}),
             ),
         ):
             with self.assertRaises(HTTPException) as context:
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+from forum_system_api.services.utils.ttl_cache import TTLCache
+
+
+class TTLCache_Should(unittest.TestCase):
+    def setUp(self):
+        self.cache = TTLCache(ttl_seconds=10, max_size=2)
+
+    def test_get_returnsValue(self) -> None:
+        # Arrange
+        self.cache.set("key", "value")
+
+        # Act
+        result = self.cache.get("key")
+
+        # Assert
+        self.assertEqual("value", result)
+
+    def test_get_returnsNone_whenMissing(self) -> None:
+        # Act
+        result = self.cache.get("key")
+
+        # Assert
+        self.assertIsNone(result)
+
+    @patch("forum_system_api.services.utils.ttl_cache.time.monotonic")
+    def test_get_returnsNone_whenExpired(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self.cache.set("key", "value")
+        mock_monotonic.return_value = 110.0
+
+        # Act
+        result = self.cache.get("key")
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_invalidate_removesValue(self) -> None:
+        # Arrange
+        self.cache.set("key", "value")
+
+        # Act
+        self.cache.invalidate("key")
+
+        # Assert
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_set_evictsOldestEntry_whenFull(self) -> None:
+        # Arrange
+        self.cache.set("first", 1)
+        self.cache.set("second", 2)
+
+        # Act
+        self.cache.set("third", 3)
+
+        # Assert
+        self.assertIsNone(self.cache.get("first"))
+        self.assertEqual(2, self.cache.get("second"))
+        self.assertEqual(3, self.cache.get("third"))
+
+    @patch("forum_system_api.services.utils.ttl_cache.time.monotonic")
+    def test_set_evictsExpiredEntries_whenFull(self, mock_monotonic) -> None:
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        self.cache.set("first", 1)
+        mock_monotonic.return_value = 105.0
+        self.cache.set("second", 2)
+        mock_monotonic.return_value = 111.0
+
+        # Act
+        self.cache.set("third", 3)
+
+        # Assert
+        self.assertIsNone(self.cache.get("first"))
+        self.assertEqual(2, self.cache.get("second"))
+        self.assertEqual(3, self.cache.get("third"))
@@ -13,6 +13,7 @@ from forum_system_api.persistence.models.user_category_permission import (
 )
 from forum_system_api.schemas.user import UserCreate
 from forum_system_api.services import user_service
+from forum_system_api.services.utils.principal_utils import Principal, set_principal
 from tests.services.test_data import USER_1, USER_2, VALID_PASSWORD
 from tests.services.utils import assert_filter_called_with
 
@@ -195,6 +196,47 @@ class UserService_Should(unittest.TestCase):
         self.mock_db.query.assert_called_once_with(Admin)
         assert_filter_called_with(mock_query, Admin.user_id == self.user.id)
 
+    def test_isAdmin_returnsPrincipalFlag_whenPrincipalIsResolved(self) -> None:
+        # Arrange
+        self.mock_db.info = {}
+        set_principal(
+            Principal(
+                user_id=self.user.id,
+                load_user=lambda: self.user,
+                load_is_admin=lambda: True,
+            ),
+            self.mock_db,
+        )
+
+        # Act
+        is_admin = user_service.is_admin(self.user.id, self.mock_db)
+
+        # Assert
+        self.assertTrue(is_admin)
+        self.mock_db.query.assert_not_called()
+
+    def test_isAdmin_queriesAdmins_whenPrincipalBelongsToOtherUser(self) -> None:
+        # Arrange
+        self.mock_db.info = {}
+        set_principal(
+            Principal(
+                user_id=self.user2.id,
+                load_user=lambda: self.user2,
+                load_is_admin=lambda: True,
+            ),
+            self.mock_db,
+        )
+        mock_query = self.mock_db.query.return_value
+        mock_filter = mock_query.filter.return_value
+        mock_filter.first.return_value = None
+
+        # Act
+        is_admin = user_service.is_admin(self.user.id, self.mock_db)
+
+        # Assert
+        self.assertFalse(is_admin)
+        self.mock_db.query.assert_called_once_with(Admin)
+
     @patch("forum_system_api.services.category_service.get_by_id")
     def test_getPrivilegedUsers_returnsCorrect_whenCategoryIsFound(
         self, mock_get_category_by_id
@@ -318,6 +360,20 @@ class UserService_Should(unittest.TestCase):
         self.mock_db.commit.assert_called_once()
         self.assertTrue(result)
 
+    @patch("forum_system_api.services.user_service.invalidate_acl")
+    @patch("forum_system_api.services.user_service.get_user_category_permission")
+    def test_revokeAccess_invalidatesCachedPermissions(
+        self, mock_get_user_category_permission, mock_invalidate_acl
+    ) -> None:
+        # Arrange
+        mock_get_user_category_permission.return_value = (self.user, None, Mock())
+
+        # Act
+        user_service.revoke_access(self.user.id, uuid4(), self.mock_db)
+
+        # Assert
+        mock_invalidate_acl.assert_called_once_with(user_id=self.user.id)
+
     @patch("forum_system_api.services.user_service.get_user_category_permission")
     def test_revokeAccess_raises404_whenPermissionIsNotFound(
         self, mock_get_user_category_permission
@@ -359,6 +415,29 @@ class UserService_Should(unittest.TestCase):
         self.assertEqual(access_level, result.access_level)
         self.assertListEqual(category.permissions, [result])
 
+    @patch("forum_system_api.services.user_service.invalidate_acl")
+    @patch("forum_system_api.services.user_service.get_user_category_permission")
+    def test_updateAccessLevel_invalidatesCachedPermissions(
+        self, mock_get_user_category_permission, mock_invalidate_acl
+    ) -> None:
+        # Arrange
+        mock_get_user_category_permission.return_value = (
+            self.user,
+            None,
+            Mock(access_level=AccessLevel.READ),
+        )
+
+        # Act
+        user_service.update_access_level(
+            user_id=self.user.id,
+            category_id=uuid4(),
+            access_level=AccessLevel.WRITE,
+            db=self.mock_db,
+        )
+
+        # Assert
+        mock_invalidate_acl.assert_called_once_with(user_id=self.user.id)
+
     @patch("forum_system_api.services.user_service.get_user_category_permission")
     def test_updateAccessLevel_updatesExistingPermission_whenPermissionIsFound(
         self, mock_get_user_category_permission
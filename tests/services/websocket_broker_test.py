@@ -0,0 +1,307 @@
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import OperationalError
+
+from forum_system_api.services.websocket_broker import (
+    MAX_NOTIFY_PAYLOAD_BYTES,
+    RECONNECT_INITIAL_DELAY_SECONDS,
+    TOPIC_RECEIVER,
+    USER_RECEIVER,
+    InMemoryBroker,
+    PostgresBroker,
+    create_broker,
+)
+from tests.services.test_data import VALID_USER_ID
+from tests.services.test_data_const import VALID_TOPIC_ID_1
+
+CHANNEL = "websocket_messages"
+
+
+class InMemoryBroker_Should(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryBroker()
+        self.handler = AsyncMock()
+
+    async def test_publish_callsSubscribedHandler(self) -> None:
+        # Arrange
+        self.broker.subscribe(self.handler)
+
+        # Act
+        await self.broker.publish(VALID_USER_ID, "Test message")
+
+        # Assert
+        self.handler.assert_awaited_once_with(
+            USER_RECEIVER, VALID_USER_ID, "Test message", None
+        )
+
+    async def test_publish_passesReceiverType(self) -> None:
+        # Arrange
+        self.broker.subscribe(self.handler)
+
+        # Act
+        await self.broker.publish(
+            VALID_TOPIC_ID_1, "Test message", TOPIC_RECEIVER, "reply_voted:1"
+        )
+
+        # Assert
+        self.handler.assert_awaited_once_with(
+            TOPIC_RECEIVER, VALID_TOPIC_ID_1, "Test message", "reply_voted:1"
+        )
+
+    async def test_publish_dropsMessage_whenNoHandler(self) -> None:
+        # Act & Assert
+        await self.broker.publish(VALID_USER_ID, "Test message")
+
+
+class PostgresBroker_Should(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.engine = MagicMock(spec=Engine)
+        self.broker = PostgresBroker(engine=self.engine, channel=CHANNEL)
+        self.handler = AsyncMock()
+        self.broker.subscribe(self.handler)
+
+    async def test_publish_notifiesChannel(self) -> None:
+        # Act
+        await self.broker.publish(VALID_USER_ID, "Test message")
+
+        # Assert
+        connection = self.engine.begin.return_value.__enter__.return_value
+        statement = connection.execute.call_args.args[0]
+        self.assertListEqual(
+            list(statement.compile().params.values()),
+            [
+                CHANNEL,
+                json.dumps(
+                    {
+                        "receiver_type": USER_RECEIVER,
+                        "receiver_id": str(VALID_USER_ID),
+                        "message": "Test message",
+                        "coalesce_key": None,
+                    }
+                ),
+            ],
+        )
+        self.handler.assert_not_awaited()
+
+    async def test_publish_notifiesNonAsciiMessageUnescaped(self) -> None:
+        # Arrange
+        message = "Здравей" * 500
+
+        # Act
+        await self.broker.publish(VALID_USER_ID, message)
+
+        # Assert
+        connection = self.engine.begin.return_value.__enter__.return_value
+        statement = connection.execute.call_args.args[0]
+        payload = list(statement.compile().params.values())[1]
+        self.assertIn(message, payload)
+        self.assertEqual(connection.execute.call_count, 1)
+
+    async def test_publish_storesPayload_whenPayloadTooLarge(self) -> None:
+        # Arrange
+        message = "x" * MAX_NOTIFY_PAYLOAD_BYTES
+        connection = self.engine.begin.return_value.__enter__.return_value
+        connection.execute.return_value.scalar_one.return_value = VALID_TOPIC_ID_1
+
+        # Act
+        await self.broker.publish(VALID_USER_ID, message)
+
+        # Assert
+        delete_expired, insert_payload, notify = [
+            execute_call.args[0] for execute_call in connection.execute.call_args_list
+        ]
+        self.assertEqual(delete_expired.table.name, "websocket_payloads")
+        self.assertIn(message, insert_payload.compile().params["payload"])
+        self.assertEqual(
+            list(notify.compile().params.values()),
+            [CHANNEL, json.dumps({"payload_id": str(VALID_TOPIC_ID_1)})],
+        )
+        self.handler.assert_not_awaited()
+
+    async def test_handleNotification_loadsStoredPayload(self) -> None:
+        # Arrange
+        stored = json.dumps(
+            {"receiver_id": str(VALID_USER_ID), "message": "Large message"}
+        )
+        connection = self.engine.connect.return_value.__enter__.return_value
+        connection.execute.return_value.scalar_one_or_none.return_value = stored
+
+        # Act
+        await self.broker._handle_notification(
+            json.dumps({"payload_id": str(VALID_TOPIC_ID_1)})
+        )
+
+        # Assert
+        self.handler.assert_awaited_once_with(
+            USER_RECEIVER, VALID_USER_ID, "Large message", None
+        )
+
+    async def test_handleNotification_dropsMessage_whenStoredPayloadIsGone(
+        self,
+    ) -> None:
+        # Arrange
+        connection = self.engine.connect.return_value.__enter__.return_value
+        connection.execute.return_value.scalar_one_or_none.return_value = None
+
+        # Act
+        await self.broker._handle_notification(
+            json.dumps({"payload_id": str(VALID_TOPIC_ID_1)})
+        )
+
+        # Assert
+        self.handler.assert_not_awaited()
+
+    @patch("forum_system_api.services.websocket_broker.asyncio.get_running_loop")
+    async def test_readNotifications_listensAgain_whenConnectionIsLost(
+        self, mock_get_running_loop
+    ) -> None:
+        # Arrange
+        self.engine.dialect = MagicMock()
+        self.engine.dialect.loaded_dbapi.Error = ConnectionError
+        connection = MagicMock()
+        connection.poll.side_effect = ConnectionError("server closed the connection")
+        self.broker._connection = connection
+        self.broker._fileno = 3
+
+        # Act
+        with patch.object(
+            PostgresBroker, "_listen_again", new_callable=AsyncMock
+        ) as mock_listen_again:
+            self.broker._read_notifications()
+            await self.broker._reconnect
+
+        # Assert
+        mock_get_running_loop.return_value.remove_reader.assert_called_once_with(3)
+        connection.close.assert_called_once()
+        self.assertIsNone(self.broker._connection)
+        mock_listen_again.assert_awaited_once()
+
+    @patch("forum_system_api.services.websocket_broker.asyncio.sleep")
+    @patch("forum_system_api.services.websocket_broker.asyncio.get_running_loop")
+    async def test_listenAgain_retriesWithBackoff_untilListening(
+        self, mock_get_running_loop, mock_sleep
+    ) -> None:
+        # Arrange
+        self.engine.dialect = MagicMock()
+        self.engine.dialect.loaded_dbapi.Error = ConnectionError
+        connection = MagicMock()
+        self.broker._reconnect = MagicMock()
+
+        # Act
+        with patch.object(
+            PostgresBroker,
+            "_listen",
+            side_effect=[OperationalError("LISTEN", {}, None), connection],
+        ):
+            await self.broker._listen_again()
+
+        # Assert
+        self.assertEqual(
+            mock_sleep.await_args_list,
+            [
+                call(RECONNECT_INITIAL_DELAY_SECONDS),
+                call(RECONNECT_INITIAL_DELAY_SECONDS * 2),
+            ],
+        )
+        self.assertIs(self.broker._connection, connection)
+        self.assertIsNone(self.broker._reconnect)
+        mock_get_running_loop.return_value.add_reader.assert_called_once_with(
+            connection.fileno.return_value, self.broker._read_notifications
+        )
+
+    async def test_readNotifications_callsHandlerForEachNotification(self) -> None:
+        # Arrange
+        connection = MagicMock()
+        connection.notifies = [
+            MagicMock(
+                payload=json.dumps(
+                    {"receiver_id": str(VALID_USER_ID), "message": "Test message"}
+                )
+            ),
+            MagicMock(
+                payload=json.dumps(
+                    {
+                        "receiver_type": TOPIC_RECEIVER,
+                        "receiver_id": str(VALID_TOPIC_ID_1),
+                        "message": "Topic message",
+                        "coalesce_key": "reply_voted:1",
+                    }
+                )
+            ),
+            MagicMock(payload="malformed"),
+        ]
+        self.broker._connection = connection
+
+        # Act
+        self.broker._read_notifications()
+        for task in list(self.broker._tasks):
+            await task
+
+        # Assert
+        connection.poll.assert_called_once()
+        self.assertEqual(connection.notifies, [])
+        self.handler.assert_has_awaits(
+            [
+                call(USER_RECEIVER, VALID_USER_ID, "Test message", None),
+                call(
+                    TOPIC_RECEIVER, VALID_TOPIC_ID_1, "Topic message", "reply_voted:1"
+                ),
+            ]
+        )
+        self.assertEqual(self.handler.await_count, 2)
+
+    @patch("forum_system_api.services.websocket_broker.asyncio.get_running_loop")
+    async def test_start_listensOnChannel(self, mock_get_running_loop) -> None:
+        # Arrange
+        dbapi_connection = self.engine.raw_connection.return_value.dbapi_connection
+        cursor = dbapi_connection.cursor.return_value.__enter__.return_value
+
+        # Act
+        await self.broker.start()
+
+        # Assert
+        self.engine.raw_connection.return_value.detach.assert_called_once()
+        cursor.execute.assert_called_once_with(f'LISTEN "{CHANNEL}"')
+        mock_get_running_loop.return_value.add_reader.assert_called_once_with(
+            dbapi_connection.fileno.return_value, self.broker._read_notifications
+        )
+
+    @patch("forum_system_api.services.websocket_broker.asyncio.get_running_loop")
+    async def test_stop_closesListeningConnection(self, mock_get_running_loop) -> None:
+        # Arrange
+        connection = MagicMock()
+        self.broker._connection = connection
+        self.broker._fileno = 3
+
+        # Act
+        await self.broker.stop()
+
+        # Assert
+        mock_get_running_loop.return_value.remove_reader.assert_called_once_with(3)
+        connection.close.assert_called_once()
+        self.assertIsNone(self.broker._connection)
+
+
+class CreateBroker_Should(IsolatedAsyncioTestCase):
+    def test_createsInMemoryBroker(self) -> None:
+        # Act
+        broker = create_broker("memory")
+
+        # Assert
+        self.assertIsInstance(broker, InMemoryBroker)
+
+    def test_createsPostgresBroker(self) -> None:
+        # Act
+        broker = create_broker("postgres")
+
+        # Assert
+        self.assertIsInstance(broker, PostgresBroker)
+        self.assertEqual(broker.channel, CHANNEL)
+
+    def test_raisesValueError_forUnknownBroker(self) -> None:
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            create_broker("unknown")
@@ -1,12 +1,29 @@
+import asyncio
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
+from uuid import uuid4
 
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
+from pydantic import BaseModel
 
 from forum_system_api.schemas.message import MessageResponse
-from forum_system_api.services.websocket_manager import WebSocketManager
-from tests.services.test_data import MESSAGE_1, VALID_USER_ID
+from forum_system_api.services.websocket_broker import (
+    BROADCAST_RECEIVER,
+    BROADCAST_RECEIVER_ID,
+    TOPIC_RECEIVER,
+    USER_RECEIVER,
+    Broker,
+)
+from forum_system_api.services.websocket_manager import (
+    PING_FRAME,
+    PONG_FRAME,
+    OutboundMessage,
+    WebSocketConnection,
+    WebSocketManager,
+)
+from tests.services.test_data import MESSAGE_1, VALID_USER_ID, VALID_USER_ID_2
+from tests.services.test_data_const import VALID_TOPIC_ID_1, VALID_TOPIC_ID_2
 
 
 class WebSocketManager_Should(IsolatedAsyncioTestCase):
@@ -16,48 +33,96 @@ class WebSocketManager_Should(IsolatedAsyncioTestCase):
         self.websocket = AsyncMock(spec=WebSocket)
         self.message = MessageResponse(**MESSAGE_1)
 
+    async def asyncTearDown(self) -> None:
+        for connections in list(self.manager._active_connections.values()):
+            for connection in list(connections.values()):
+                if connection.writer is not None:
+                    connection.writer.cancel()
+
+    async def _drain_queues(self) -> None:
+        for connection in self.manager.get_connections(self.user_id):
+            await connection.queue.join()
+
     async def test_connect_addsNewConnection(self) -> None:
         # Arrange & Act
-        await self.manager.connect(self.websocket, self.user_id)
+        connection = await self.manager.connect(self.websocket, self.user_id)
 
         # Assert
-        self.assertIn(self.user_id, self.manager._active_connections)
-        self.assertEqual(self.manager._active_connections[self.user_id], self.websocket)
+        self.assertEqual(connection.user_id, self.user_id)
+        self.assertEqual(connection.websocket, self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [connection])
 
-    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
-    async def test_connect_replacesExistingConnection(self, mock_disconnect) -> None:
+    async def test_connect_keepsExistingConnectionsOfUser(self) -> None:
         # Arrange
-        previous_websocket = AsyncMock(spec=WebSocket)
-        self.manager._active_connections[self.user_id] = previous_websocket
+        other_websocket = AsyncMock(spec=WebSocket)
+        first = await self.manager.connect(other_websocket, self.user_id)
 
         # Act
-        await self.manager.connect(self.websocket, self.user_id)
+        second = await self.manager.connect(self.websocket, self.user_id)
+
+        # Assert
+        self.assertNotEqual(first.id, second.id)
+        self.assertEqual(self.manager.get_connections(self.user_id), [first, second])
+        other_websocket.close.assert_not_awaited()
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_connect_closesOldestConnection_whenCapReached(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        manager = WebSocketManager(max_connections_per_user=2)
+        oldest = await manager.connect(AsyncMock(spec=WebSocket), self.user_id)
+        newer = await manager.connect(AsyncMock(spec=WebSocket), self.user_id)
+
+        # Act
+        newest = await manager.connect(self.websocket, self.user_id)
+        await asyncio.sleep(0)
+
+        # Assert
+        mock_close_connection.assert_awaited_once_with(oldest.websocket)
+        self.assertEqual(manager.get_connections(self.user_id), [newer, newest])
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_disconnect_removesOnlyThatConnection(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        connection = await self.manager.connect(self.websocket, self.user_id)
+        other = await self.manager.connect(AsyncMock(spec=WebSocket), self.user_id)
+
+        # Act
+        await self.manager.disconnect(connection)
 
         # Assert
-        mock_disconnect.assert_awaited_once_with(self.user_id)
-        self.assertEqual(self.websocket, self.manager._active_connections[self.user_id])
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [other])
 
     @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
-    async def test_disconnect_removesConnection(self, mock_close_connection) -> None:
+    async def test_disconnect_removesUser_whenLastConnectionCloses(
+        self, mock_close_connection
+    ) -> None:
         # Arrange
-        self.manager._active_connections[self.user_id] = self.websocket
+        connection = await self.manager.connect(self.websocket, self.user_id)
 
         # Act
-        await self.manager.disconnect(self.user_id)
+        await self.manager.disconnect(connection)
 
         # Assert
         mock_close_connection.assert_awaited_once_with(self.websocket)
         self.assertNotIn(self.user_id, self.manager._active_connections)
 
     @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
-    async def test_disconnect_doesNothingIfNoConnection(
+    async def test_disconnect_closesUnregisteredConnection(
         self, mock_close_connection
     ) -> None:
-        # Arrange & Act
-        await self.manager.disconnect(self.user_id)
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        await self.manager.disconnect(connection)
 
         # Assert
-        mock_close_connection.assert_awaited_once_with(None)
+        mock_close_connection.assert_awaited_once_with(self.websocket)
 
     async def test_closeConnection_closesConnectedWebSocket(self) -> None:
         # Arrange
@@ -116,58 +181,761 @@ class WebSocketManager_Should(IsolatedAsyncioTestCase):
 
     async def test_sendMessage_sendsMessage(self) -> None:
         # Arrange
-        self.manager._active_connections[self.user_id] = self.websocket
+        await self.manager.connect(self.websocket, self.user_id)
         self.websocket.application_state = WebSocketState.CONNECTED
         message = "Test message"
 
         # Act
         await self.manager.send_message(message, self.user_id)
+        await self._drain_queues()
 
         # Assert
         self.websocket.send_text.assert_awaited_once_with(message)
 
+    async def test_sendMessage_sendsToAllConnectionsOfUser(self) -> None:
+        # Arrange
+        other_websocket = AsyncMock(spec=WebSocket)
+        for websocket in (self.websocket, other_websocket):
+            websocket.application_state = WebSocketState.CONNECTED
+            await self.manager.connect(websocket, self.user_id)
+        message = "Test message"
+
+        # Act
+        await self.manager.send_message(message, self.user_id)
+        await self._drain_queues()
+
+        # Assert
+        self.websocket.send_text.assert_awaited_once_with(message)
+        other_websocket.send_text.assert_awaited_once_with(message)
+
     async def test_sendMessage_doesNothingIfNotConnected(self) -> None:
         # Arrange
-        self.manager._active_connections[self.user_id] = self.websocket
+        await self.manager.connect(self.websocket, self.user_id)
         self.websocket.application_state = WebSocketState.DISCONNECTED
         message = "Test message"
 
         # Act
         await self.manager.send_message(message, self.user_id)
+        await self._drain_queues()
 
         # Assert
         self.websocket.send_text.assert_not_awaited()
 
-    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
-    async def test_sendMessage_handlesRuntimeError(self, mock_disconnect) -> None:
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_sendMessage_handlesRuntimeError(self, mock_close_connection) -> None:
         # Arrange
-        self.manager._active_connections[self.user_id] = self.websocket
         self.websocket.application_state = WebSocketState.CONNECTED
         self.websocket.send_text.side_effect = RuntimeError(
             "WebSocket is already closed"
         )
+        await self.manager.connect(self.websocket, self.user_id)
         message = "Test message"
 
         # Act
         await self.manager.send_message(message, self.user_id)
+        await self._drain_queues()
+        await asyncio.sleep(0)
 
         # Assert
         self.websocket.send_text.assert_awaited_once()
-        mock_disconnect.assert_awaited_once_with(self.user_id)
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [])
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_sendMessage_handlesWebSocketDisconnect(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        self.websocket.application_state = WebSocketState.CONNECTED
+        self.websocket.send_text.side_effect = WebSocketDisconnect(code=1006)
+        connection = await self.manager.connect(self.websocket, self.user_id)
+
+        # Act
+        await self.manager.send_message("Test message", self.user_id)
+        await asyncio.wait_for(connection.writer, timeout=1)
+        await asyncio.sleep(0)
+
+        # Assert
+        self.assertTrue(connection.closed)
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [])
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_write_removesConnection_whenWriterFails(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        self.websocket.application_state = WebSocketState.CONNECTED
+        self.websocket.send_text.side_effect = ValueError("Unexpected error")
+        connection = await self.manager.connect(self.websocket, self.user_id)
+
+        # Act
+        await self.manager.send_message("Test message", self.user_id)
+        with self.assertRaises(ValueError):
+            await asyncio.wait_for(connection.writer, timeout=1)
+        await asyncio.sleep(0)
 
-    @patch.object(WebSocketManager, "disconnect", new_callable=AsyncMock)
-    async def test_sendMessage_handlesConnectionError(self, mock_disconnect) -> None:
+        # Assert
+        self.assertTrue(connection.closed)
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [])
+
+    async def test_sendMessage_disconnectsOnlyFailedConnection(self) -> None:
         # Arrange
-        self.manager._active_connections[self.user_id] = self.websocket
+        healthy_websocket = AsyncMock(spec=WebSocket)
+        healthy_websocket.application_state = WebSocketState.CONNECTED
         self.websocket.application_state = WebSocketState.CONNECTED
         self.websocket.send_text.side_effect = ConnectionError(
             "WebSocket connection error"
         )
+        await self.manager.connect(self.websocket, self.user_id)
+        healthy = await self.manager.connect(healthy_websocket, self.user_id)
         message = "Test message"
 
         # Act
         await self.manager.send_message(message, self.user_id)
+        await self._drain_queues()
 
         # Assert
-        self.websocket.send_text.assert_awaited_once()
-        mock_disconnect.assert_awaited_once_with(self.user_id)
+        healthy_websocket.send_text.assert_awaited_once_with(message)
+        self.assertEqual(self.manager.get_connections(self.user_id), [healthy])
+
+    async def test_sendMessage_publishesThroughBroker(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker)
+
+        # Act
+        await manager.send_message("Test message", self.user_id)
+
+        # Assert
+        broker.subscribe.assert_called_once_with(manager._deliver)
+        broker.publish.assert_awaited_once_with(
+            receiver_id=self.user_id, message="Test message"
+        )
+
+    async def test_sendTopicEvent_publishesThroughBroker(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker)
+
+        # Act
+        await manager.send_topic_event(self.message, VALID_TOPIC_ID_1)
+
+        # Assert
+        broker.publish.assert_awaited_once_with(
+            receiver_id=VALID_TOPIC_ID_1,
+            message=self.message.model_dump_json(),
+            receiver_type=TOPIC_RECEIVER,
+            coalesce_key=None,
+        )
+
+    async def test_startAndStop_delegateToBroker(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker)
+
+        # Act
+        await manager.start()
+        await manager.stop()
+
+        # Assert
+        broker.start.assert_awaited_once()
+        broker.stop.assert_awaited_once()
+
+    async def test_sendMessage_doesNotWaitForSlowConnection(self) -> None:
+        # Arrange
+        sending = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_send_text(message: str) -> None:
+            sending.set()
+            await release.wait()
+
+        self.websocket.application_state = WebSocketState.CONNECTED
+        self.websocket.send_text.side_effect = slow_send_text
+        await self.manager.connect(self.websocket, self.user_id)
+        await self.manager.send_message("First", self.user_id)
+        await sending.wait()
+
+        # Act
+        await asyncio.wait_for(
+            self.manager.send_message("Second", self.user_id), timeout=1
+        )
+
+        # Assert
+        self.assertEqual(self.manager.get_stats().queued_messages, 1)
+        release.set()
+        await self._drain_queues()
+        self.assertEqual(self.websocket.send_text.await_count, 2)
+
+    async def test_sendMessage_dropsOldestMessage_whenQueueFull(self) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=2, overflow_policy="drop_oldest")
+        connection = WebSocketConnection(
+            user_id=self.user_id,
+            websocket=self.websocket,
+            queue=asyncio.Queue(maxsize=2),
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+
+        # Act
+        for message in ("First", "Second", "Third"):
+            await manager.send_message(message, self.user_id)
+
+        # Assert
+        self.assertEqual(
+            [connection.queue.get_nowait().message for _ in range(2)],
+            ["Second", "Third"],
+        )
+        self.assertEqual(manager.get_stats().dropped_messages, 1)
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_sendMessage_disconnects_whenQueueFullAndPolicyIsDisconnect(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=1, overflow_policy="disconnect")
+        connection = WebSocketConnection(
+            user_id=self.user_id,
+            websocket=self.websocket,
+            queue=asyncio.Queue(maxsize=1),
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+
+        # Act
+        await manager.send_message("First", self.user_id)
+        await manager.send_message("Second", self.user_id)
+        await asyncio.gather(*manager._closing)
+
+        # Assert
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertTrue(connection.closed)
+        self.assertEqual(manager.get_connections(self.user_id), [])
+        self.assertEqual(manager.get_stats().overflow_disconnects, 1)
+
+    async def test_sendMessage_doesNotWaitForClose_whenQueueFullAndPolicyIsDisconnect(
+        self,
+    ) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=1, overflow_policy="disconnect")
+        release = asyncio.Event()
+        self.websocket.application_state = WebSocketState.CONNECTED
+        self.websocket.close.side_effect = lambda *args, **kwargs: release.wait()
+        connection = WebSocketConnection(
+            user_id=self.user_id,
+            websocket=self.websocket,
+            queue=asyncio.Queue(maxsize=1),
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+
+        # Act
+        await manager.send_message("First", self.user_id)
+        await asyncio.wait_for(manager.send_message("Second", self.user_id), 1)
+        await manager.send_message("Third", self.user_id)
+
+        # Assert
+        self.assertTrue(connection.closed)
+        self.assertEqual(manager.get_stats().overflow_disconnects, 1)
+        self.assertEqual(connection.queue.get_nowait().message, "First")
+        release.set()
+        await asyncio.gather(*manager._closing)
+        self.websocket.close.assert_awaited_once()
+
+    async def test_getStats_reportsQueueDepths(self) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=10)
+        for depth in (1, 3):
+            connection = WebSocketConnection(
+                user_id=self.user_id, websocket=AsyncMock(spec=WebSocket)
+            )
+            for _ in range(depth):
+                connection.queue.put_nowait("message")
+            manager._active_connections.setdefault(self.user_id, {})[
+                connection.id
+            ] = connection
+
+        # Act
+        stats = manager.get_stats()
+
+        # Assert
+        self.assertEqual(stats.users, 1)
+        self.assertEqual(stats.connections, 2)
+        self.assertEqual(stats.queue_size, 10)
+        self.assertEqual(stats.queued_messages, 4)
+        self.assertEqual(stats.max_queue_depth, 3)
+
+    def test_init_raisesValueError_forUnknownOverflowPolicy(self) -> None:
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            WebSocketManager(overflow_policy="unknown")
+
+    async def test_handleMessage_updatesLastSeenAt(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(
+            user_id=self.user_id, websocket=self.websocket, last_seen_at=0.0
+        )
+
+        # Act
+        await self.manager.handle_message(connection, PONG_FRAME)
+
+        # Assert
+        self.assertGreater(connection.last_seen_at, 0.0)
+        self.assertTrue(connection.queue.empty())
+
+    async def test_handleMessage_answersPingWithPong(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        await self.manager.handle_message(connection, PING_FRAME)
+
+        # Assert
+        self.assertEqual(connection.queue.get_nowait().message, PONG_FRAME)
+
+    async def test_handleMessage_skipsPong_whenQueueFull(self) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=1, overflow_policy="disconnect")
+        connection = WebSocketConnection(
+            user_id=self.user_id,
+            websocket=self.websocket,
+            queue=asyncio.Queue(maxsize=1),
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+        await manager.send_message("First", self.user_id)
+
+        # Act
+        await manager.handle_message(connection, PING_FRAME)
+
+        # Assert
+        self.assertEqual(connection.queue.get_nowait().message, "First")
+        self.assertFalse(connection.closed)
+        self.assertEqual(manager.get_stats().overflow_disconnects, 0)
+
+    async def test_handleMessage_ignoresInvalidJson(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        result = await self.manager.handle_message(connection, "not json")
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertTrue(connection.queue.empty())
+
+    async def test_handleMessage_returnsUnhandledFrames(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        frame = await self.manager.handle_message(
+            connection, '{"type": "subscribe", "topic_id": "1"}'
+        )
+
+        # Assert
+        self.assertEqual(frame, {"type": "subscribe", "topic_id": "1"})
+        self.assertTrue(connection.queue.empty())
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_reapConnections_closesIdleConnections_andPingsOthers(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        manager = WebSocketManager(idle_timeout_seconds=60)
+        idle_websocket = AsyncMock(spec=WebSocket)
+        idle_websocket.application_state = WebSocketState.CONNECTED
+        idle = WebSocketConnection(
+            user_id=self.user_id, websocket=idle_websocket, last_seen_at=0.0
+        )
+        self.websocket.application_state = WebSocketState.CONNECTED
+        live = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        manager._active_connections[self.user_id] = {
+            idle.id: idle,
+            live.id: live,
+        }
+
+        # Act
+        reaped = await manager.reap_connections()
+        await asyncio.sleep(0)
+
+        # Assert
+        self.assertEqual(reaped, 1)
+        mock_close_connection.assert_awaited_once_with(idle_websocket)
+        self.assertEqual(manager.get_connections(self.user_id), [live])
+        self.assertEqual(live.queue.get_nowait().message, PING_FRAME)
+        self.assertEqual(manager.get_stats().idle_disconnects, 1)
+
+    async def test_reapConnections_keepsSilentConnections_withoutIdleTimeout(
+        self,
+    ) -> None:
+        # Arrange
+        manager = WebSocketManager(idle_timeout_seconds=0)
+        self.websocket.application_state = WebSocketState.CONNECTED
+        connection = WebSocketConnection(
+            user_id=self.user_id, websocket=self.websocket, last_seen_at=0.0
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+
+        # Act
+        reaped = await manager.reap_connections()
+
+        # Assert
+        self.assertEqual(reaped, 0)
+        self.assertEqual(manager.get_connections(self.user_id), [connection])
+        self.assertTrue(connection.queue.empty())
+
+    async def test_reapConnections_doesNotPing_whenMessagesAreQueued(self) -> None:
+        # Arrange
+        manager = WebSocketManager(send_queue_size=1, idle_timeout_seconds=60)
+        self.websocket.application_state = WebSocketState.CONNECTED
+        connection = WebSocketConnection(
+            user_id=self.user_id,
+            websocket=self.websocket,
+            queue=asyncio.Queue(maxsize=1),
+        )
+        manager._active_connections[self.user_id] = {connection.id: connection}
+        await manager.send_message("First", self.user_id)
+
+        # Act
+        await manager.reap_connections()
+
+        # Assert
+        self.assertEqual(connection.queue.get_nowait().message, "First")
+        self.assertEqual(manager.get_stats().dropped_messages, 0)
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_reapConnections_closesDeadConnections(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        self.websocket.application_state = WebSocketState.DISCONNECTED
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        self.manager._active_connections[self.user_id] = {connection.id: connection}
+
+        # Act
+        reaped = await self.manager.reap_connections()
+        await asyncio.sleep(0)
+
+        # Assert
+        self.assertEqual(reaped, 1)
+        mock_close_connection.assert_awaited_once_with(self.websocket)
+        self.assertEqual(self.manager.get_connections(self.user_id), [])
+
+    async def test_reapConnections_doesNotWaitForClose(self) -> None:
+        # Arrange
+        closing = asyncio.Event()
+        self.websocket.application_state = WebSocketState.DISCONNECTED
+        dead = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        self.manager._active_connections[self.user_id] = {dead.id: dead}
+
+        # Act
+        with patch.object(
+            WebSocketManager, "close_connection", side_effect=lambda _: closing.wait()
+        ):
+            reaped = await asyncio.wait_for(self.manager.reap_connections(), timeout=1)
+            closing.set()
+            await asyncio.sleep(0)
+
+        # Assert
+        self.assertEqual(reaped, 1)
+        self.assertEqual(self.manager.get_connections(self.user_id), [])
+
+    @patch.object(WebSocketManager, "reap_connections", new_callable=AsyncMock)
+    async def test_start_runsReaperUntilStopped(self, mock_reap_connections) -> None:
+        # Arrange
+        manager = WebSocketManager(heartbeat_interval_seconds=0.01)
+
+        # Act
+        await manager.start()
+        await asyncio.sleep(0.05)
+        await manager.stop()
+        reaps = mock_reap_connections.await_count
+        await asyncio.sleep(0.03)
+
+        # Assert
+        self.assertGreater(reaps, 0)
+        self.assertEqual(mock_reap_connections.await_count, reaps)
+
+    async def test_subscribe_addsConnectionToTopic(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        subscribed = self.manager.subscribe(connection, VALID_TOPIC_ID_1)
+
+        # Assert
+        self.assertTrue(subscribed)
+        self.assertEqual(connection.topics, {VALID_TOPIC_ID_1})
+        self.assertEqual(self.manager.get_subscribers(VALID_TOPIC_ID_1), [connection])
+        self.assertEqual(self.manager.get_stats().subscribed_topics, 1)
+
+    async def test_subscribe_returnsFalse_whenSubscriptionCapReached(self) -> None:
+        # Arrange
+        manager = WebSocketManager(max_topic_subscriptions=1)
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        manager.subscribe(connection, VALID_TOPIC_ID_1)
+
+        # Act
+        subscribed = manager.subscribe(connection, VALID_TOPIC_ID_2)
+
+        # Assert
+        self.assertFalse(subscribed)
+        self.assertEqual(connection.topics, {VALID_TOPIC_ID_1})
+        self.assertEqual(manager.get_subscribers(VALID_TOPIC_ID_2), [])
+
+    async def test_unsubscribe_removesTopic_whenLastSubscriberLeaves(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        self.manager.subscribe(connection, VALID_TOPIC_ID_1)
+
+        # Act
+        self.manager.unsubscribe(connection, VALID_TOPIC_ID_1)
+
+        # Assert
+        self.assertEqual(connection.topics, set())
+        self.assertEqual(self.manager.get_subscribers(VALID_TOPIC_ID_1), [])
+        self.assertEqual(self.manager.get_stats().subscribed_topics, 0)
+
+    @patch.object(WebSocketManager, "close_connection", new_callable=AsyncMock)
+    async def test_disconnect_removesTopicSubscriptions(
+        self, mock_close_connection
+    ) -> None:
+        # Arrange
+        connection = await self.manager.connect(self.websocket, self.user_id)
+        self.manager.subscribe(connection, VALID_TOPIC_ID_1)
+        self.manager.subscribe(connection, VALID_TOPIC_ID_2)
+
+        # Act
+        await self.manager.disconnect(connection)
+
+        # Assert
+        self.assertEqual(self.manager.get_subscribers(VALID_TOPIC_ID_1), [])
+        self.assertEqual(self.manager.get_subscribers(VALID_TOPIC_ID_2), [])
+
+    async def test_sendTopicEvent_queuesOnSubscribedConnectionsOnly(self) -> None:
+        # Arrange
+        subscriber = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        other = WebSocketConnection(
+            user_id=self.user_id, websocket=AsyncMock(spec=WebSocket)
+        )
+        self.manager._active_connections[self.user_id] = {
+            subscriber.id: subscriber,
+            other.id: other,
+        }
+        self.manager.subscribe(subscriber, VALID_TOPIC_ID_1)
+
+        # Act
+        await self.manager.send_topic_event(self.message, VALID_TOPIC_ID_1)
+
+        # Assert
+        self.assertEqual(
+            subscriber.queue.get_nowait().message, self.message.model_dump_json()
+        )
+        self.assertTrue(other.queue.empty())
+
+    async def test_deliver_queuesTopicEventsOnlyOnReaders_whenAccessCheckIsSet(
+        self,
+    ) -> None:
+        # Arrange
+        reader = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        revoked = WebSocketConnection(
+            user_id=VALID_USER_ID_2, websocket=AsyncMock(spec=WebSocket)
+        )
+        for connection in (reader, revoked):
+            self.manager.subscribe(connection, VALID_TOPIC_ID_1)
+        check = AsyncMock(return_value=[reader])
+        self.manager.set_topic_access_check(check)
+
+        # Act
+        await self.manager._deliver(TOPIC_RECEIVER, VALID_TOPIC_ID_1, "Event")
+
+        # Assert
+        check.assert_awaited_once_with(VALID_TOPIC_ID_1, [reader, revoked])
+        self.assertEqual(reader.queue.get_nowait().message, "Event")
+        self.assertTrue(revoked.queue.empty())
+
+    async def test_deliver_queuesUserMessagesOnUserConnections(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        self.manager._active_connections[self.user_id] = {connection.id: connection}
+        self.manager.subscribe(connection, self.user_id)
+
+        # Act
+        await self.manager._deliver(USER_RECEIVER, self.user_id, "Test message")
+
+        # Assert
+        self.assertEqual(connection.queue.qsize(), 1)
+
+    async def test_sendToConnection_queuesJsonOnConnection(self) -> None:
+        # Arrange
+        connection = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+
+        # Act
+        await self.manager.send_to_connection(connection, self.message)
+
+        # Assert
+        self.assertEqual(
+            connection.queue.get_nowait().message, self.message.model_dump_json()
+        )
+
+    async def test_write_sendsMessagesQueuedWithinWindowAsOneFrame(self) -> None:
+        # Arrange
+        manager = WebSocketManager(batch_window_seconds=0.01)
+        self.websocket.application_state = WebSocketState.CONNECTED
+        connection = await manager.connect(self.websocket, self.user_id)
+
+        # Act
+        await manager.send_message('{"n": 1}', self.user_id)
+        await manager.send_message('{"n": 2}', self.user_id)
+        await connection.queue.join()
+        connection.writer.cancel()
+
+        # Assert
+        self.websocket.send_text.assert_awaited_once_with('[{"n": 1},{"n": 2}]')
+
+    async def test_write_sendsPingInItsOwnFrame(self) -> None:
+        # Arrange
+        manager = WebSocketManager(batch_window_seconds=0.01, idle_timeout_seconds=60)
+        self.websocket.application_state = WebSocketState.CONNECTED
+        connection = await manager.connect(self.websocket, self.user_id)
+
+        # Act
+        await manager.reap_connections()
+        await manager.send_message('{"n": 1}', self.user_id)
+        await manager.send_message('{"n": 2}', self.user_id)
+        await connection.queue.join()
+        connection.writer.cancel()
+
+        # Assert
+        self.assertEqual(
+            self.websocket.send_text.await_args_list,
+            [call(PING_FRAME), call('[{"n": 1},{"n": 2}]')],
+        )
+
+    async def test_write_sendsOnlyLatestVoteCounts_whenSuperseded(self) -> None:
+        # Arrange
+        manager = WebSocketManager(batch_window_seconds=0.01)
+        self.websocket.application_state = WebSocketState.CONNECTED
+        connection = await manager.connect(self.websocket, self.user_id)
+        manager.subscribe(connection, VALID_TOPIC_ID_1)
+
+        # Act
+        for upvotes in (1, 2, 3):
+            await manager._deliver(
+                TOPIC_RECEIVER,
+                VALID_TOPIC_ID_1,
+                f'{{"upvotes": {upvotes}}}',
+                "reply_voted:1",
+            )
+        await manager._deliver(TOPIC_RECEIVER, VALID_TOPIC_ID_1, '{"other": 1}')
+        await connection.queue.join()
+        connection.writer.cancel()
+
+        # Assert
+        self.websocket.send_text.assert_awaited_once_with(
+            '[{"upvotes": 3},{"other": 1}]'
+        )
+        self.assertEqual(manager.get_stats().coalesced_messages, 2)
+
+    def test_encodeBatch_returnsLoneMessageAsIs(self) -> None:
+        # Act
+        frame = self.manager._encode_batch([OutboundMessage(message='{"n": 1}')])
+
+        # Assert
+        self.assertEqual(frame, '{"n": 1}')
+
+    def test_encodeBatch_keepsLatestMessagePerCoalesceKeyInOrder(self) -> None:
+        # Arrange
+        batch = [
+            OutboundMessage(message='{"a": 1}', coalesce_key="a"),
+            OutboundMessage(message='{"b": 1}', coalesce_key="b"),
+            OutboundMessage(message='{"n": 1}'),
+            OutboundMessage(message='{"a": 2}', coalesce_key="a"),
+        ]
+
+        # Act
+        frame = self.manager._encode_batch(batch)
+
+        # Assert
+        self.assertEqual(frame, '[{"b": 1},{"n": 1},{"a": 2}]')
+        self.assertEqual(self.manager.get_stats().coalesced_messages, 1)
+
+    async def test_broadcast_serializesOnce_andPublishesToEachReceiver(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker)
+        message = MagicMock(spec=BaseModel)
+        message.model_dump_json.return_value = '{"type": "announcement"}'
+
+        # Act
+        await manager.broadcast(message, [self.user_id, VALID_USER_ID_2, self.user_id])
+
+        # Assert
+        message.model_dump_json.assert_called_once()
+        broker.publish.assert_has_awaits(
+            [
+                call(receiver_id=self.user_id, message='{"type": "announcement"}'),
+                call(receiver_id=VALID_USER_ID_2, message='{"type": "announcement"}'),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(broker.publish.await_count, 2)
+
+    async def test_broadcast_boundsConcurrentPublishes(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker, broadcast_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_publish(**kwargs) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        broker.publish.side_effect = slow_publish
+        receiver_ids = [uuid4() for _ in range(5)]
+
+        # Act
+        await manager.broadcast(self.message, receiver_ids)
+
+        # Assert
+        self.assertEqual(broker.publish.await_count, 5)
+        self.assertEqual(max_in_flight, 2)
+
+    async def test_broadcast_publishesOnce_whenSendingToAllUsers(self) -> None:
+        # Arrange
+        broker = MagicMock(spec=Broker)
+        manager = WebSocketManager(broker=broker)
+
+        # Act
+        await manager.broadcast(self.message)
+
+        # Assert
+        broker.publish.assert_awaited_once_with(
+            receiver_id=BROADCAST_RECEIVER_ID,
+            message=self.message.model_dump_json(),
+            receiver_type=BROADCAST_RECEIVER,
+        )
+
+    async def test_deliver_queuesBroadcastOnEveryConnection(self) -> None:
+        # Arrange
+        first = WebSocketConnection(user_id=self.user_id, websocket=self.websocket)
+        second = WebSocketConnection(
+            user_id=VALID_USER_ID_2, websocket=AsyncMock(spec=WebSocket)
+        )
+        self.manager._active_connections = {
+            self.user_id: {first.id: first},
+            VALID_USER_ID_2: {second.id: second},
+        }
+
+        # Act
+        await self.manager._deliver(
+            BROADCAST_RECEIVER, BROADCAST_RECEIVER_ID, "Announcement"
+        )
+
+        # Assert
+        self.assertEqual(first.queue.get_nowait().message, "Announcement")
+        self.assertEqual(second.queue.get_nowait().message, "Announcement")